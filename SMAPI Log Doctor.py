@@ -2,10 +2,15 @@ import re
 import os
 import sys
 import json
+import string
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 
 # =========================
@@ -18,6 +23,16 @@ TEXT = {
         "app_title": "SMAPI Log Doctor",
         "btn_open": "Open SMAPI Log",
         "btn_export": "Export Summary",
+        "btn_mods_dir": "Mods Folder…",
+        "btn_recent": "Recent Logs…",
+        "btn_open_newest": "Open Newest",
+        "dialog_recent_title": "Recent SMAPI logs",
+        "recent_col_file": "File",
+        "recent_col_modified": "Modified",
+        "recent_btn_open": "Open",
+        "recent_none": "No SMAPI logs indexed yet. Run the game with SMAPI or open a log first.",
+        "status_indexing": "Indexing logs in {path}…",
+        "status_indexed": "Indexed logs in {path}: {count} log(s) available.",
         "status_ready": "Ready. Open a SMAPI log to analyze.",
         "status_loaded": "Loaded log: {path}",
         "status_no_analysis": "No analysis yet. Open a log first.",
@@ -26,6 +41,7 @@ TEXT = {
         "label_language": "Language:",
         "dialog_select_log_title": "Select SMAPI log",
         "dialog_export_title": "Export summary",
+        "dialog_select_mods_title": "Select your Stardew Valley Mods folder",
         "dialog_error_title": "Error",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Failed to read file:\n{error}",
@@ -39,6 +55,7 @@ TEXT = {
         "tab_errors": "Errors",
         "tab_warnings": "Warnings",
         "tab_suggestions": "Suggestions",
+        "tab_timeline": "Timeline",
         "tab_raw": "Raw Log",
 
         # overview
@@ -61,9 +78,18 @@ TEXT = {
         "mod_health_console_header": "Mods with direct console access:",
         "mod_health_missing_dep_header": "Mods with missing dependencies:",
         "mod_health_missing_dep_item": "{mod} → missing: {missing}",
+        "mod_health_fallout_header": "Missing dependencies and every mod they take down:",
+        "mod_health_fallout_item": "{missing}: {count} mod(s) will be skipped",
+        "mod_health_fallout_direct": "requires it: {mods}",
+        "mod_health_fallout_transitive": "skipped in turn: {mods}",
         "mod_health_none": "No risky mods detected in this log.",
         "mod_health_updates_header": "Mods with updates available:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} major version(s) behind",
+        "mod_health_update_lag_minor": "{count} minor version(s) behind",
+        "mod_health_update_lag_patch": "{count} patch(es) behind",
+        "mod_health_update_lag_unknown": "versions can't be compared",
+        "mod_health_update_catalog": "local catalog",
 
         # errors
         "errors_header": "Errors found in this log",
@@ -79,6 +105,13 @@ TEXT = {
         "suggestions_header": "Suggested fixes",
         "suggestions_none": "No automatic suggestions. If the game still misbehaves, check Errors/Warn tabs.",
 
+        # timeline
+        "timeline_header": "Errors & warnings over time",
+        "timeline_none": "No timestamped ERROR/WARN lines in this log.",
+        "timeline_range_seconds": "{start} – {end}, one bar per second",
+        "timeline_range_minutes": "{start} – {end}, one bar per minute",
+        "timeline_peak": "Busiest moment: {time} ({errors} errors, {warnings} warnings)",
+
         # raw
         "raw_header": "Full SMAPI Log",
 
@@ -100,6 +133,16 @@ TEXT = {
         "app_title": "SMAPI 日志小医生",
         "btn_open": "打开 SMAPI 日志",
         "btn_export": "导出概览报告",
+        "btn_mods_dir": "模组文件夹…",
+        "btn_recent": "最近日志…",
+        "btn_open_newest": "打开最新日志",
+        "dialog_recent_title": "最近的 SMAPI 日志",
+        "recent_col_file": "文件",
+        "recent_col_modified": "修改时间",
+        "recent_btn_open": "打开",
+        "recent_none": "尚未索引到 SMAPI 日志。请先用 SMAPI 启动游戏或手动打开一个日志。",
+        "status_indexing": "正在索引 {path} 中的日志…",
+        "status_indexed": "已索引 {path} 中的日志：共 {count} 个可用。",
         "status_ready": "就绪。先打开一份 SMAPI 日志再分析。",
         "status_loaded": "已加载日志：{path}",
         "status_no_analysis": "还没有分析结果，请先打开一份日志。",
@@ -108,6 +151,7 @@ TEXT = {
         "label_language": "语言：",
         "dialog_select_log_title": "选择 SMAPI 日志",
         "dialog_export_title": "导出概览",
+        "dialog_select_mods_title": "选择星露谷物语的 Mods 文件夹",
         "dialog_error_title": "错误",
         "dialog_info_title": "提示",
         "dialog_read_fail": "读取文件失败：\n{error}",
@@ -121,6 +165,7 @@ TEXT = {
         "tab_errors": "错误",
         "tab_warnings": "警告",
         "tab_suggestions": "解决方案",
+        "tab_timeline": "时间线",
         "tab_raw": "原始日志",
 
         # overview
@@ -143,9 +188,18 @@ TEXT = {
         "mod_health_console_header": "直接读写控制台的模组：",
         "mod_health_missing_dep_header": "缺少前置依赖的模组：",
         "mod_health_missing_dep_item": "{mod} → 缺少：{missing}",
+        "mod_health_fallout_header": "缺失的前置及其连带影响的所有模组：",
+        "mod_health_fallout_item": "{missing}：将有 {count} 个模组被跳过",
+        "mod_health_fallout_direct": "直接依赖：{mods}",
+        "mod_health_fallout_transitive": "连带跳过：{mods}",
         "mod_health_none": "本次日志中没有检测到明显高风险模组。",
         "mod_health_updates_header": "有可用更新的模组：",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "落后 {count} 个主版本",
+        "mod_health_update_lag_minor": "落后 {count} 个次版本",
+        "mod_health_update_lag_patch": "落后 {count} 个补丁版本",
+        "mod_health_update_lag_unknown": "无法比较版本",
+        "mod_health_update_catalog": "本地更新目录",
 
         # errors
         "errors_header": "本日志中发现的错误",
@@ -161,6 +215,13 @@ TEXT = {
         "suggestions_header": "推荐解决方案",
         "suggestions_none": "暂时没有自动建议。如果游戏仍有问题，请优先查看“错误”和“警告”标签页。",
 
+        # timeline
+        "timeline_header": "错误与警告随时间的分布",
+        "timeline_none": "此日志中没有带时间戳的 ERROR/WARN 行。",
+        "timeline_range_seconds": "{start} – {end}，每根柱代表 1 秒",
+        "timeline_range_minutes": "{start} – {end}，每根柱代表 1 分钟",
+        "timeline_peak": "最密集时刻：{time}（{errors} 个错误，{warnings} 个警告）",
+
         # raw
         "raw_header": "完整 SMAPI 日志",
 
@@ -182,6 +243,16 @@ TEXT = {
         "app_title": "Доктор логов SMAPI",
         "btn_open": "Открыть лог SMAPI",
         "btn_export": "Экспортировать сводку",
+        "btn_mods_dir": "Папка Mods…",
+        "btn_recent": "Недавние логи…",
+        "btn_open_newest": "Открыть последний",
+        "dialog_recent_title": "Недавние логи SMAPI",
+        "recent_col_file": "Файл",
+        "recent_col_modified": "Изменён",
+        "recent_btn_open": "Открыть",
+        "recent_none": "Логи SMAPI ещё не проиндексированы. Запустите игру через SMAPI или откройте лог вручную.",
+        "status_indexing": "Индексация логов в {path}…",
+        "status_indexed": "Логи в {path} проиндексированы: доступно {count}.",
         "status_ready": "Готово. Сначала откройте лог SMAPI для анализа.",
         "status_loaded": "Лог загружен: {path}",
         "status_no_analysis": "Анализа ещё нет. Сначала откройте лог.",
@@ -190,6 +261,7 @@ TEXT = {
         "label_language": "Язык:",
         "dialog_select_log_title": "Выберите лог SMAPI",
         "dialog_export_title": "Экспорт сводки",
+        "dialog_select_mods_title": "Выберите папку Mods Stardew Valley",
         "dialog_error_title": "Ошибка",
         "dialog_info_title": "Информация",
         "dialog_read_fail": "Не удалось прочитать файл:\n{error}",
@@ -203,6 +275,7 @@ TEXT = {
         "tab_errors": "Ошибки",
         "tab_warnings": "Предупреждения",
         "tab_suggestions": "Решения",
+        "tab_timeline": "Хронология",
         "tab_raw": "Исходный лог",
 
         # overview
@@ -225,9 +298,18 @@ TEXT = {
         "mod_health_console_header": "Моды с прямым доступом к консоли:",
         "mod_health_missing_dep_header": "Моды с отсутствующими зависимостями:",
         "mod_health_missing_dep_item": "{mod} → отсутствует: {missing}",
+        "mod_health_fallout_header": "Отсутствующие зависимости и все моды, которые из-за них не загрузятся:",
+        "mod_health_fallout_item": "{missing}: будет пропущено модов: {count}",
+        "mod_health_fallout_direct": "требуют напрямую: {mods}",
+        "mod_health_fallout_transitive": "пропущены по цепочке: {mods}",
         "mod_health_none": "В этом логе не обнаружено явно рискованных модов.",
         "mod_health_updates_header": "Моды с доступными обновлениями:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "отстаёт на {count} мажорн. верс.",
+        "mod_health_update_lag_minor": "отстаёт на {count} минорн. верс.",
+        "mod_health_update_lag_patch": "отстаёт на {count} патч(ей)",
+        "mod_health_update_lag_unknown": "версии нельзя сравнить",
+        "mod_health_update_catalog": "локальный каталог",
 
         # errors
         "errors_header": "Ошибки в этом логе",
@@ -243,6 +325,13 @@ TEXT = {
         "suggestions_header": "Рекомендуемые действия",
         "suggestions_none": "Автоматических рекомендаций нет. Если игра по-прежнему ведёт себя странно, загляните на вкладки «Ошибки» и «Предупреждения».",
 
+        # timeline
+        "timeline_header": "Ошибки и предупреждения во времени",
+        "timeline_none": "В этом логе нет строк ERROR/WARN с отметкой времени.",
+        "timeline_range_seconds": "{start} – {end}, один столбец на секунду",
+        "timeline_range_minutes": "{start} – {end}, один столбец на минуту",
+        "timeline_peak": "Пиковый момент: {time} (ошибок: {errors}, предупреждений: {warnings})",
+
         # raw
         "raw_header": "Полный лог SMAPI",
 
@@ -264,6 +353,16 @@ TEXT = {
         "app_title": "Doutor de Logs do SMAPI",
         "btn_open": "Abrir log do SMAPI",
         "btn_export": "Exportar resumo",
+        "btn_mods_dir": "Pasta Mods…",
+        "btn_recent": "Registos recentes…",
+        "btn_open_newest": "Abrir o mais recente",
+        "dialog_recent_title": "Registos SMAPI recentes",
+        "recent_col_file": "Ficheiro",
+        "recent_col_modified": "Modificado",
+        "recent_btn_open": "Abrir",
+        "recent_none": "Ainda não há registos SMAPI indexados. Inicia o jogo com SMAPI ou abre um registo primeiro.",
+        "status_indexing": "A indexar registos em {path}…",
+        "status_indexed": "Registos indexados em {path}: {count} disponível(is).",
         "status_ready": "Pronto. Abra um log do SMAPI para analisar.",
         "status_loaded": "Log carregado: {path}",
         "status_no_analysis": "Ainda não há análise. Abra um log primeiro.",
@@ -272,6 +371,7 @@ TEXT = {
         "label_language": "Idioma:",
         "dialog_select_log_title": "Selecionar log do SMAPI",
         "dialog_export_title": "Exportar resumo",
+        "dialog_select_mods_title": "Selecione a pasta Mods do Stardew Valley",
         "dialog_error_title": "Erro",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Falha ao ler o arquivo:\n{error}",
@@ -285,6 +385,7 @@ TEXT = {
         "tab_errors": "Erros",
         "tab_warnings": "Avisos",
         "tab_suggestions": "Sugestões",
+        "tab_timeline": "Cronologia",
         "tab_raw": "Log bruto",
 
         # overview
@@ -307,9 +408,18 @@ TEXT = {
         "mod_health_console_header": "Mods com acesso direto ao console:",
         "mod_health_missing_dep_header": "Mods com dependências ausentes:",
         "mod_health_missing_dep_item": "{mod} → faltando: {missing}",
+        "mod_health_fallout_header": "Dependências em falta e todos os mods afetados por elas:",
+        "mod_health_fallout_item": "{missing}: {count} mod(s) serão ignorados",
+        "mod_health_fallout_direct": "requerem diretamente: {mods}",
+        "mod_health_fallout_transitive": "ignorados em cadeia: {mods}",
         "mod_health_none": "Nenhum mod claramente arriscado foi detectado neste log.",
         "mod_health_updates_header": "Mods com atualizações disponíveis:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} versão(ões) principal(is) atrás",
+        "mod_health_update_lag_minor": "{count} versão(ões) secundária(s) atrás",
+        "mod_health_update_lag_patch": "{count} correção(ões) atrás",
+        "mod_health_update_lag_unknown": "versões não comparáveis",
+        "mod_health_update_catalog": "catálogo local",
 
         # errors
         "errors_header": "Erros encontrados neste log",
@@ -325,6 +435,13 @@ TEXT = {
         "suggestions_header": "Sugestões de correção",
         "suggestions_none": "Nenhuma sugestão automática por enquanto. Se o jogo ainda estiver estranho, confira as abas de Erros e Avisos.",
 
+        # timeline
+        "timeline_header": "Erros e avisos ao longo do tempo",
+        "timeline_none": "Não há linhas ERROR/WARN com hora neste registo.",
+        "timeline_range_seconds": "{start} – {end}, uma barra por segundo",
+        "timeline_range_minutes": "{start} – {end}, uma barra por minuto",
+        "timeline_peak": "Momento mais intenso: {time} ({errors} erros, {warnings} avisos)",
+
         # raw
         "raw_header": "Log completo do SMAPI",
 
@@ -346,6 +463,16 @@ TEXT = {
         "app_title": "Doctor de registros SMAPI",
         "btn_open": "Abrir registro SMAPI",
         "btn_export": "Exportar resumen",
+        "btn_mods_dir": "Carpeta Mods…",
+        "btn_recent": "Registros recientes…",
+        "btn_open_newest": "Abrir el más reciente",
+        "dialog_recent_title": "Registros SMAPI recientes",
+        "recent_col_file": "Archivo",
+        "recent_col_modified": "Modificado",
+        "recent_btn_open": "Abrir",
+        "recent_none": "Aún no hay registros SMAPI indexados. Ejecuta el juego con SMAPI o abre un registro primero.",
+        "status_indexing": "Indexando registros en {path}…",
+        "status_indexed": "Registros indexados en {path}: {count} disponible(s).",
         "status_ready": "Listo. Abre un registro de SMAPI para analizar.",
         "status_loaded": "Registro cargado: {path}",
         "status_no_analysis": "Aún no hay análisis. Abre un registro primero.",
@@ -354,6 +481,7 @@ TEXT = {
         "label_language": "Idioma:",
         "dialog_select_log_title": "Seleccionar registro de SMAPI",
         "dialog_export_title": "Exportar resumen",
+        "dialog_select_mods_title": "Selecciona la carpeta Mods de Stardew Valley",
         "dialog_error_title": "Error",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Error al leer el archivo:\n{error}",
@@ -367,6 +495,7 @@ TEXT = {
         "tab_errors": "Errores",
         "tab_warnings": "Advertencias",
         "tab_suggestions": "Sugerencias",
+        "tab_timeline": "Cronología",
         "tab_raw": "Registro bruto",
 
         # overview
@@ -389,9 +518,18 @@ TEXT = {
         "mod_health_console_header": "Mods con acceso directo a la consola:",
         "mod_health_missing_dep_header": "Mods con dependencias faltantes:",
         "mod_health_missing_dep_item": "{mod} → falta: {missing}",
+        "mod_health_fallout_header": "Dependencias faltantes y todos los mods que arrastran:",
+        "mod_health_fallout_item": "{missing}: se omitirán {count} mod(s)",
+        "mod_health_fallout_direct": "lo requieren: {mods}",
+        "mod_health_fallout_transitive": "omitidos en cadena: {mods}",
         "mod_health_none": "No se detectaron mods arriesgados en este registro.",
         "mod_health_updates_header": "Mods con actualizaciones disponibles:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} versión(es) mayor(es) por detrás",
+        "mod_health_update_lag_minor": "{count} versión(es) menor(es) por detrás",
+        "mod_health_update_lag_patch": "{count} parche(s) por detrás",
+        "mod_health_update_lag_unknown": "versiones no comparables",
+        "mod_health_update_catalog": "catálogo local",
 
         # errors
         "errors_header": "Errores encontrados en este registro",
@@ -407,6 +545,13 @@ TEXT = {
         "suggestions_header": "Soluciones sugeridas",
         "suggestions_none": "Sin sugerencias automáticas. Si el juego sigue raro, revisa las pestañas de Errores/Advertencias.",
 
+        # timeline
+        "timeline_header": "Errores y advertencias a lo largo del tiempo",
+        "timeline_none": "No hay líneas ERROR/WARN con hora en este registro.",
+        "timeline_range_seconds": "{start} – {end}, una barra por segundo",
+        "timeline_range_minutes": "{start} – {end}, una barra por minuto",
+        "timeline_peak": "Momento de mayor actividad: {time} ({errors} errores, {warnings} advertencias)",
+
         # raw
         "raw_header": "Registro completo de SMAPI",
 
@@ -428,6 +573,16 @@ TEXT = {
         "app_title": "Docteur des logs SMAPI",
         "btn_open": "Ouvrir un log SMAPI",
         "btn_export": "Exporter le résumé",
+        "btn_mods_dir": "Dossier Mods…",
+        "btn_recent": "Journaux récents…",
+        "btn_open_newest": "Ouvrir le plus récent",
+        "dialog_recent_title": "Journaux SMAPI récents",
+        "recent_col_file": "Fichier",
+        "recent_col_modified": "Modifié",
+        "recent_btn_open": "Ouvrir",
+        "recent_none": "Aucun journal SMAPI indexé pour l’instant. Lancez le jeu avec SMAPI ou ouvrez d’abord un journal.",
+        "status_indexing": "Indexation des journaux dans {path}…",
+        "status_indexed": "Journaux indexés dans {path} : {count} disponible(s).",
         "status_ready": "Prêt. Ouvrez un log SMAPI à analyser.",
         "status_loaded": "Log chargé : {path}",
         "status_no_analysis": "Pas encore d'analyse. Ouvrez d'abord un log.",
@@ -436,6 +591,7 @@ TEXT = {
         "label_language": "Langue :",
         "dialog_select_log_title": "Sélectionner un log SMAPI",
         "dialog_export_title": "Exporter le résumé",
+        "dialog_select_mods_title": "Sélectionnez le dossier Mods de Stardew Valley",
         "dialog_error_title": "Erreur",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Échec de lecture du fichier :\n{error}",
@@ -449,6 +605,7 @@ TEXT = {
         "tab_errors": "Erreurs",
         "tab_warnings": "Avertissements",
         "tab_suggestions": "Suggestions",
+        "tab_timeline": "Chronologie",
         "tab_raw": "Log brut",
 
         # overview
@@ -471,9 +628,18 @@ TEXT = {
         "mod_health_console_header": "Mods avec accès direct à la console :",
         "mod_health_missing_dep_header": "Mods avec dépendances manquantes :",
         "mod_health_missing_dep_item": "{mod} → manquant : {missing}",
+        "mod_health_fallout_header": "Dépendances manquantes et tous les mods qu’elles entraînent :",
+        "mod_health_fallout_item": "{missing} : {count} mod(s) seront ignorés",
+        "mod_health_fallout_direct": "le requièrent : {mods}",
+        "mod_health_fallout_transitive": "ignorés par ricochet : {mods}",
         "mod_health_none": "Aucun mod risqué détecté dans ce log.",
         "mod_health_updates_header": "Mods avec mises à jour disponibles :",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} version(s) majeure(s) de retard",
+        "mod_health_update_lag_minor": "{count} version(s) mineure(s) de retard",
+        "mod_health_update_lag_patch": "{count} correctif(s) de retard",
+        "mod_health_update_lag_unknown": "versions non comparables",
+        "mod_health_update_catalog": "catalogue local",
 
         # errors
         "errors_header": "Erreurs trouvées dans ce log",
@@ -489,6 +655,13 @@ TEXT = {
         "suggestions_header": "Corrections suggérées",
         "suggestions_none": "Aucune suggestion automatique. Si le jeu reste instable, consultez les onglets Erreurs/Avertissements.",
 
+        # timeline
+        "timeline_header": "Erreurs et avertissements dans le temps",
+        "timeline_none": "Aucune ligne ERROR/WARN horodatée dans ce journal.",
+        "timeline_range_seconds": "{start} – {end}, une barre par seconde",
+        "timeline_range_minutes": "{start} – {end}, une barre par minute",
+        "timeline_peak": "Moment le plus chargé : {time} ({errors} erreurs, {warnings} avertissements)",
+
         # raw
         "raw_header": "Log SMAPI complet",
 
@@ -510,6 +683,16 @@ TEXT = {
         "app_title": "SMAPI-Logdoktor",
         "btn_open": "SMAPI-Log öffnen",
         "btn_export": "Zusammenfassung exportieren",
+        "btn_mods_dir": "Mods-Ordner…",
+        "btn_recent": "Letzte Logs…",
+        "btn_open_newest": "Neuestes öffnen",
+        "dialog_recent_title": "Letzte SMAPI-Logs",
+        "recent_col_file": "Datei",
+        "recent_col_modified": "Geändert",
+        "recent_btn_open": "Öffnen",
+        "recent_none": "Noch keine SMAPI-Logs indexiert. Starte das Spiel mit SMAPI oder öffne zuerst ein Log.",
+        "status_indexing": "Indexiere Logs in {path}…",
+        "status_indexed": "Logs in {path} indexiert: {count} verfügbar.",
         "status_ready": "Bereit. Öffne einen SMAPI-Log zur Analyse.",
         "status_loaded": "Log geladen: {path}",
         "status_no_analysis": "Noch keine Analyse. Öffne zuerst einen Log.",
@@ -518,6 +701,7 @@ TEXT = {
         "label_language": "Sprache:",
         "dialog_select_log_title": "SMAPI-Log auswählen",
         "dialog_export_title": "Zusammenfassung exportieren",
+        "dialog_select_mods_title": "Stardew-Valley-Mods-Ordner auswählen",
         "dialog_error_title": "Fehler",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Datei konnte nicht gelesen werden:\n{error}",
@@ -531,6 +715,7 @@ TEXT = {
         "tab_errors": "Fehler",
         "tab_warnings": "Warnungen",
         "tab_suggestions": "Vorschläge",
+        "tab_timeline": "Zeitverlauf",
         "tab_raw": "Roh-Log",
 
         # overview
@@ -553,9 +738,18 @@ TEXT = {
         "mod_health_console_header": "Mods mit direktem Konsolenzugriff:",
         "mod_health_missing_dep_header": "Mods mit fehlenden Abhängigkeiten:",
         "mod_health_missing_dep_item": "{mod} → fehlt: {missing}",
+        "mod_health_fallout_header": "Fehlende Abhängigkeiten und alle Mods, die dadurch ausfallen:",
+        "mod_health_fallout_item": "{missing}: {count} Mod(s) werden übersprungen",
+        "mod_health_fallout_direct": "benötigen es direkt: {mods}",
+        "mod_health_fallout_transitive": "folglich übersprungen: {mods}",
         "mod_health_none": "Keine riskanten Mods in diesem Log gefunden.",
         "mod_health_updates_header": "Mods mit verfügbaren Updates:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} Hauptversion(en) zurück",
+        "mod_health_update_lag_minor": "{count} Nebenversion(en) zurück",
+        "mod_health_update_lag_patch": "{count} Patch(es) zurück",
+        "mod_health_update_lag_unknown": "Versionen nicht vergleichbar",
+        "mod_health_update_catalog": "lokaler Katalog",
 
         # errors
         "errors_header": "Fehler in diesem Log",
@@ -571,6 +765,13 @@ TEXT = {
         "suggestions_header": "Vorgeschlagene Lösungen",
         "suggestions_none": "Keine automatischen Vorschläge. Wenn das Spiel weiterhin spinnt, prüfe die Tabs Fehler/Warnungen.",
 
+        # timeline
+        "timeline_header": "Fehler & Warnungen im Zeitverlauf",
+        "timeline_none": "Keine ERROR/WARN-Zeilen mit Zeitstempel in diesem Log.",
+        "timeline_range_seconds": "{start} – {end}, ein Balken pro Sekunde",
+        "timeline_range_minutes": "{start} – {end}, ein Balken pro Minute",
+        "timeline_peak": "Spitze: {time} ({errors} Fehler, {warnings} Warnungen)",
+
         # raw
         "raw_header": "Vollständiger SMAPI-Log",
 
@@ -592,6 +793,16 @@ TEXT = {
         "app_title": "Dottore dei log SMAPI",
         "btn_open": "Apri log SMAPI",
         "btn_export": "Esporta riepilogo",
+        "btn_mods_dir": "Cartella Mods…",
+        "btn_recent": "Log recenti…",
+        "btn_open_newest": "Apri il più recente",
+        "dialog_recent_title": "Log SMAPI recenti",
+        "recent_col_file": "File",
+        "recent_col_modified": "Modificato",
+        "recent_btn_open": "Apri",
+        "recent_none": "Nessun log SMAPI ancora indicizzato. Avvia il gioco con SMAPI o apri prima un log.",
+        "status_indexing": "Indicizzazione dei log in {path}…",
+        "status_indexed": "Log indicizzati in {path}: {count} disponibili.",
         "status_ready": "Pronto. Apri un log SMAPI da analizzare.",
         "status_loaded": "Log caricato: {path}",
         "status_no_analysis": "Nessuna analisi ancora. Apri prima un log.",
@@ -600,6 +811,7 @@ TEXT = {
         "label_language": "Lingua:",
         "dialog_select_log_title": "Seleziona log SMAPI",
         "dialog_export_title": "Esporta riepilogo",
+        "dialog_select_mods_title": "Seleziona la cartella Mods di Stardew Valley",
         "dialog_error_title": "Errore",
         "dialog_info_title": "Info",
         "dialog_read_fail": "Impossibile leggere il file:\n{error}",
@@ -613,6 +825,7 @@ TEXT = {
         "tab_errors": "Errori",
         "tab_warnings": "Avvisi",
         "tab_suggestions": "Suggerimenti",
+        "tab_timeline": "Cronologia",
         "tab_raw": "Log grezzo",
 
         # overview
@@ -635,9 +848,18 @@ TEXT = {
         "mod_health_console_header": "Mod con accesso diretto alla console:",
         "mod_health_missing_dep_header": "Mod con dipendenze mancanti:",
         "mod_health_missing_dep_item": "{mod} → mancante: {missing}",
+        "mod_health_fallout_header": "Dipendenze mancanti e tutte le mod che ne risentono:",
+        "mod_health_fallout_item": "{missing}: {count} mod verranno saltate",
+        "mod_health_fallout_direct": "la richiedono: {mods}",
+        "mod_health_fallout_transitive": "saltate di conseguenza: {mods}",
         "mod_health_none": "Nessun mod rischioso rilevato in questo log.",
         "mod_health_updates_header": "Mod con aggiornamenti disponibili:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} versione/i principale/i indietro",
+        "mod_health_update_lag_minor": "{count} versione/i minore/i indietro",
+        "mod_health_update_lag_patch": "{count} patch indietro",
+        "mod_health_update_lag_unknown": "versioni non confrontabili",
+        "mod_health_update_catalog": "catalogo locale",
 
         # errors
         "errors_header": "Errori trovati in questo log",
@@ -653,6 +875,13 @@ TEXT = {
         "suggestions_header": "Soluzioni suggerite",
         "suggestions_none": "Nessun suggerimento automatico. Se il gioco continua a dare problemi, controlla le schede Errori/Avvisi.",
 
+        # timeline
+        "timeline_header": "Errori e avvisi nel tempo",
+        "timeline_none": "Nessuna riga ERROR/WARN con orario in questo log.",
+        "timeline_range_seconds": "{start} – {end}, una barra al secondo",
+        "timeline_range_minutes": "{start} – {end}, una barra al minuto",
+        "timeline_peak": "Momento più intenso: {time} ({errors} errori, {warnings} avvisi)",
+
         # raw
         "raw_header": "Log completo SMAPI",
 
@@ -674,6 +903,16 @@ TEXT = {
         "app_title": "SMAPI ログドクター",
         "btn_open": "SMAPI ログを開く",
         "btn_export": "概要をエクスポート",
+        "btn_mods_dir": "Mods フォルダー…",
+        "btn_recent": "最近のログ…",
+        "btn_open_newest": "最新を開く",
+        "dialog_recent_title": "最近の SMAPI ログ",
+        "recent_col_file": "ファイル",
+        "recent_col_modified": "更新日時",
+        "recent_btn_open": "開く",
+        "recent_none": "まだ SMAPI ログがインデックスされていません。SMAPI でゲームを起動するか、先にログを開いてください。",
+        "status_indexing": "{path} のログをインデックス中…",
+        "status_indexed": "{path} のログをインデックスしました：{count} 件。",
         "status_ready": "準備完了。SMAPI ログを開いて分析してください。",
         "status_loaded": "ログを読み込みました: {path}",
         "status_no_analysis": "まだ分析していません。まずログを開いてください。",
@@ -682,6 +921,7 @@ TEXT = {
         "label_language": "言語:",
         "dialog_select_log_title": "SMAPI ログを選択",
         "dialog_export_title": "概要をエクスポート",
+        "dialog_select_mods_title": "Stardew Valley の Mods フォルダーを選択",
         "dialog_error_title": "エラー",
         "dialog_info_title": "情報",
         "dialog_read_fail": "ファイルの読み込みに失敗しました:\n{error}",
@@ -695,6 +935,7 @@ TEXT = {
         "tab_errors": "エラー",
         "tab_warnings": "警告",
         "tab_suggestions": "提案",
+        "tab_timeline": "タイムライン",
         "tab_raw": "生ログ",
 
         # overview
@@ -717,9 +958,18 @@ TEXT = {
         "mod_health_console_header": "コンソールへ直接アクセスする Mod:",
         "mod_health_missing_dep_header": "依存関係が欠けている Mod:",
         "mod_health_missing_dep_item": "{mod} → 不足: {missing}",
+        "mod_health_fallout_header": "不足している前提 Mod と、その影響で読み込まれない Mod：",
+        "mod_health_fallout_item": "{missing}：{count} 個の Mod がスキップされます",
+        "mod_health_fallout_direct": "直接必要としている：{mods}",
+        "mod_health_fallout_transitive": "連鎖的にスキップ：{mods}",
         "mod_health_none": "このログにはリスクの高い Mod は見つかりませんでした。",
         "mod_health_updates_header": "更新が利用できる Mod:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "メジャーバージョン {count} つ遅れ",
+        "mod_health_update_lag_minor": "マイナーバージョン {count} つ遅れ",
+        "mod_health_update_lag_patch": "パッチ {count} つ遅れ",
+        "mod_health_update_lag_unknown": "バージョンを比較できません",
+        "mod_health_update_catalog": "ローカルカタログ",
 
         # errors
         "errors_header": "このログで見つかったエラー",
@@ -735,6 +985,13 @@ TEXT = {
         "suggestions_header": "提案された修正",
         "suggestions_none": "自動提案はありません。まだ問題がある場合はエラー/警告タブを確認してください。",
 
+        # timeline
+        "timeline_header": "エラーと警告の時間推移",
+        "timeline_none": "このログにはタイムスタンプ付きの ERROR/WARN 行がありません。",
+        "timeline_range_seconds": "{start} – {end}、1 本 = 1 秒",
+        "timeline_range_minutes": "{start} – {end}、1 本 = 1 分",
+        "timeline_peak": "最も集中した時刻：{time}（エラー {errors} 件、警告 {warnings} 件）",
+
         # raw
         "raw_header": "SMAPI ログ全体",
 
@@ -756,6 +1013,16 @@ TEXT = {
         "app_title": "SMAPI 로그 닥터",
         "btn_open": "SMAPI 로그 열기",
         "btn_export": "요약 내보내기",
+        "btn_mods_dir": "Mods 폴더…",
+        "btn_recent": "최근 로그…",
+        "btn_open_newest": "최신 로그 열기",
+        "dialog_recent_title": "최근 SMAPI 로그",
+        "recent_col_file": "파일",
+        "recent_col_modified": "수정 시각",
+        "recent_btn_open": "열기",
+        "recent_none": "아직 색인된 SMAPI 로그가 없습니다. SMAPI로 게임을 실행하거나 먼저 로그를 여세요.",
+        "status_indexing": "{path}의 로그 색인 중…",
+        "status_indexed": "{path}의 로그 색인 완료: {count}개 사용 가능.",
         "status_ready": "준비 완료. 분석할 SMAPI 로그를 열어주세요.",
         "status_loaded": "로그 불러옴: {path}",
         "status_no_analysis": "아직 분석 전입니다. 먼저 로그를 여세요.",
@@ -764,6 +1031,7 @@ TEXT = {
         "label_language": "언어:",
         "dialog_select_log_title": "SMAPI 로그 선택",
         "dialog_export_title": "요약 내보내기",
+        "dialog_select_mods_title": "Stardew Valley Mods 폴더 선택",
         "dialog_error_title": "오류",
         "dialog_info_title": "정보",
         "dialog_read_fail": "파일을 읽지 못했습니다:\n{error}",
@@ -777,6 +1045,7 @@ TEXT = {
         "tab_errors": "오류",
         "tab_warnings": "경고",
         "tab_suggestions": "제안",
+        "tab_timeline": "타임라인",
         "tab_raw": "원본 로그",
 
         # overview
@@ -799,9 +1068,18 @@ TEXT = {
         "mod_health_console_header": "콘솔에 직접 접근하는 모드:",
         "mod_health_missing_dep_header": "누락된 의존성이 있는 모드:",
         "mod_health_missing_dep_item": "{mod} → 누락: {missing}",
+        "mod_health_fallout_header": "누락된 선행 모드와 그로 인해 함께 빠지는 모드:",
+        "mod_health_fallout_item": "{missing}: 모드 {count}개가 건너뛰어집니다",
+        "mod_health_fallout_direct": "직접 필요: {mods}",
+        "mod_health_fallout_transitive": "연쇄적으로 건너뜀: {mods}",
         "mod_health_none": "이 로그에서 위험한 모드는 감지되지 않았습니다.",
         "mod_health_updates_header": "업데이트 가능한 모드:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "메이저 버전 {count}개 뒤처짐",
+        "mod_health_update_lag_minor": "마이너 버전 {count}개 뒤처짐",
+        "mod_health_update_lag_patch": "패치 {count}개 뒤처짐",
+        "mod_health_update_lag_unknown": "버전을 비교할 수 없음",
+        "mod_health_update_catalog": "로컬 카탈로그",
 
         # errors
         "errors_header": "이 로그에서 발견된 오류",
@@ -817,6 +1095,13 @@ TEXT = {
         "suggestions_header": "제안된 해결책",
         "suggestions_none": "자동 제안이 없습니다. 문제가 계속되면 오류/경고 탭을 확인하세요.",
 
+        # timeline
+        "timeline_header": "시간에 따른 오류 및 경고",
+        "timeline_none": "이 로그에는 타임스탬프가 있는 ERROR/WARN 줄이 없습니다.",
+        "timeline_range_seconds": "{start} – {end}, 막대 하나당 1초",
+        "timeline_range_minutes": "{start} – {end}, 막대 하나당 1분",
+        "timeline_peak": "가장 집중된 시점: {time} (오류 {errors}개, 경고 {warnings}개)",
+
         # raw
         "raw_header": "SMAPI 전체 로그",
 
@@ -838,6 +1123,16 @@ TEXT = {
         "app_title": "Doktor logów SMAPI",
         "btn_open": "Otwórz log SMAPI",
         "btn_export": "Eksportuj podsumowanie",
+        "btn_mods_dir": "Folder Mods…",
+        "btn_recent": "Ostatnie logi…",
+        "btn_open_newest": "Otwórz najnowszy",
+        "dialog_recent_title": "Ostatnie logi SMAPI",
+        "recent_col_file": "Plik",
+        "recent_col_modified": "Zmodyfikowano",
+        "recent_btn_open": "Otwórz",
+        "recent_none": "Brak zindeksowanych logów SMAPI. Uruchom grę przez SMAPI lub najpierw otwórz log.",
+        "status_indexing": "Indeksowanie logów w {path}…",
+        "status_indexed": "Zindeksowano logi w {path}: dostępne {count}.",
         "status_ready": "Gotowe. Otwórz log SMAPI do analizy.",
         "status_loaded": "Wczytano log: {path}",
         "status_no_analysis": "Brak analizy. Najpierw otwórz log.",
@@ -846,6 +1141,7 @@ TEXT = {
         "label_language": "Język:",
         "dialog_select_log_title": "Wybierz log SMAPI",
         "dialog_export_title": "Eksport podsumowania",
+        "dialog_select_mods_title": "Wybierz folder Mods Stardew Valley",
         "dialog_error_title": "Błąd",
         "dialog_info_title": "Informacja",
         "dialog_read_fail": "Nie udało się odczytać pliku:\n{error}",
@@ -859,6 +1155,7 @@ TEXT = {
         "tab_errors": "Błędy",
         "tab_warnings": "Ostrzeżenia",
         "tab_suggestions": "Sugestie",
+        "tab_timeline": "Oś czasu",
         "tab_raw": "Surowy log",
 
         # overview
@@ -881,9 +1178,18 @@ TEXT = {
         "mod_health_console_header": "Mody z bezpośrednim dostępem do konsoli:",
         "mod_health_missing_dep_header": "Mody z brakującymi zależnościami:",
         "mod_health_missing_dep_item": "{mod} → brak: {missing}",
+        "mod_health_fallout_header": "Brakujące zależności i wszystkie mody, które przez nie wypadną:",
+        "mod_health_fallout_item": "{missing}: pominięte zostaną mody ({count})",
+        "mod_health_fallout_direct": "wymagają bezpośrednio: {mods}",
+        "mod_health_fallout_transitive": "pominięte w konsekwencji: {mods}",
         "mod_health_none": "Nie wykryto ryzykownych modów w tym logu.",
         "mod_health_updates_header": "Mody z dostępnymi aktualizacjami:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} wersja(e) główna(e) w tyle",
+        "mod_health_update_lag_minor": "{count} wersja(e) pomocnicza(e) w tyle",
+        "mod_health_update_lag_patch": "{count} poprawka(i) w tyle",
+        "mod_health_update_lag_unknown": "nie można porównać wersji",
+        "mod_health_update_catalog": "lokalny katalog",
 
         # errors
         "errors_header": "Błędy w tym logu",
@@ -899,6 +1205,13 @@ TEXT = {
         "suggestions_header": "Proponowane rozwiązania",
         "suggestions_none": "Brak automatycznych sugestii. Jeśli gra dalej sprawia problemy, sprawdź karty Błędy/Ostrzeżenia.",
 
+        # timeline
+        "timeline_header": "Błędy i ostrzeżenia w czasie",
+        "timeline_none": "Brak linii ERROR/WARN ze znacznikiem czasu w tym logu.",
+        "timeline_range_seconds": "{start} – {end}, jeden słupek na sekundę",
+        "timeline_range_minutes": "{start} – {end}, jeden słupek na minutę",
+        "timeline_peak": "Najbardziej intensywny moment: {time} (błędy: {errors}, ostrzeżenia: {warnings})",
+
         # raw
         "raw_header": "Pełny log SMAPI",
 
@@ -920,6 +1233,16 @@ TEXT = {
         "app_title": "Doutor de Logs do SMAPI",
         "btn_open": "Abrir log do SMAPI",
         "btn_export": "Exportar resumo",
+        "btn_mods_dir": "Pasta Mods…",
+        "btn_recent": "Logs recentes…",
+        "btn_open_newest": "Abrir o mais recente",
+        "dialog_recent_title": "Logs SMAPI recentes",
+        "recent_col_file": "Arquivo",
+        "recent_col_modified": "Modificado",
+        "recent_btn_open": "Abrir",
+        "recent_none": "Nenhum log SMAPI indexado ainda. Inicie o jogo com SMAPI ou abra um log primeiro.",
+        "status_indexing": "Indexando logs em {path}…",
+        "status_indexed": "Logs indexados em {path}: {count} disponível(is).",
         "status_ready": "Pronto. Abra um log do SMAPI para analisar.",
         "status_loaded": "Log carregado: {path}",
         "status_no_analysis": "Ainda não há análise. Abra um log primeiro.",
@@ -928,6 +1251,7 @@ TEXT = {
         "label_language": "Idioma:",
         "dialog_select_log_title": "Selecionar log do SMAPI",
         "dialog_export_title": "Exportar resumo",
+        "dialog_select_mods_title": "Selecione a pasta Mods do Stardew Valley",
         "dialog_error_title": "Erro",
         "dialog_info_title": "Informação",
         "dialog_read_fail": "Falha ao ler o arquivo:\n{error}",
@@ -941,6 +1265,7 @@ TEXT = {
         "tab_errors": "Erros",
         "tab_warnings": "Avisos",
         "tab_suggestions": "Sugestões",
+        "tab_timeline": "Linha do tempo",
         "tab_raw": "Log bruto",
 
         # overview
@@ -963,9 +1288,18 @@ TEXT = {
         "mod_health_console_header": "Mods com acesso direto ao console:",
         "mod_health_missing_dep_header": "Mods com dependências ausentes:",
         "mod_health_missing_dep_item": "{mod} → faltando: {missing}",
+        "mod_health_fallout_header": "Dependências ausentes e todos os mods afetados por elas:",
+        "mod_health_fallout_item": "{missing}: {count} mod(s) serão ignorados",
+        "mod_health_fallout_direct": "exigem diretamente: {mods}",
+        "mod_health_fallout_transitive": "ignorados em cadeia: {mods}",
         "mod_health_none": "Nenhum mod claramente arriscado foi detectado neste log.",
         "mod_health_updates_header": "Mods com atualizações disponíveis:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} versão(ões) principal(is) atrás",
+        "mod_health_update_lag_minor": "{count} versão(ões) secundária(s) atrás",
+        "mod_health_update_lag_patch": "{count} correção(ões) atrás",
+        "mod_health_update_lag_unknown": "versões não comparáveis",
+        "mod_health_update_catalog": "catálogo local",
 
         # errors
         "errors_header": "Erros encontrados neste log",
@@ -981,6 +1315,13 @@ TEXT = {
         "suggestions_header": "Sugestões de correção",
         "suggestions_none": "Nenhuma sugestão automática por enquanto. Se o jogo ainda estiver estranho, confira as abas de Erros e Avisos.",
 
+        # timeline
+        "timeline_header": "Erros e avisos ao longo do tempo",
+        "timeline_none": "Não há linhas ERROR/WARN com horário neste log.",
+        "timeline_range_seconds": "{start} – {end}, uma barra por segundo",
+        "timeline_range_minutes": "{start} – {end}, uma barra por minuto",
+        "timeline_peak": "Momento mais intenso: {time} ({errors} erros, {warnings} avisos)",
+
         # raw
         "raw_header": "Log completo do SMAPI",
 
@@ -1002,6 +1343,16 @@ TEXT = {
         "app_title": "SMAPI Log Doktoru",
         "btn_open": "SMAPI günlüğünü aç",
         "btn_export": "Özeti dışa aktar",
+        "btn_mods_dir": "Mods klasörü…",
+        "btn_recent": "Son günlükler…",
+        "btn_open_newest": "En yeniyi aç",
+        "dialog_recent_title": "Son SMAPI günlükleri",
+        "recent_col_file": "Dosya",
+        "recent_col_modified": "Değiştirilme",
+        "recent_btn_open": "Aç",
+        "recent_none": "Henüz dizine eklenmiş SMAPI günlüğü yok. Oyunu SMAPI ile başlatın veya önce bir günlük açın.",
+        "status_indexing": "{path} içindeki günlükler dizinleniyor…",
+        "status_indexed": "{path} içindeki günlükler dizinlendi: {count} günlük mevcut.",
         "status_ready": "Hazır. Analiz için bir SMAPI günlüğü açın.",
         "status_loaded": "Günlük yüklendi: {path}",
         "status_no_analysis": "Henüz analiz yok. Önce bir günlük açın.",
@@ -1010,6 +1361,7 @@ TEXT = {
         "label_language": "Dil:",
         "dialog_select_log_title": "SMAPI günlüğünü seç",
         "dialog_export_title": "Özeti dışa aktar",
+        "dialog_select_mods_title": "Stardew Valley Mods klasörünü seçin",
         "dialog_error_title": "Hata",
         "dialog_info_title": "Bilgi",
         "dialog_read_fail": "Dosya okunamadı:\n{error}",
@@ -1023,6 +1375,7 @@ TEXT = {
         "tab_errors": "Hatalar",
         "tab_warnings": "Uyarılar",
         "tab_suggestions": "Öneriler",
+        "tab_timeline": "Zaman çizelgesi",
         "tab_raw": "Ham günlük",
 
         # overview
@@ -1045,9 +1398,18 @@ TEXT = {
         "mod_health_console_header": "Konsola doğrudan erişen modlar:",
         "mod_health_missing_dep_header": "Eksik bağımlılıkları olan modlar:",
         "mod_health_missing_dep_item": "{mod} → eksik: {missing}",
+        "mod_health_fallout_header": "Eksik bağımlılıklar ve bu yüzden yüklenmeyecek tüm modlar:",
+        "mod_health_fallout_item": "{missing}: {count} mod atlanacak",
+        "mod_health_fallout_direct": "doğrudan gerektirenler: {mods}",
+        "mod_health_fallout_transitive": "zincirleme atlananlar: {mods}",
         "mod_health_none": "Bu günlükte riskli mod bulunamadı.",
         "mod_health_updates_header": "Güncellemesi olan modlar:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "{count} ana sürüm geride",
+        "mod_health_update_lag_minor": "{count} ara sürüm geride",
+        "mod_health_update_lag_patch": "{count} yama geride",
+        "mod_health_update_lag_unknown": "sürümler karşılaştırılamıyor",
+        "mod_health_update_catalog": "yerel katalog",
 
         # errors
         "errors_header": "Bu günlükteki hatalar",
@@ -1063,6 +1425,13 @@ TEXT = {
         "suggestions_header": "Önerilen çözümler",
         "suggestions_none": "Otomatik öneri yok. Oyun hâlâ sorunluysa Hatalar/Uyarılar sekmelerini kontrol edin.",
 
+        # timeline
+        "timeline_header": "Zaman içinde hatalar ve uyarılar",
+        "timeline_none": "Bu günlükte zaman damgalı ERROR/WARN satırı yok.",
+        "timeline_range_seconds": "{start} – {end}, saniye başına bir çubuk",
+        "timeline_range_minutes": "{start} – {end}, dakika başına bir çubuk",
+        "timeline_peak": "En yoğun an: {time} ({errors} hata, {warnings} uyarı)",
+
         # raw
         "raw_header": "SMAPI günlüğünün tamamı",
 
@@ -1084,6 +1453,16 @@ TEXT = {
         "app_title": "Лікар логів SMAPI",
         "btn_open": "Відкрити лог SMAPI",
         "btn_export": "Експортувати підсумок",
+        "btn_mods_dir": "Тека Mods…",
+        "btn_recent": "Нещодавні логи…",
+        "btn_open_newest": "Відкрити найновіший",
+        "dialog_recent_title": "Нещодавні логи SMAPI",
+        "recent_col_file": "Файл",
+        "recent_col_modified": "Змінено",
+        "recent_btn_open": "Відкрити",
+        "recent_none": "Логи SMAPI ще не проіндексовано. Запустіть гру через SMAPI або спершу відкрийте лог.",
+        "status_indexing": "Індексація логів у {path}…",
+        "status_indexed": "Логи в {path} проіндексовано: доступно {count}.",
         "status_ready": "Готово. Відкрийте лог SMAPI для аналізу.",
         "status_loaded": "Лог завантажено: {path}",
         "status_no_analysis": "Аналізу ще немає. Спочатку відкрийте лог.",
@@ -1092,6 +1471,7 @@ TEXT = {
         "label_language": "Мова:",
         "dialog_select_log_title": "Виберіть лог SMAPI",
         "dialog_export_title": "Експорт підсумку",
+        "dialog_select_mods_title": "Виберіть теку Mods Stardew Valley",
         "dialog_error_title": "Помилка",
         "dialog_info_title": "Інформація",
         "dialog_read_fail": "Не вдалося прочитати файл:\n{error}",
@@ -1105,6 +1485,7 @@ TEXT = {
         "tab_errors": "Помилки",
         "tab_warnings": "Попередження",
         "tab_suggestions": "Пропозиції",
+        "tab_timeline": "Хронологія",
         "tab_raw": "Сирий лог",
 
         # overview
@@ -1127,9 +1508,18 @@ TEXT = {
         "mod_health_console_header": "Моди з прямим доступом до консолі:",
         "mod_health_missing_dep_header": "Моди з відсутніми залежностями:",
         "mod_health_missing_dep_item": "{mod} → відсутнє: {missing}",
+        "mod_health_fallout_header": "Відсутні залежності та всі моди, які через них не завантажаться:",
+        "mod_health_fallout_item": "{missing}: буде пропущено модів: {count}",
+        "mod_health_fallout_direct": "потребують напряму: {mods}",
+        "mod_health_fallout_transitive": "пропущені ланцюжком: {mods}",
         "mod_health_none": "У цьому логу не знайдено ризикованих модів.",
         "mod_health_updates_header": "Моди з доступними оновленнями:",
         "mod_health_update_item": "{name} {current} → {latest}",
+        "mod_health_update_lag_major": "відстає на {count} мажорн. верс.",
+        "mod_health_update_lag_minor": "відстає на {count} мінорн. верс.",
+        "mod_health_update_lag_patch": "відстає на {count} патч(ів)",
+        "mod_health_update_lag_unknown": "версії неможливо порівняти",
+        "mod_health_update_catalog": "локальний каталог",
 
         # errors
         "errors_header": "Помилки в цьому логу",
@@ -1145,6 +1535,13 @@ TEXT = {
         "suggestions_header": "Рекомендовані дії",
         "suggestions_none": "Немає автоматичних пропозицій. Якщо гра й далі глючить, перегляньте вкладки Помилки/Попередження.",
 
+        # timeline
+        "timeline_header": "Помилки та попередження в часі",
+        "timeline_none": "У цьому лозі немає рядків ERROR/WARN з позначкою часу.",
+        "timeline_range_seconds": "{start} – {end}, один стовпчик на секунду",
+        "timeline_range_minutes": "{start} – {end}, один стовпчик на хвилину",
+        "timeline_peak": "Піковий момент: {time} (помилок: {errors}, попереджень: {warnings})",
+
         # raw
         "raw_header": "Повний лог SMAPI",
 
@@ -1164,6 +1561,29 @@ TEXT = {
 }
 
 
+# lang -> key -> precompiled renderer, built the first time a language is used
+_template_cache: Dict[str, Dict[str, Callable[..., str]]] = {}
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Parse a format string once; strings without placeholders skip formatting entirely."""
+    if any(name is not None for _, name, _, _ in string.Formatter().parse(template)):
+        return template.format
+    literal = template.replace("{{", "{").replace("}}", "}")
+    return lambda **kwargs: literal
+
+
+def get_templates(lang: str) -> Dict[str, Callable[..., str]]:
+    """Renderers for every key of a language; keys it lacks fall back to English."""
+    templates = _template_cache.get(lang)
+    if templates is None:
+        source = dict(TEXT["en"])
+        source.update(TEXT.get(lang, {}))
+        templates = {key: _compile_template(value) for key, value in source.items()}
+        _template_cache[lang] = templates
+    return templates
+
+
 # =========================
 # Data classes
 # =========================
@@ -1188,6 +1608,66 @@ class UpdateInfo:
     url: str
 
 
+@dataclass
+class LoadedMod:
+    name: str
+    version: str
+    author: str = ""
+
+
+@dataclass
+class OutdatedMod:
+    name: str
+    current: str
+    latest: str
+    url: str = ""
+    # (major, minor, patch) distance to the latest version; used for ranking.
+    # None = SMAPI reported an update but the versions can't be parsed (listed unranked)
+    lag: Optional[Tuple[int, int, int]] = (0, 0, 0)
+    # "log" = SMAPI update alert, "catalog" = local update catalog
+    source: str = "log"
+
+
+@dataclass
+class ManifestInfo:
+    unique_id: str
+    name: str
+    version: str
+    folder: str
+    # UniqueIDs this mod can't load without (required Dependencies + ContentPackFor)
+    required: List[str] = field(default_factory=list)
+    optional: List[str] = field(default_factory=list)
+    content_pack_for: Optional[str] = None
+
+
+@dataclass
+class DependencyGraph:
+    mods_dir: str
+    # lowercase UniqueID -> manifest
+    mods: Dict[str, ManifestInfo] = field(default_factory=dict)
+    # lowercase UniqueID -> lowercase UniqueIDs of mods that require it
+    dependents: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class DependencyFallout:
+    missing: str
+    # mods that require the missing mod directly
+    direct: List[str] = field(default_factory=list)
+    # mods skipped because something they require is skipped
+    transitive: List[str] = field(default_factory=list)
+
+
+@dataclass
+class ErrorTimeline:
+    # seconds since midnight of the first timestamped line
+    start: int
+    # 1 (per second) for short sessions, 60 (per minute) otherwise
+    bucket_seconds: int
+    errors: array = field(default_factory=lambda: array("I"))
+    warnings: array = field(default_factory=lambda: array("I"))
+
+
 @dataclass
 class SmapiAnalysis:
     game_version: Optional[str] = None
@@ -1202,12 +1682,349 @@ class SmapiAnalysis:
     missing_dependencies: List[MissingDependency] = field(default_factory=list)
     external_conflicts: List[str] = field(default_factory=list)
     update_infos: List[UpdateInfo] = field(default_factory=list)
+    loaded_mods: List[LoadedMod] = field(default_factory=list)
+    outdated_mods: List[OutdatedMod] = field(default_factory=list)
+    mods_path: Optional[str] = None
+    dependency_fallout: List[DependencyFallout] = field(default_factory=list)
+    timeline: Optional[ErrorTimeline] = None
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     slow_start_seconds: Optional[float] = None
     raw_log: str = ""
 
 
+# =========================
+# Versions + update catalog
+# =========================
+
+UPDATE_CATALOG_FILENAME = "smapi_update_catalog.json"
+
+_VERSION_RE = re.compile(r"^v?(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.-]+))?(?:\+[0-9A-Za-z.-]+)?$")
+
+# lowercase mod name -> (latest version, url); filled once per process
+_update_catalog_index: Optional[Dict[str, Tuple[str, str]]] = None
+
+
+def parse_version(version: str) -> Optional[tuple]:
+    """
+    Parse a SMAPI/semantic version like "1.10.2" or "2.0.0-beta.3" into a sort key.
+    Returns None if the string isn't a version.
+
+    Numbers compare numerically ("1.10" > "1.9"), trailing zeros are ignored
+    ("1.2" == "1.2.0") and pre-releases sort before the final release.
+    """
+    m = _VERSION_RE.match(version.strip())
+    if not m:
+        return None
+    numbers = [int(x) for x in m.group(1).split(".")]
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+    prerelease = m.group(2)
+    if not prerelease:
+        return (tuple(numbers), 1, ())
+    tag = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part.lower())
+        for part in prerelease.split(".")
+    )
+    return (tuple(numbers), 0, tag)
+
+
+def version_lag(current: str, latest: str) -> Optional[Tuple[int, int, int]]:
+    """
+    How far `current` is behind `latest`, as (major, minor, patch).
+    Only the first differing component counts, e.g. 1.9.4 → 1.10.0 is (0, 1, 0).
+    Returns None if either version can't be parsed or current isn't older.
+    """
+    cur = parse_version(current)
+    new = parse_version(latest)
+    if cur is None or new is None or cur >= new:
+        return None
+    cur_nums, new_nums = cur[0], new[0]
+    width = max(len(cur_nums), len(new_nums))
+    cur_nums = cur_nums + (0,) * (width - len(cur_nums))
+    new_nums = new_nums + (0,) * (width - len(new_nums))
+    lag = [0, 0, 0]
+    for i, (a, b) in enumerate(zip(cur_nums, new_nums)):
+        if a != b:
+            lag[min(i, 2)] = max(b - a, 0)
+            break
+    if lag == [0, 0, 0]:
+        # same numbers, only the pre-release tag differs
+        lag[2] = 1
+    return (lag[0], lag[1], lag[2])
+
+
+def update_catalog_path() -> str:
+    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(base_dir, UPDATE_CATALOG_FILENAME)
+
+
+def load_update_catalog(path: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Load a local (offline) catalog of known latest mod versions.
+
+    Format: {"Mod Name": "1.2.3"} or {"Mod Name": {"latest": "1.2.3", "url": "..."}}
+    Invalid entries are skipped; a missing/broken file gives an empty catalog.
+    """
+    index: Dict[str, Tuple[str, str]] = {}
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+    except Exception:
+        return index
+    if not isinstance(data, dict):
+        return index
+
+    for name, entry in data.items():
+        if isinstance(entry, str):
+            latest, url = entry, ""
+        elif isinstance(entry, dict) and isinstance(entry.get("latest"), str):
+            latest, url = entry["latest"], str(entry.get("url") or "")
+        else:
+            continue
+        if parse_version(latest) is not None:
+            index[name.strip().lower()] = (latest.strip(), url)
+    return index
+
+
+def get_update_catalog() -> Dict[str, Tuple[str, str]]:
+    """Return the update catalog index, loading it from disk on first use."""
+    global _update_catalog_index
+    if _update_catalog_index is None:
+        _update_catalog_index = load_update_catalog(update_catalog_path())
+    return _update_catalog_index
+
+
+def rank_outdated_mods(
+    analysis: "SmapiAnalysis",
+    catalog: Dict[str, Tuple[str, str]],
+) -> List[OutdatedMod]:
+    """
+    Combine SMAPI update alerts with the local catalog and rank outdated mods,
+    most versions behind first. Mods only known from the catalog are included
+    too, so this works even when the log has no update alerts.
+
+    SMAPI alerts whose versions can't be parsed are kept with lag None and
+    listed after the ranked mods, by name.
+    """
+    found: Dict[str, OutdatedMod] = {}
+
+    def consider(name: str, current: str, latest: str, url: str, source: str) -> None:
+        lag = version_lag(current, latest)
+        if lag is None:
+            comparable = parse_version(current) is not None and parse_version(latest) is not None
+            if comparable or source != "log":
+                return
+        key = name.lower()
+        known = found.get(key)
+        if known is not None and (
+            lag is None or (known.lag is not None and parse_version(known.latest) >= parse_version(latest))
+        ):
+            return
+        found[key] = OutdatedMod(name, current, latest, url, lag, source)
+
+    for u in analysis.update_infos:
+        consider(u.name, u.current, u.latest, u.url, "log")
+
+    if catalog:
+        for lm in analysis.loaded_mods:
+            entry = catalog.get(lm.name.lower())
+            if entry:
+                consider(lm.name, lm.version, entry[0], entry[1], "catalog")
+
+    ranked = [o for o in found.values() if o.lag is not None]
+    unranked = [o for o in found.values() if o.lag is None]
+    ranked.sort(key=lambda o: (-o.lag[0], -o.lag[1], -o.lag[2], o.name.lower()))
+    unranked.sort(key=lambda o: o.name.lower())
+    return ranked + unranked
+
+
+# =========================
+# Dependency graph (Mods folder manifests)
+# =========================
+
+# mods_dir -> (manifest mtime signature, graph)
+_dependency_graph_cache: Dict[str, Tuple[tuple, DependencyGraph]] = {}
+
+_JSON_COMMENT_RE = re.compile(r'"(?:\\.|[^"\\])*"|//[^\r\n]*|/\*.*?\*/', re.S)
+_JSON_TRAILING_COMMA_RE = re.compile(r'"(?:\\.|[^"\\])*"|,(?=\s*[}\]])', re.S)
+
+
+def _load_lenient_json(path: str):
+    """Load JSON the way SMAPI does: // and /* */ comments and trailing commas allowed."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        text = f.read()
+    keep_strings = lambda m: m.group(0) if m.group(0).startswith('"') else ""
+    text = _JSON_COMMENT_RE.sub(keep_strings, text)
+    text = _JSON_TRAILING_COMMA_RE.sub(keep_strings, text)
+    return json.loads(text)
+
+
+def find_manifests(mods_dir: str) -> List[Tuple[str, int]]:
+    """
+    Find (manifest path, mtime_ns) for every mod under a Mods folder.
+    Like SMAPI, a folder with a manifest.json is a mod; other folders are searched
+    recursively, and folders starting with "." are ignored.
+    """
+    found: List[Tuple[str, int]] = []
+    pending = [mods_dir]
+    while pending:
+        folder = pending.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        manifest = next(
+            (e for e in entries if e.is_file() and e.name.lower() == "manifest.json"),
+            None,
+        )
+        if manifest is not None and folder != mods_dir:
+            try:
+                found.append((manifest.path, manifest.stat().st_mtime_ns))
+            except OSError:
+                pass
+            continue
+        for e in entries:
+            if e.is_dir() and not e.name.startswith("."):
+                pending.append(e.path)
+    found.sort()
+    return found
+
+
+def read_manifest(path: str) -> Optional[ManifestInfo]:
+    """Read UniqueID, Dependencies and ContentPackFor from one manifest.json."""
+    try:
+        data = _load_lenient_json(path)
+    except Exception:
+        return None
+    if not isinstance(data, dict):
+        return None
+    # SMAPI manifest fields are case-insensitive
+    data = {str(k).lower(): v for k, v in data.items()}
+    unique_id = data.get("uniqueid")
+    if not isinstance(unique_id, str) or not unique_id.strip():
+        return None
+
+    info = ManifestInfo(
+        unique_id=unique_id.strip(),
+        name=str(data.get("name") or unique_id).strip(),
+        version=str(data.get("version") or "").strip(),
+        folder=os.path.dirname(path),
+    )
+    for dep in data.get("dependencies") or []:
+        if not isinstance(dep, dict):
+            continue
+        dep = {str(k).lower(): v for k, v in dep.items()}
+        dep_id = dep.get("uniqueid")
+        if not isinstance(dep_id, str) or not dep_id.strip():
+            continue
+        if dep.get("isrequired", True) is False:
+            info.optional.append(dep_id.strip())
+        else:
+            info.required.append(dep_id.strip())
+
+    cp_for = data.get("contentpackfor")
+    if isinstance(cp_for, dict):
+        cp_for = {str(k).lower(): v for k, v in cp_for.items()}.get("uniqueid")
+        if isinstance(cp_for, str) and cp_for.strip():
+            info.content_pack_for = cp_for.strip()
+            info.required.append(info.content_pack_for)
+    return info
+
+
+def build_dependency_graph(mods_dir: str) -> DependencyGraph:
+    """
+    Build the UniqueID dependency graph for a Mods folder.
+    Manifests are parsed in parallel; the graph is cached until a manifest is
+    added, removed or modified, so repeated analyses don't re-read anything.
+    """
+    key = os.path.normcase(os.path.abspath(mods_dir))
+    manifests = find_manifests(mods_dir)
+    signature = tuple(manifests)
+    cached = _dependency_graph_cache.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    graph = DependencyGraph(mods_dir=mods_dir)
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 2)) as pool:
+        infos = list(pool.map(read_manifest, [path for path, _ in manifests]))
+
+    for info in infos:
+        if info is not None:
+            graph.mods.setdefault(info.unique_id.lower(), info)
+    for mod_id, info in graph.mods.items():
+        for dep_id in info.required:
+            graph.dependents.setdefault(dep_id.lower(), []).append(mod_id)
+
+    _dependency_graph_cache[key] = (signature, graph)
+    return graph
+
+
+_VERSION_SUFFIX_RE = re.compile(r"\s+v?\d[0-9A-Za-z.+-]*$")
+
+
+def compute_dependency_fallout(
+    analysis: "SmapiAnalysis",
+    graph: Optional[DependencyGraph],
+) -> List[DependencyFallout]:
+    """
+    For each missing dependency (from the log, or required by an installed
+    manifest but not installed), list every mod that will be skipped because
+    of it: direct dependents first, then everything depending on those.
+    Biggest fallout first.
+    """
+    mods = graph.mods if graph else {}
+    dependents = graph.dependents if graph else {}
+
+    missing: Dict[str, str] = {}
+    log_dependents: Dict[str, List[str]] = {}
+    for dep in analysis.missing_dependencies:
+        for part in dep.missing.split(","):
+            dep_id = part.strip().rstrip(".")
+            if not dep_id or dep_id.lower() in mods:
+                continue
+            missing.setdefault(dep_id.lower(), dep_id)
+            names = log_dependents.setdefault(dep_id.lower(), [])
+            if dep.mod_name not in names:
+                names.append(dep.mod_name)
+    for info in mods.values():
+        for dep_id in info.required:
+            if dep_id.lower() not in mods:
+                missing.setdefault(dep_id.lower(), dep_id)
+
+    results: List[DependencyFallout] = []
+    for dep_key, dep_id in missing.items():
+        fallout = DependencyFallout(missing=dep_id)
+        seen = {dep_key}
+        frontier = [dep_key]
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier: List[str] = []
+            for node in frontier:
+                for child in dependents.get(node, []):
+                    if child in seen:
+                        continue
+                    seen.add(child)
+                    next_frontier.append(child)
+                    target = fallout.direct if depth == 1 else fallout.transitive
+                    target.append(mods[child].name)
+            frontier = next_frontier
+        # log-only dependents (e.g. no Mods folder); the log adds " <version>" to names
+        known = {n.lower() for n in fallout.direct + fallout.transitive}
+        for name in log_dependents.get(dep_key, []):
+            if name.lower() in known or _VERSION_SUFFIX_RE.sub("", name).lower() in known:
+                continue
+            known.add(name.lower())
+            fallout.direct.append(name)
+        fallout.direct.sort(key=str.lower)
+        fallout.transitive.sort(key=str.lower)
+        results.append(fallout)
+
+    results.sort(key=lambda f: (-(len(f.direct) + len(f.transitive)), f.missing.lower()))
+    return results
+
+
 # =========================
 # Parsing logic
 # =========================
@@ -1226,7 +2043,67 @@ def _parse_time_to_seconds(time_str: str) -> Optional[float]:
         return None
 
 
-def analyze_smapi_log(text: str) -> SmapiAnalysis:
+_LINE_HEADER_RE = re.compile(r"\[(\d\d):(\d\d):(\d\d)\s+(\w+)")
+
+# sessions up to this long get per-second buckets, longer ones per-minute
+TIMELINE_PER_SECOND_MAX = 10 * 60
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def format_clock(seconds: int) -> str:
+    seconds %= 24 * 3600
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+
+def build_error_timeline(
+    first: int,
+    last: int,
+    error_offsets: array,
+    warning_offsets: array,
+) -> ErrorTimeline:
+    """Bucket ERROR/WARN line offsets (seconds after `first`) into compact count arrays."""
+    span = last - first + 1
+    bucket = 1 if span <= TIMELINE_PER_SECOND_MAX else 60
+    size = (span + bucket - 1) // bucket
+    timeline = ErrorTimeline(
+        start=first,
+        bucket_seconds=bucket,
+        errors=array("I", bytes(4 * size)),
+        warnings=array("I", bytes(4 * size)),
+    )
+    for offsets, counts in ((error_offsets, timeline.errors), (warning_offsets, timeline.warnings)):
+        for offset in offsets:
+            counts[offset // bucket] += 1
+    return timeline
+
+
+def sparkline(counts, width: int = 60) -> str:
+    """Render counts as a one-line unicode sparkline, merging buckets to fit `width`."""
+    if not counts:
+        return ""
+    step = max(1, -(-len(counts) // width))
+    merged = [sum(counts[i:i + step]) for i in range(0, len(counts), step)]
+    peak = max(merged)
+    if peak == 0:
+        return SPARK_CHARS[0] * len(merged)
+    top = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[(c * top + peak - 1) // peak] for c in merged)
+
+
+_LOADED_MOD_RE = re.compile(
+    r"^\[[^\]]*\]\s{2,}(.+?)\s+v?(\d[0-9A-Za-z.+-]*)\s+by\s+(.+?)(?:\s+\|.*)?$"
+)
+
+
+def analyze_smapi_log(
+    text: str, mods_dir: Optional[str] = None, dependencies: bool = True
+) -> SmapiAnalysis:
+    """
+    Parse a SMAPI log. If a Mods folder is given (or the log's "Mods go here"
+    folder exists), its manifests are used to work out dependency fallout.
+    With dependencies=False the Mods folder isn't read; see update_dependency_fallout.
+    """
     analysis = SmapiAnalysis(raw_log=text)
     lines = text.splitlines()
 
@@ -1235,8 +2112,34 @@ def analyze_smapi_log(text: str) -> SmapiAnalysis:
     in_save_serializer_section = False
     in_patched_section = False
     in_console_section = False
+    in_loaded_list = False
+
+    # timeline: seconds since the first timestamp, wrapping past midnight
+    first_seconds: Optional[int] = None
+    last_offset = 0
+    day_offset = 0
+    prev_seconds = -1
+    error_offsets = array("I")
+    warning_offsets = array("I")
 
     for line in lines:
+        m_head = _LINE_HEADER_RE.match(line)
+        if m_head:
+            seconds = int(m_head.group(1)) * 3600 + int(m_head.group(2)) * 60 + int(m_head.group(3))
+            if seconds + 12 * 3600 < prev_seconds:
+                day_offset += 24 * 3600
+            prev_seconds = seconds
+            seconds += day_offset
+            if first_seconds is None:
+                first_seconds = seconds
+            offset = max(seconds - first_seconds, 0)
+            last_offset = max(last_offset, offset)
+            level = m_head.group(4)
+            if level == "ERROR":
+                error_offsets.append(offset)
+            elif level == "WARN":
+                warning_offsets.append(offset)
+
         # Versions
         if "SMAPI" in line and "with Stardew Valley" in line:
             m = re.search(r"SMAPI\s+([0-9.]+)\s+with Stardew Valley\s+([0-9.]+)", line)
@@ -1244,15 +2147,31 @@ def analyze_smapi_log(text: str) -> SmapiAnalysis:
                 analysis.smapi_version = m.group(1)
                 analysis.game_version = m.group(2)
 
+        # Loaded mod / content pack list ("   Name 1.2.3 by Author | ...")
+        if in_loaded_list:
+            m = _LOADED_MOD_RE.search(line)
+            if m:
+                analysis.loaded_mods.append(
+                    LoadedMod(m.group(1).strip(), m.group(2), m.group(3).strip())
+                )
+                continue
+            in_loaded_list = False
+
+        # Mods folder
+        if "Mods go here:" in line:
+            analysis.mods_path = line.split("Mods go here:", 1)[1].strip()
+
         # Counts
         if "Loaded" in line and "mods:" in line:
             m = re.search(r"Loaded\s+(\d+)\s+mods", line)
             if m:
                 analysis.mod_count = int(m.group(1))
+                in_loaded_list = True
         if "Loaded" in line and "content packs:" in line:
             m = re.search(r"Loaded\s+(\d+)\s+content packs", line)
             if m:
                 analysis.content_pack_count = int(m.group(1))
+                in_loaded_list = True
 
         # Startup time
         if "Instance_LoadContent() finished, elapsed =" in line:
@@ -1363,7 +2282,10 @@ def analyze_smapi_log(text: str) -> SmapiAnalysis:
 
         # Update infos (alert details)
         if "ALERT SMAPI" in line and "You can update" not in line:
-            m = re.search(r"]\s+(.+?)\s+([0-9.]+):\s+(\S+)\s+\(you have\s+([0-9.]+)\)", line)
+            m = re.search(
+                r"]\s+(.+?)\s+(\d[0-9A-Za-z.+-]*):\s+(\S+)\s+\(you have\s+(\d[0-9A-Za-z.+-]*)\)",
+                line,
+            )
             if m:
                 name = m.group(1).strip()
                 latest = m.group(2).strip()
@@ -1373,6 +2295,25 @@ def analyze_smapi_log(text: str) -> SmapiAnalysis:
                     UpdateInfo(name=name, latest=latest, current=current, url=url)
                 )
 
+    if first_seconds is not None and (error_offsets or warning_offsets):
+        analysis.timeline = build_error_timeline(
+            first_seconds, first_seconds + last_offset, error_offsets, warning_offsets
+        )
+
+    analysis.outdated_mods = rank_outdated_mods(analysis, get_update_catalog())
+
+    if dependencies:
+        update_dependency_fallout(analysis, mods_dir)
+    return analysis
+
+
+def update_dependency_fallout(analysis: SmapiAnalysis, mods_dir: Optional[str] = None) -> SmapiAnalysis:
+    """(Re)compute an analysis' dependency fallout against the current Mods folder manifests."""
+    graph: Optional[DependencyGraph] = None
+    mods_dir = mods_dir or analysis.mods_path
+    if mods_dir and os.path.isdir(mods_dir):
+        graph = build_dependency_graph(mods_dir)
+    analysis.dependency_fallout = compute_dependency_fallout(analysis, graph)
     return analysis
 
 
@@ -1381,24 +2322,27 @@ def analyze_smapi_log(text: str) -> SmapiAnalysis:
 # =========================
 
 def build_suggestions(analysis: SmapiAnalysis, lang: str) -> List[str]:
-    t = lambda key, **kw: TEXT[lang][key].format(**kw)
+    templates = get_templates(lang)
+    t = lambda key, **kw: templates[key](**kw)
     suggestions: List[str] = []
 
     # Skipped mods
-    for sm in analysis.skipped_mods:
-        suggestions.append(t("sg.skipped_mod", name=sm.name, reason=sm.reason))
+    render = templates["sg.skipped_mod"]
+    suggestions.extend(render(name=sm.name, reason=sm.reason) for sm in analysis.skipped_mods)
 
     # Failed mods
-    for fm in analysis.failed_mods:
-        suggestions.append(t("sg.failed_mod", name=fm.name, reason=fm.reason))
+    render = templates["sg.failed_mod"]
+    suggestions.extend(render(name=fm.name, reason=fm.reason) for fm in analysis.failed_mods)
 
     # Missing dependencies
-    for dep in analysis.missing_dependencies:
-        suggestions.append(t("sg.missing_dep", mod=dep.mod_name, missing=dep.missing))
+    render = templates["sg.missing_dep"]
+    suggestions.extend(
+        render(mod=dep.mod_name, missing=dep.missing) for dep in analysis.missing_dependencies
+    )
 
     # Save serializer
-    for mname in analysis.save_serializer_mods:
-        suggestions.append(t("sg.save_serializer", mod=mname))
+    render = templates["sg.save_serializer"]
+    suggestions.extend(render(mod=mname) for mname in analysis.save_serializer_mods)
 
     # Many patched mods
     if len(analysis.patched_mods) >= 15:
@@ -1409,8 +2353,8 @@ def build_suggestions(analysis: SmapiAnalysis, lang: str) -> List[str]:
         suggestions.append(t("sg.rivatuner"))
 
     # Updates
-    if analysis.update_infos:
-        suggestions.append(t("sg.updates", count=len(analysis.update_infos)))
+    if analysis.outdated_mods:
+        suggestions.append(t("sg.updates", count=len(analysis.outdated_mods)))
 
     # Slow startup
     if analysis.slow_start_seconds and analysis.slow_start_seconds > 20:
@@ -1452,6 +2396,197 @@ def detect_smapi_log_dir() -> Optional[str]:
     return None
 
 
+# =========================
+# Helpers: ErrorLogs index
+# =========================
+
+LOG_INDEX_FILENAME = "smapi_log_index.json"
+# newest logs whose full analysis is kept in memory, ready to open
+LOG_INDEX_ANALYZED = 8
+
+_QUICK_VERSION_RE = re.compile(r"SMAPI\s+([0-9.]+)\s+with Stardew Valley\s+([0-9.]+)")
+_QUICK_LEVEL_RE = re.compile(r"^\[\d\d:\d\d:\d\d\s+(ERROR|WARN)\s", re.M)
+
+
+@dataclass
+class LogIndexEntry:
+    path: str
+    size: int
+    mtime: float
+    smapi_version: Optional[str] = None
+    game_version: Optional[str] = None
+    error_count: int = 0
+    warning_count: int = 0
+
+
+def _list_log_files(log_dir: str) -> List[Tuple[str, int, float]]:
+    """(path, size, mtime) for every .txt log in a folder, without reading them."""
+    files: List[Tuple[str, int, float]] = []
+    try:
+        with os.scandir(log_dir) as it:
+            for e in it:
+                if e.is_file() and e.name.lower().endswith(".txt"):
+                    st = e.stat()
+                    files.append((e.path, st.st_size, st.st_mtime))
+    except OSError:
+        pass
+    return files
+
+
+def find_newest_log(log_dir: str) -> Optional[str]:
+    files = _list_log_files(log_dir)
+    if not files:
+        return None
+    return max(files, key=lambda f: f[2])[0]
+
+
+def _read_log(path: str) -> str:
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        return f.read()
+
+
+def quick_scan_log(path: str, size: int, mtime: float, text: Optional[str] = None) -> LogIndexEntry:
+    """Cheap summary of a log (versions + ERROR/WARN line counts) for the index."""
+    entry = LogIndexEntry(path=path, size=size, mtime=mtime)
+    if text is None:
+        text = _read_log(path)
+    m = _QUICK_VERSION_RE.search(text)
+    if m:
+        entry.smapi_version = m.group(1)
+        entry.game_version = m.group(2)
+    for level in _QUICK_LEVEL_RE.findall(text):
+        if level == "ERROR":
+            entry.error_count += 1
+        else:
+            entry.warning_count += 1
+    return entry
+
+
+class SmapiLogIndex:
+    """
+    Small persisted index of the logs in an ErrorLogs folder.
+    Only new or changed files (by size + mtime) are read again, on a background thread.
+    The newest logs are also fully analysed there (without dependency fallout) and
+    kept in memory, so opening them doesn't parse them again on the UI thread.
+    """
+
+    def __init__(self, index_path: str) -> None:
+        self.index_path = index_path
+        self.entries: Dict[str, LogIndexEntry] = {}
+        # normalized path -> (size, mtime, analysis); in memory only
+        self.analyses: Dict[str, Tuple[int, float, SmapiAnalysis]] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def _analysis_key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def analysis_for(self, path: str) -> Optional[SmapiAnalysis]:
+        """The background analysis of a log, if the file hasn't changed since."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            cached = self.analyses.get(self._analysis_key(path))
+        if cached is None or cached[0] != st.st_size or cached[1] != st.st_mtime:
+            return None
+        return cached[2]
+
+    def load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for item in data.get("logs", []):
+                entry = LogIndexEntry(**item)
+                self.entries[entry.path] = entry
+        except Exception:
+            # missing or broken index: start from scratch
+            self.entries = {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"logs": [vars(e) for e in self.entries.values()]}
+        try:
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        except Exception:
+            pass
+
+    def refresh(self, log_dir: str) -> int:
+        """Re-index new/changed logs in log_dir, drop deleted ones. Returns how many changed."""
+        files = _list_log_files(log_dir)
+        present = {path for path, _, _ in files}
+        changed = 0
+
+        with self._lock:
+            norm_dir = os.path.normcase(os.path.abspath(log_dir))
+            for path in list(self.entries):
+                in_dir = os.path.normcase(os.path.dirname(os.path.abspath(path))) == norm_dir
+                if in_dir and path not in present:
+                    del self.entries[path]
+                    changed += 1
+            stale = {
+                path
+                for path, size, mtime in files
+                if path not in self.entries
+                or self.entries[path].size != size
+                or self.entries[path].mtime != mtime
+            }
+            newest = sorted(files, key=lambda f: f[2], reverse=True)[:LOG_INDEX_ANALYZED]
+            keep = {self._analysis_key(path) for path, _, _ in newest}
+            self.analyses = {k: v for k, v in self.analyses.items() if k in keep}
+            unanalyzed = {
+                path
+                for path, size, mtime in newest
+                if self.analyses.get(self._analysis_key(path), (None, None))[:2] != (size, mtime)
+            }
+
+        # newest first, so the log most likely to be opened is ready soonest
+        for path, size, mtime in sorted(files, key=lambda f: f[2], reverse=True):
+            if path not in stale and path not in unanalyzed:
+                continue
+            try:
+                text = _read_log(path)
+            except OSError:
+                continue
+            if path in stale:
+                entry = quick_scan_log(path, size, mtime, text)
+                with self._lock:
+                    self.entries[path] = entry
+                changed += 1
+            if path in unanalyzed:
+                try:
+                    analysis = analyze_smapi_log(text, dependencies=False)
+                except Exception:
+                    continue
+                with self._lock:
+                    self.analyses[self._analysis_key(path)] = (size, mtime, analysis)
+
+        if changed:
+            self.save()
+        return changed
+
+    def start_refresh(self, log_dir: str) -> threading.Thread:
+        worker = threading.Thread(target=self.refresh, args=(log_dir,), daemon=True)
+        worker.start()
+        return worker
+
+    def recent(self, log_dir: Optional[str] = None, limit: int = 50) -> List[LogIndexEntry]:
+        """Indexed logs, newest first (optionally only those in log_dir)."""
+        with self._lock:
+            entries = list(self.entries.values())
+        if log_dir:
+            norm_dir = os.path.normcase(os.path.abspath(log_dir))
+            entries = [
+                e for e in entries
+                if os.path.normcase(os.path.dirname(os.path.abspath(e.path))) == norm_dir
+            ]
+        entries.sort(key=lambda e: e.mtime, reverse=True)
+        return entries[:limit]
+
+
 # =========================
 # Tkinter UI app
 # =========================
@@ -1466,8 +2601,17 @@ class SmapiLogDoctorApp:
         # remember last folder + language
         self.config_path = self._compute_config_path()
         self.last_dir: Optional[str] = None
+        self.mods_dir: Optional[str] = None
         self._load_config()
 
+        # persisted index of the ErrorLogs folder (filled in the background)
+        self.log_index = SmapiLogIndex(
+            os.path.join(os.path.dirname(self.config_path), LOG_INDEX_FILENAME)
+        )
+        self._index_thread: Optional[threading.Thread] = None
+        self._recent_window: Optional[tk.Toplevel] = None
+        self._recent_tree: Optional[ttk.Treeview] = None
+
         # language dropdown options: (code, label)
         self.lang_options = [
             ("en", "EN"),
@@ -1486,11 +2630,13 @@ class SmapiLogDoctorApp:
             ("uk", "UA"),
         ]
         self.lang_var = tk.StringVar()
+        self._templates = get_templates(self.lang)
 
-        self.root.title(TEXT[self.lang]["app_title"])
+        self.root.title(self._t("app_title"))
         self.root.geometry("1000x700")
 
         self._build_ui()
+        self._start_log_indexing()
 
     # ---------- Config helpers ----------
 
@@ -1509,6 +2655,9 @@ class SmapiLogDoctorApp:
                 last_dir = data.get("last_dir")
                 if last_dir and os.path.isdir(last_dir):
                     self.last_dir = last_dir
+                mods_dir = data.get("mods_dir")
+                if mods_dir and os.path.isdir(mods_dir):
+                    self.mods_dir = mods_dir
         except Exception:
             # ignore config errors, fall back to defaults
             pass
@@ -1517,6 +2666,7 @@ class SmapiLogDoctorApp:
         data = {
             "lang": self.lang,
             "last_dir": self.last_dir,
+            "mods_dir": self.mods_dir,
         }
         try:
             with open(self.config_path, "w", encoding="utf-8") as f:
@@ -1528,7 +2678,7 @@ class SmapiLogDoctorApp:
     # ---------- Translation helper ----------
 
     def _t(self, key: str, **kwargs) -> str:
-        return TEXT[self.lang][key].format(**kwargs)
+        return self._templates[key](**kwargs)
 
     # ---------- UI building ----------
 
@@ -1543,6 +2693,15 @@ class SmapiLogDoctorApp:
         self.btn_export = ttk.Button(toolbar, text=self._t("btn_export"), command=self.export_summary)
         self.btn_export.pack(side="left", padx=(4, 0))
 
+        self.btn_mods_dir = ttk.Button(toolbar, text=self._t("btn_mods_dir"), command=self.choose_mods_dir)
+        self.btn_mods_dir.pack(side="left", padx=(4, 0))
+
+        self.btn_open_newest = ttk.Button(toolbar, text=self._t("btn_open_newest"), command=self.open_newest_log)
+        self.btn_open_newest.pack(side="left", padx=(12, 0))
+
+        self.btn_recent = ttk.Button(toolbar, text=self._t("btn_recent"), command=self.show_recent_logs)
+        self.btn_recent.pack(side="left", padx=(4, 0))
+
         # Language dropdown (right side)
         lang_frame = ttk.Frame(toolbar)
         lang_frame.pack(side="right")
@@ -1575,6 +2734,7 @@ class SmapiLogDoctorApp:
         self.mod_health_text = self._create_text_tab("tab_mod_health")
         self.errors_text = self._create_text_tab("tab_errors")
         self.warnings_text = self._create_text_tab("tab_warnings")
+        self.timeline_text, self.timeline_canvas = self._create_timeline_tab()
         self.suggestions_text = self._create_text_tab("tab_suggestions")
         self.raw_log_text = self._create_text_tab("tab_raw")
 
@@ -1598,6 +2758,26 @@ class SmapiLogDoctorApp:
         text.config(state="disabled")
         return text
 
+    def _create_timeline_tab(self) -> Tuple[tk.Text, tk.Canvas]:
+        frame = ttk.Frame(self.notebook)
+        self.notebook.add(frame, text=self._t("tab_timeline"))
+
+        text = tk.Text(
+            frame,
+            wrap="word",
+            font=("Consolas", 10),
+            undo=False,
+            height=7,
+        )
+        text.pack(side="top", fill="x")
+        self._configure_text_tags(text)
+        text.config(state="disabled")
+
+        canvas = tk.Canvas(frame, background="white", highlightthickness=0)
+        canvas.pack(side="top", fill="both", expand=True)
+        canvas.bind("<Configure>", lambda event: self._draw_timeline())
+        return text, canvas
+
     def _configure_text_tags(self, text: tk.Text) -> None:
         text.tag_configure(
             "header",
@@ -1648,10 +2828,17 @@ class SmapiLogDoctorApp:
         if lang == self.lang:
             return
         self.lang = lang
-        self.root.title(TEXT[self.lang]["app_title"])
+        self._templates = get_templates(self.lang)
+        self.root.title(self._t("app_title"))
         # Update button labels & tab titles
         self.btn_open.config(text=self._t("btn_open"))
         self.btn_export.config(text=self._t("btn_export"))
+        self.btn_mods_dir.config(text=self._t("btn_mods_dir"))
+        self.btn_open_newest.config(text=self._t("btn_open_newest"))
+        self.btn_recent.config(text=self._t("btn_recent"))
+        if self._recent_window is not None:
+            self._recent_window.destroy()
+            self._recent_window = None
 
         if hasattr(self, "lang_label"):
             self.lang_label.config(text=self._t("label_language"))
@@ -1669,6 +2856,7 @@ class SmapiLogDoctorApp:
                 "tab_mod_health",
                 "tab_errors",
                 "tab_warnings",
+                "tab_timeline",
                 "tab_suggestions",
                 "tab_raw",
             ],
@@ -1713,18 +2901,26 @@ class SmapiLogDoctorApp:
         )
         if not path:
             return
-        try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                text = f.read()
-        except Exception as e:
-            messagebox.showerror(
-                self._t("dialog_error_title"),
-                self._t("dialog_read_fail", error=e),
-            )
-            return
+        self.load_log(path)
+
+    def load_log(self, path: str) -> None:
+        # logs already analysed by the ErrorLogs index aren't read or parsed again
+        analysis = self.log_index.analysis_for(path)
+        if analysis is None:
+            try:
+                text = _read_log(path)
+            except Exception as e:
+                messagebox.showerror(
+                    self._t("dialog_error_title"),
+                    self._t("dialog_read_fail", error=e),
+                )
+                return
 
         try:
-            self.analysis = analyze_smapi_log(text)
+            if analysis is None:
+                self.analysis = analyze_smapi_log(text, self.mods_dir)
+            else:
+                self.analysis = update_dependency_fallout(analysis, self.mods_dir)
         except Exception as e:
             messagebox.showerror(
                 self._t("dialog_error_title"),
@@ -1740,6 +2936,134 @@ class SmapiLogDoctorApp:
         self.render_all()
         self.status_var.set(self._t("status_loaded", path=path))
 
+    # ---------- ErrorLogs index ----------
+
+    def _log_index_dir(self) -> Optional[str]:
+        # only SMAPI's own folder: any other folder may be full of unrelated .txt files
+        return detect_smapi_log_dir()
+
+    def _start_log_indexing(self) -> None:
+        log_dir = self._log_index_dir()
+        if not log_dir or (self._index_thread and self._index_thread.is_alive()):
+            return
+        if not self.analysis:
+            self.status_var.set(self._t("status_indexing", path=log_dir))
+        self._index_thread = self.log_index.start_refresh(log_dir)
+        self.root.after(200, self._poll_log_indexing, log_dir)
+
+    def _poll_log_indexing(self, log_dir: str) -> None:
+        if self._index_thread and self._index_thread.is_alive():
+            self.root.after(200, self._poll_log_indexing, log_dir)
+            return
+        if not self.analysis:
+            count = len(self.log_index.recent(log_dir))
+            self.status_var.set(self._t("status_indexed", path=log_dir, count=count))
+        self._fill_recent_tree()
+
+    def open_newest_log(self) -> None:
+        log_dir = self._log_index_dir()
+        newest = find_newest_log(log_dir) if log_dir else None
+        if not newest:
+            messagebox.showinfo(self._t("dialog_info_title"), self._t("recent_none"))
+            return
+        self.load_log(newest)
+
+    def show_recent_logs(self) -> None:
+        if self._recent_window is not None:
+            self._recent_window.lift()
+            return
+        t = self._t
+        win = tk.Toplevel(self.root)
+        win.title(t("dialog_recent_title"))
+        win.geometry("760x320")
+        win.protocol("WM_DELETE_WINDOW", self._close_recent_logs)
+
+        columns = ("file", "modified", "smapi", "game", "errors", "warnings")
+        tree = ttk.Treeview(win, columns=columns, show="headings", selectmode="browse")
+        headings = (
+            t("recent_col_file"),
+            t("recent_col_modified"),
+            t("overview_smapi_version"),
+            t("overview_game_version"),
+            t("tab_errors"),
+            t("tab_warnings"),
+        )
+        widths = (220, 140, 100, 100, 70, 80)
+        for col, heading, width in zip(columns, headings, widths):
+            tree.heading(col, text=heading)
+            tree.column(col, width=width, anchor="w" if col == "file" else "center")
+        tree.pack(fill="both", expand=True, padx=4, pady=4)
+        tree.bind("<Double-1>", lambda event: self._open_selected_recent())
+
+        ttk.Button(win, text=t("recent_btn_open"), command=self._open_selected_recent).pack(
+            side="right", padx=4, pady=(0, 4)
+        )
+
+        self._recent_window = win
+        self._recent_tree = tree
+        self._fill_recent_tree()
+        # pick up logs written since startup
+        self._start_log_indexing()
+
+    def _close_recent_logs(self) -> None:
+        if self._recent_window is not None:
+            self._recent_window.destroy()
+        self._recent_window = None
+        self._recent_tree = None
+
+    def _fill_recent_tree(self) -> None:
+        tree = self._recent_tree
+        if tree is None:
+            return
+        tree.delete(*tree.get_children())
+        unknown = self._t("overview_unknown")
+        for e in self.log_index.recent(self._log_index_dir()):
+            tree.insert(
+                "",
+                tk.END,
+                iid=e.path,
+                values=(
+                    os.path.basename(e.path),
+                    time.strftime("%Y-%m-%d %H:%M", time.localtime(e.mtime)),
+                    e.smapi_version or unknown,
+                    e.game_version or unknown,
+                    e.error_count,
+                    e.warning_count,
+                ),
+            )
+
+    def _open_selected_recent(self) -> None:
+        if self._recent_tree is None:
+            return
+        selection = self._recent_tree.selection()
+        if selection:
+            self.load_log(selection[0])
+
+    def choose_mods_dir(self) -> None:
+        initial_dir = self.mods_dir
+        if not initial_dir and self.analysis and self.analysis.mods_path:
+            initial_dir = self.analysis.mods_path
+        folder = filedialog.askdirectory(
+            title=self._t("dialog_select_mods_title"),
+            initialdir=initial_dir or os.path.expanduser("~"),
+        )
+        if not folder:
+            return
+        self.mods_dir = folder
+        self._save_config()
+
+        # re-run analysis so dependency fallout uses the chosen manifests
+        if self.analysis:
+            try:
+                self.analysis = update_dependency_fallout(self.analysis, self.mods_dir)
+            except Exception as e:
+                messagebox.showerror(
+                    self._t("dialog_error_title"),
+                    self._t("dialog_analyze_fail", error=e),
+                )
+                return
+            self.render_all()
+
     def export_summary(self) -> None:
         if not self.analysis:
             messagebox.showinfo(
@@ -1775,6 +3099,7 @@ class SmapiLogDoctorApp:
         self._render_mod_health()
         self._render_errors()
         self._render_warnings()
+        self._render_timeline()
         self._render_suggestions()
         self._render_raw()
 
@@ -1891,39 +3216,42 @@ class SmapiLogDoctorApp:
                 "\n" + t("mod_health_missing_dep_header") + "\n",
                 ("subheader",),
             )
+            render = self._templates["mod_health_missing_dep_item"]
             for dep in a.missing_dependencies:
                 text.insert(
                     tk.END,
-                    "• "
-                    + t(
-                        "mod_health_missing_dep_item",
-                        mod=dep.mod_name,
-                        missing=dep.missing,
-                    )
-                    + "\n",
+                    "• " + render(mod=dep.mod_name, missing=dep.missing) + "\n",
                     ("bullet", "error"),
                 )
 
-        # Updates
-        if a.update_infos:
+        # Transitive fallout of missing dependencies
+        if a.dependency_fallout:
+            sections_written = True
+            text.insert(
+                tk.END,
+                "\n" + t("mod_health_fallout_header") + "\n",
+                ("subheader",),
+            )
+            for line in self._format_fallout_lines():
+                text.insert(
+                    tk.END,
+                    line + "\n",
+                    ("bullet", "error") if line.startswith("•") else ("bullet", "muted"),
+                )
+
+        # Updates (most outdated first)
+        if a.outdated_mods:
             sections_written = True
             text.insert(
                 tk.END,
                 "\n" + t("mod_health_updates_header") + "\n",
                 ("subheader",),
             )
-            for u in a.update_infos:
+            for o in a.outdated_mods:
                 text.insert(
                     tk.END,
-                    "• "
-                    + t(
-                        "mod_health_update_item",
-                        name=u.name,
-                        current=u.current,
-                        latest=u.latest,
-                    )
-                    + "\n",
-                    ("bullet", "info"),
+                    "• " + self._format_outdated(o) + "\n",
+                    ("bullet", "warning") if o.lag and o.lag[0] else ("bullet", "info"),
                 )
 
         if not sections_written:
@@ -1931,6 +3259,33 @@ class SmapiLogDoctorApp:
 
         text.config(state="disabled")
 
+    def _format_fallout_lines(self) -> List[str]:
+        t = self._t
+        lines: List[str] = []
+        for f in self.analysis.dependency_fallout:
+            count = len(f.direct) + len(f.transitive)
+            lines.append("• " + t("mod_health_fallout_item", missing=f.missing, count=count))
+            if f.direct:
+                lines.append("    " + t("mod_health_fallout_direct", mods=", ".join(f.direct)))
+            if f.transitive:
+                lines.append("    " + t("mod_health_fallout_transitive", mods=", ".join(f.transitive)))
+        return lines
+
+    def _format_outdated(self, o: OutdatedMod) -> str:
+        tpl = self._templates
+        line = tpl["mod_health_update_item"](name=o.name, current=o.current, latest=o.latest)
+        if o.lag is None:
+            line += " — " + tpl["mod_health_update_lag_unknown"]()
+        elif o.lag[0]:
+            line += " — " + tpl["mod_health_update_lag_major"](count=o.lag[0])
+        elif o.lag[1]:
+            line += " — " + tpl["mod_health_update_lag_minor"](count=o.lag[1])
+        else:
+            line += " — " + tpl["mod_health_update_lag_patch"](count=o.lag[2])
+        if o.source == "catalog":
+            line += f" [{tpl['mod_health_update_catalog']()}]"
+        return line
+
     def _render_errors(self) -> None:
         a = self.analysis
         t = self._t
@@ -1997,12 +3352,78 @@ class SmapiLogDoctorApp:
             if "RivaTuner" in x:
                 text.insert(
                     tk.END,
-                    "• " + TEXT[self.lang]["warn_rivatuner"] + "\n",
+                    "• " + t("warn_rivatuner") + "\n",
                     ("bullet", "warning"),
                 )
 
         text.config(state="disabled")
 
+    def _timeline_summary_lines(self) -> List[str]:
+        tl = self.analysis.timeline
+        t = self._t
+        end = tl.start + len(tl.errors) * tl.bucket_seconds - 1
+        range_key = "timeline_range_seconds" if tl.bucket_seconds == 1 else "timeline_range_minutes"
+        peak = max(range(len(tl.errors)), key=lambda i: (tl.errors[i], tl.warnings[i]))
+        return [
+            t(range_key, start=format_clock(tl.start), end=format_clock(end)),
+            t(
+                "timeline_peak",
+                time=format_clock(tl.start + peak * tl.bucket_seconds),
+                errors=tl.errors[peak],
+                warnings=tl.warnings[peak],
+            ),
+            f"{t('tab_errors')}: {sparkline(tl.errors)}",
+            f"{t('tab_warnings')}: {sparkline(tl.warnings)}",
+        ]
+
+    def _render_timeline(self) -> None:
+        a = self.analysis
+        t = self._t
+        text = self.timeline_text
+        self._clear_and_enable(text)
+
+        text.insert(tk.END, t("timeline_header") + "\n", ("header",))
+        if a.timeline is None:
+            text.insert(tk.END, t("timeline_none") + "\n", ("info",))
+        else:
+            lines = self._timeline_summary_lines()
+            text.insert(tk.END, lines[0] + "\n", ("muted",))
+            text.insert(tk.END, lines[1] + "\n", ("info",))
+            text.insert(tk.END, lines[2] + "\n", ("error",))
+            text.insert(tk.END, lines[3] + "\n", ("warning",))
+        text.config(state="disabled")
+        self._draw_timeline()
+
+    def _draw_timeline(self) -> None:
+        """Stacked histogram: errors (red) on top of warnings (orange), one bar per bucket."""
+        canvas = self.timeline_canvas
+        canvas.delete("all")
+        tl = self.analysis.timeline if self.analysis else None
+        if tl is None:
+            return
+
+        width = max(canvas.winfo_width(), 1)
+        height = max(canvas.winfo_height(), 1)
+        pad = 8
+        count = len(tl.errors)
+        peak = max(e + w for e, w in zip(tl.errors, tl.warnings)) or 1
+        bar_w = (width - 2 * pad) / count
+        scale = (height - 2 * pad) / peak
+        base = height - pad
+
+        for i in range(count):
+            e, w = tl.errors[i], tl.warnings[i]
+            if not e and not w:
+                continue
+            x0 = pad + i * bar_w
+            x1 = x0 + max(bar_w - 1, 1)
+            y_warn = base - w * scale
+            if w:
+                canvas.create_rectangle(x0, y_warn, x1, base, fill="#b36b00", width=0)
+            if e:
+                canvas.create_rectangle(x0, y_warn - e * scale, x1, y_warn, fill="#d22", width=0)
+        canvas.create_line(pad, base, width - pad, base, fill="#666666")
+
     def _render_suggestions(self) -> None:
         a = self.analysis
         text = self.suggestions_text
@@ -2085,7 +3506,19 @@ class SmapiLogDoctorApp:
                 parts.append(w)
             for x in a.external_conflicts:
                 if "RivaTuner" in x:
-                    parts.append(TEXT[self.lang]["warn_rivatuner"])
+                    parts.append(t("warn_rivatuner"))
+        parts.append("")
+
+        # Timeline
+        parts.append(t("timeline_header"))
+        parts.append("-" * 60)
+        if a.timeline is None:
+            parts.append(t("timeline_none"))
+        else:
+            parts.extend(self._timeline_summary_lines())
+            # raw per-bucket counts so the export stays machine-readable
+            parts.append("errors=" + ",".join(str(c) for c in a.timeline.errors))
+            parts.append("warnings=" + ",".join(str(c) for c in a.timeline.warnings))
         parts.append("")
 
         # Mod health
@@ -2106,34 +3539,25 @@ class SmapiLogDoctorApp:
                 parts.append("  - " + m)
         if a.missing_dependencies:
             parts.append(t("mod_health_missing_dep_header"))
+            render = self._templates["mod_health_missing_dep_item"]
             for dep in a.missing_dependencies:
-                parts.append(
-                    "  - "
-                    + t(
-                        "mod_health_missing_dep_item",
-                        mod=dep.mod_name,
-                        missing=dep.missing,
-                    )
-                )
-        if a.update_infos:
+                parts.append("  - " + render(mod=dep.mod_name, missing=dep.missing))
+        if a.dependency_fallout:
+            parts.append(t("mod_health_fallout_header"))
+            for line in self._format_fallout_lines():
+                parts.append("  " + line.replace("•", "-", 1))
+        if a.outdated_mods:
             parts.append(t("mod_health_updates_header"))
-            for u in a.update_infos:
-                parts.append(
-                    "  - "
-                    + t(
-                        "mod_health_update_item",
-                        name=u.name,
-                        current=u.current,
-                        latest=u.latest,
-                    )
-                )
+            for o in a.outdated_mods:
+                parts.append("  - " + self._format_outdated(o))
 
         if (
             not a.patched_mods
             and not a.save_serializer_mods
             and not a.direct_console_mods
             and not a.missing_dependencies
-            and not a.update_infos
+            and not a.dependency_fallout
+            and not a.outdated_mods
         ):
             parts.append(t("mod_health_none"))
         parts.append("")
@@ -3,14 +3,44 @@
 Stardew JSON Doctor – GUI Edition (星露谷 JSON 诊所 GUI 版)
 One-click JSON checker & trailing-comma fixer for Stardew Valley mods.
 一键检查模组 JSON，并自动修复末尾多余逗号的小工具。
+
+Run without arguments for the GUI, or with a Mods path for the command line
+(see --help), e.g. in a pre-commit hook or a mod build pipeline.
+不带参数运行为图形界面；带上模组路径则为命令行模式（见 --help），可用于提交钩子或构建流程。
 """
 
-import tkinter as tk
-from tkinter import filedialog, messagebox, scrolledtext
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Tuple
+try:
+    import tkinter as tk
+    from tkinter import filedialog, messagebox, scrolledtext
+except ImportError:  # headless Python: command line only (无图形环境：仅命令行)
+    tk = None
+import argparse
+import codecs
+from dataclasses import dataclass, field, replace
+from typing import List, Optional, Dict, Any, Tuple, Iterable, Iterator, Callable, Sequence
+from array import array
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import fnmatch
+import hashlib
+import heapq
+import itertools
+import multiprocessing
 import os
+import pathlib
 import json
+import math
+from json.decoder import scanstring
+import queue
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import zipfile
 
 # ---------- Data structures (数据结构) ----------
 
@@ -23,176 +53,1985 @@ class FileIssue:
     column: Optional[int] = None
     details: Dict[str, Any] = field(default_factory=dict)
 
+def format_location(issue: FileIssue) -> str:
+    """Position text for log lines, e.g. ' (line 行 3, col 列 5)'; empty if unknown (日志中的位置文本)."""
+    if issue.line is None or issue.column is None:
+        return ""
+    return f" (line 行 {issue.line}, col 列 {issue.column})"
+
 @dataclass
 class FileResult:
     path: str
     ok: bool
     issues: List[FileIssue] = field(default_factory=list)
     fixed: bool = False
+    content_hash: Optional[str] = None  # hash of the file as read (读取时文件内容的哈希)
+    fixed_text: Optional[str] = None    # fix waiting to be written (defer_write) (待写入的修复内容)
+    from_cache: bool = False            # reused from the scan cache (来自扫描缓存)
+    duplicate_of: Optional[str] = None  # identical file whose result was reused (复用了其结果的相同文件)
+    timings: Optional[Dict[str, float]] = None  # seconds per phase when profiling (启用分析时各阶段耗时，秒)
 
 # ---------- Core JSON logic (核心 JSON 逻辑) ----------
 
-def iter_json_files(root: str):
-    """Yield all .json files under a root folder (递归遍历根目录下的所有 .json 文件)."""
-    for dirpath, dirnames, filenames in os.walk(root):
-        for name in filenames:
-            if name.lower().endswith(".json"):
-                yield os.path.join(dirpath, name)
+# build output / VCS folders that hold no mod content (不含模组内容的编译输出与版本控制目录)
+DEFAULT_IGNORE_GLOBS = ("bin/", "obj/", ".git/", ".vs/")
 
-def strip_line_comments(text: str) -> str:
+def compile_ignore_globs(globs: Iterable[str]) -> Callable[[str, str, bool], bool]:
     """
-    Remove //-style comments that are outside of strings (移除字符串外部的 // 行注释).
-    Keeps newlines so line numbers stay roughly correct (保留换行符以尽量保持行号一致).
+    Build an is_ignored(name, rel_path, is_dir) check from glob patterns (由通配符构建忽略判断).
+
+    - "obj/" (trailing slash) only matches folders（以斜杠结尾只匹配文件夹）
+    - patterns without "/" match a name at any depth, e.g. "*.bak", ".git/"
+      （不含斜杠的模式匹配任意层级的名称）
+    - patterns with "/" match the path relative to the scan root, e.g. "SomeMod/assets/*"
+      （含斜杠的模式匹配相对扫描根目录的路径）
+    Matching is case-insensitive, like Windows paths (不区分大小写，与 Windows 路径一致).
     """
-    out_chars = []
-    i = 0
-    in_string = False
-    escape = False
-    length = len(text)
-
-    while i < length:
-        ch = text[i]
-
-        if in_string:
-            out_chars.append(ch)
-            if escape:
-                escape = False
-            elif ch == '\\':
-                escape = True
-            elif ch == '"':
-                in_string = False
-            i += 1
+    groups: Dict[Tuple[bool, bool], List[str]] = {}
+    for glob in globs:
+        glob = glob.strip().replace("\\", "/")
+        dir_only = glob.endswith("/")
+        glob = glob.strip("/")
+        if glob:
+            groups.setdefault((dir_only, "/" in glob), []).append(fnmatch.translate(glob))
+    # one regex per (folders only?, path pattern?) group (每组合并为一个正则)
+    checks = [
+        (dir_only, by_path, re.compile("|".join(patterns), re.I).match)
+        for (dir_only, by_path), patterns in groups.items()
+    ]
+
+    def is_ignored(name: str, rel_path: str, is_dir: bool) -> bool:
+        for dir_only, by_path, match in checks:
+            if (is_dir or not dir_only) and match(rel_path if by_path else name):
+                return True
+        return False
+    return is_ignored
+
+def _walk_json(top: str, rel_top: str, is_ignored: Callable[[str, str, bool], bool]) -> List[str]:
+    """.json files under one folder, pruning ignored folders (遍历单个文件夹，跳过被忽略的子目录)."""
+    found: List[str] = []
+    stack = [(top, rel_top)]
+    while stack:
+        folder, rel = stack.pop()
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
             continue
+        subdirs = []
+        for entry in entries:
+            rel_path = rel + "/" + entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not is_ignored(entry.name, rel_path, True):
+                        subdirs.append((entry.path, rel_path))
+                elif entry.name.lower().endswith(".json") and not is_ignored(entry.name, rel_path, False):
+                    found.append(entry.path)
+            except OSError:
+                continue
+        # reversed so folders are walked in name order (倒序入栈，按名称顺序遍历)
+        stack.extend(reversed(subdirs))
+    return found
+
+def iter_json_files(
+    root: str,
+    ignore: Optional[Iterable[str]] = DEFAULT_IGNORE_GLOBS,
+    workers: int = 8
+) -> Iterator[str]:
+    """
+    Yield all .json files under a root folder (递归遍历根目录下的所有 .json 文件).
+
+    Uses os.scandir and skips folders matching the ignore globs (default: bin/, obj/, .git/, .vs/).
+    Each top-level folder (usually one mod) is walked on its own thread, which hides the latency
+    of slow disks and network drives; files are still yielded in a stable, sorted order.
+    使用 os.scandir 并跳过匹配忽略规则的文件夹（默认：bin/、obj/、.git/、.vs/）。
+    每个顶层文件夹（通常是一个模组）在单独的线程中遍历，可掩盖慢速磁盘与网络驱动器的延迟；
+    输出顺序仍然稳定有序。
+    """
+    is_ignored = compile_ignore_globs(ignore or ())
+    try:
+        with os.scandir(root) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
 
-        # entering string (进入字符串)
-        if ch == '"':
-            in_string = True
-            out_chars.append(ch)
-            i += 1
+    top_dirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not is_ignored(entry.name, entry.name, True):
+                    top_dirs.append(entry)
+            elif entry.name.lower().endswith(".json") and not is_ignored(entry.name, entry.name, False):
+                yield entry.path
+        except OSError:
             continue
+    if not top_dirs:
+        return
 
-        # line comment start? (是否为行注释开始？)
-        if ch == '/' and i + 1 < length and text[i + 1] == '/':
-            # skip until newline or EOF (跳过直到换行或文件结尾)
-            i += 2
-            while i < length and text[i] not in '\r\n':
-                i += 1
-            # keep the newline itself (保留换行符本身)
-            if i < length:
-                out_chars.append(text[i])
-                i += 1
+    pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(top_dirs))))
+    try:
+        futures = [pool.submit(_walk_json, e.path, e.name, is_ignored) for e in top_dirs]
+        for future in futures:
+            yield from future.result()
+    finally:
+        # stop walking if the caller stops early (调用方提前停止时不再遍历)
+        pool.shutdown(wait=True, cancel_futures=True)
+
+class PositionMap:
+    """
+    Maps offsets in preprocessed text back to the original text (预处理文本 → 原始文本的位置映射).
+    Stores one (output offset, shift) pair per removed span and uses binary search for lookups.
+    每个被移除的片段只记录一对（输出偏移, 位移量），查找时使用二分搜索。
+    Boundaries and line starts are kept in compact int64 arrays, 8 bytes per entry
+    （片段边界与行起点保存在紧凑的 int64 数组中，每项 8 字节）.
+    Lines start after '\n'; columns count characters, both 1-based (行以 '\n' 分隔；列按字符计数，均从 1 开始).
+    """
+
+    def __init__(self, original: str):
+        self.original = original
+        self.out_starts = array("q", [0])
+        self.shifts = array("q", [0])
+        self._line_starts: Optional[array] = None
+
+    def add_removal(self, out_offset: int, total_removed: int):
+        """Output offsets >= out_offset are now total_removed chars behind the original."""
+        if self.out_starts[-1] == out_offset:
+            self.shifts[-1] = total_removed
+        else:
+            self.out_starts.append(out_offset)
+            self.shifts.append(total_removed)
+
+    def to_original(self, offset: int) -> int:
+        return offset + self.shifts[bisect_right(self.out_starts, offset) - 1]
+
+    def line_col(self, offset: int) -> Tuple[int, int]:
+        """1-based (line, column) in the original text (原始文本中的行号与列号，从 1 开始)."""
+        pos = self.to_original(offset)
+        if self._line_starts is None:
+            self._line_starts = array("q", [0])
+            self._line_starts.extend(m.end() for m in re.finditer("\n", self.original))
+        line = bisect_right(self._line_starts, pos)
+        return line, pos - self._line_starts[line - 1] + 1
+
+_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# consumes text outside strings plus whole strings (unrolled loop, no per-char alternation)
+# 匹配字符串外的文本以及完整的字符串
+_SKIP_STRINGS_RE = re.compile(r'[^"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"]*)*', re.S)
+_LINE_END_RE = re.compile(r'[\r\n]')
+# whitespace and whole comments (a comment can't end early: no backtracking into it)
+# 空白与完整注释（注释不能提前结束）
+_COMMENT_GAP = r'(?:\s|//[^\r\n]*(?![^\r\n])|/\*(?:[^*]|\*(?!/))*\*/)*'
+
+_COMMENT_START_RE = re.compile(r'/[/*]')
+# trailing comma candidates; with comments stripped, comments may sit between ',' and '}'
+# 多余逗号候选；移除注释时，逗号与 '}' 之间允许有注释
+_TRAILING_COMMA_RES = {
+    False: re.compile(r',(?=\s*[}\]])'),
+    True: re.compile(r',(?=' + _COMMENT_GAP + r'[}\]])'),
+}
+
+def preprocess_json(
+    text: str,
+    strip_comments: bool = True,
+    strip_trailing_commas: bool = True,
+    comma_offsets: Optional[List[int]] = None,
+    unclosed_comments: Optional[List[int]] = None
+) -> Tuple[str, PositionMap]:
+    """
+    Single pass that removes // and /* */ comments and/or trailing commas outside strings.
+    一次遍历移除字符串外的 // 与 /* */ 注释和/或 '}' ']' 前的多余逗号。
+
+    Jumps between candidate positions (comment starts, trailing commas) with regex searches
+    instead of walking every character; a candidate inside a string is skipped together with
+    that string.
+    使用正则在候选位置（注释起点、多余逗号）之间跳转，而不是逐字符遍历；
+    位于字符串内的候选会连同该字符串一起跳过。
+
+    Returns the new text plus a PositionMap, so parse errors can be reported at the exact
+    line/column of the original file (同时返回位置映射，解析错误可精确定位到原文件的行列).
+    Newlines after // comments are kept and /* */ comments become one space
+    （保留 // 注释后的换行符，/* */ 注释替换为一个空格）.
+    If comma_offsets is given, the original offset of every removed comma is appended to it
+    （若提供 comma_offsets，则追加每个被移除逗号在原文中的位置）.
+    A /* without */ is removed up to the end of the text; if unclosed_comments is given, its
+    offset is appended to it（缺少 */ 的 /* 会被移除到文本末尾；若提供 unclosed_comments，则追加其位置）.
+    """
+    pmap = PositionMap(text)
+    if not strip_comments and not strip_trailing_commas:
+        return text, pmap
+
+    length = len(text)
+    comment_search = _COMMENT_START_RE.search if strip_comments else None
+    comma_search = _TRAILING_COMMA_RES[strip_comments].search if strip_trailing_commas else None
+    skip_strings = _SKIP_STRINGS_RE.match
+
+    def next_candidate(search, pos: int) -> int:
+        if search is None:
+            return length
+        m = search(text, pos)
+        return m.start() if m else length
+
+    out: List[str] = []
+    copy_from = 0
+    removed = 0
+    pos = 0  # always outside a string (始终位于字符串外)
+    next_comment = next_candidate(comment_search, 0)
+    next_comma = next_candidate(comma_search, 0)
+
+    while True:
+        if next_comment < pos:
+            next_comment = next_candidate(comment_search, pos)
+        if next_comma < pos:
+            next_comma = next_candidate(comma_search, pos)
+        start = min(next_comment, next_comma)
+        if start >= length:
+            break
+
+        outside_end = skip_strings(text, pos, start).end()
+        if outside_end < start:
+            # candidate sits inside the string opening at outside_end: jump past that string
+            # 候选位于从 outside_end 开始的字符串内：跳过整个字符串
+            string_match = _STRING_RE.match(text, outside_end)
+            if string_match is None:
+                break  # unterminated string: leave the rest to the parser (字符串未闭合，交给解析器)
+            pos = string_match.end()
             continue
 
-        out_chars.append(ch)
-        i += 1
+        keep = ''
+        if start == next_comma:
+            end = start + 1
+            if comma_offsets is not None:
+                comma_offsets.append(start)
+        elif text[start + 1] == '/':
+            line_end = _LINE_END_RE.search(text, start)
+            end = line_end.start() if line_end else length
+        else:
+            end = text.find('*/', start + 2)
+            if end == -1:
+                end = length
+                if unclosed_comments is not None:
+                    unclosed_comments.append(start)
+            else:
+                end += 2
+            # a block comment still separates tokens: "1/* */2" must not become "12"
+            # 块注释仍起分隔作用："1/* */2" 不能变成 "12"
+            keep = ' '
+
+        out.append(text[copy_from:start])
+        out.append(keep)
+        out_offset = start - removed + len(keep)
+        removed += end - start - len(keep)
+        pmap.add_removal(out_offset, removed)
+        copy_from = pos = end
+
+    if not out:
+        return text, pmap
+    out.append(text[copy_from:])
+    return ''.join(out), pmap
 
-    return ''.join(out_chars)
+def strip_line_comments(text: str) -> str:
+    """
+    Remove // and /* */ comments that are outside of strings (移除字符串外部的 // 与 /* */ 注释).
+    Keeps newlines after // comments (保留 // 注释后的换行符).
+    """
+    return preprocess_json(text, strip_comments=True, strip_trailing_commas=False)[0]
 
 def remove_trailing_commas(text: str) -> str:
     """
     Remove trailing commas before '}' or ']' while ignoring commas inside strings.
     在不影响字符串中的逗号的前提下，移除 '}' 或 ']' 之前的多余逗号。
     """
-    out_chars = []
-    i = 0
-    in_string = False
-    escape = False
-    length = len(text)
+    return preprocess_json(text, strip_comments=False, strip_trailing_commas=True)[0]
 
-    while i < length:
-        ch = text[i]
-
-        if in_string:
-            out_chars.append(ch)
-            if escape:
-                escape = False
-            elif ch == '\\':
-                escape = True
-            elif ch == '"':
-                in_string = False
-            i += 1
+# ---------- SMAPI JSON parser (SMAPI JSON 解析器) ----------
+
+# JSON whitespace, optionally with whole comments (JSON 空白，可选地包含完整注释)
+_WS = r'[ \t\r\n]*'
+_WS_COMMENTS = r'(?:[ \t\r\n]+|//[^\r\n]*|/\*(?:[^*]|\*(?!/))*\*/)*'
+_PLAIN_STRING = r'"([^"\\\x00-\x1f]*)"'
+
+def _build_token_re(ws: str, fused: bool):
+    """
+    One token per match; m.lastindex tells the token kind. The fused form also reads
+    '"key":' and ', "key":' as single tokens, which cuts the tokens of a typical file by a third.
+    每次匹配一个记号，m.lastindex 即记号类型；融合形式把 '"key":' 与 ', "key":' 当作单个记号，
+    可使典型文件的记号数减少约三分之一。
+    """
+    if fused:
+        # plain whitespace only inside fused tokens; a comment there falls back to single tokens
+        # 融合记号内部只允许普通空白；其中若有注释则退回逐个记号读取
+        keys = (r',' + _WS + _PLAIN_STRING + _WS + r':'   # 1 comma + key + colon
+                r'|' + _PLAIN_STRING + _WS + r':')        # 2 key + colon
+    else:
+        keys = r'(?!)()()'                              # same group numbers, never matches
+    return re.compile(
+        ws + r'(?:' + keys +
+        r'|([{\[])'                                                         # 3 open
+        r'|([}\]])'                                                         # 4 close
+        r'|(,)'                                                             # 5 comma
+        r'|(:)'                                                             # 6 colon
+        r'|' + _PLAIN_STRING +                                              # 7 string without escapes
+        r'|(-?(?:0|[1-9]\d*)(?:\.\d+)?[eE][-+]?\d+|-?(?:0|[1-9]\d*)\.\d+)'  # 8 float
+        r'|(-?(?:0|[1-9]\d*))'                                              # 9 int
+        r'|(true|false|null|NaN|-?Infinity)'                                # 10 literal
+        r'|(")'                                                             # 11 string to decode
+        r'|(/[/*]?|[^\s{}\[\]:,"/]+|.)'                                     # 12 anything else
+        r'|($))',                                                           # 13 end of text
+        re.S
+    )
+
+# (allow_comments, fused) -> compiled token regex (编译好的记号正则)
+_TOKEN_RES = {
+    (allow, fused): _build_token_re(_WS_COMMENTS if allow else _WS, fused)
+    for allow in (False, True) for fused in (False, True)
+}
+(_T_NEXT_KEY, _T_KEY, _T_OPEN, _T_CLOSE, _T_COMMA, _T_COLON, _T_STRING, _T_FLOAT,
+ _T_INT, _T_LITERAL, _T_QUOTE, _T_OTHER, _T_END) = range(1, 14)
+_COMMENT_RE = re.compile(r'//[^\r\n]*|/\*(?:[^*]|\*(?!/))*\*/')
+_LOOSE_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"', re.S)
+_LITERALS = {
+    "true": True, "false": False, "null": None,
+    "NaN": float("nan"), "Infinity": float("inf"), "-Infinity": float("-inf"),
+}
+
+# parser states (解析器状态)
+(_S_VALUE, _S_ARRAY_FIRST, _S_ARRAY_NEXT, _S_OBJ_FIRST, _S_OBJ_NEXT,
+ _S_COLON, _S_AFTER, _S_END) = range(8)
+_EXPECTING = {
+    _S_VALUE: "Expecting value",
+    _S_ARRAY_FIRST: "Expecting value",
+    _S_ARRAY_NEXT: "Expecting value",
+    _S_OBJ_FIRST: "Expecting property name enclosed in double quotes",
+    _S_OBJ_NEXT: "Expecting property name enclosed in double quotes",
+    _S_COLON: "Expecting ':' delimiter",
+    _S_AFTER: "Expecting ',' delimiter",
+    _S_END: "Extra data",
+}
+_NO_KEY = object()  # value whose key was missing; parsed but not stored (缺少键名的值：解析但不保存)
+
+MAX_SYNTAX_ERRORS = 20
+
+@dataclass
+class ParseResult:
+    value: Any = None
+    errors: List[Tuple[int, str]] = field(default_factory=list)          # (offset, message)
+    # (key, offset, path) of every repeated key, e.g. ("Target", 812, "Changes[3].Target")
+    duplicate_keys: List[Tuple[str, int, str]] = field(default_factory=list)
+    trailing_commas: List[int] = field(default_factory=list)             # comma offsets
+
+def parse_smapi_json(
+    text: str,
+    allow_comments: bool = True,
+    max_errors: int = MAX_SYNTAX_ERRORS
+) -> ParseResult:
+    """
+    Parse SMAPI's JSON dialect: comments, trailing commas, duplicate keys (解析 SMAPI 的 JSON 方言).
+
+    Well-formed files take the fast path: one regex pass that drops comments and trailing commas,
+    then the C decoder with a hook that only notices duplicate keys. Anything else (syntax errors,
+    duplicate keys, a comma right after '{' or '[', an unclosed /* comment) is handed to the
+    dialect parser, which reports every problem with its exact offset.
+    格式正确的文件走快速路径：一次正则遍历去掉注释和多余逗号，再交给 C 解码器（钩子只检测重复键）。
+    其余情况（语法错误、重复键、紧跟 '{' 或 '[' 的逗号、未闭合的 /* 注释）交给方言解析器，逐一报告问题及其精确位置。
+    """
+    commas: List[int] = []
+    unclosed: List[int] = []
+    stripped, _ = preprocess_json(
+        text, strip_comments=allow_comments, strip_trailing_commas=True, comma_offsets=commas,
+        unclosed_comments=unclosed
+    )
+    if unclosed:
+        # the dialect parser reports it as "Unterminated comment" (由方言解析器报告“注释未闭合”)
+        return _parse_dialect(text, allow_comments, max_errors)
+    has_duplicates = False
+
+    def hook(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        nonlocal has_duplicates
+        obj = dict(pairs)
+        if len(obj) != len(pairs):
+            has_duplicates = True
+        return obj
+
+    try:
+        value = json.loads(stripped, object_pairs_hook=hook)
+    except (json.JSONDecodeError, RecursionError):
+        return _parse_dialect(text, allow_comments, max_errors)
+    if has_duplicates or any(_follows_opener(text, c) for c in commas):
+        return _parse_dialect(text, allow_comments, max_errors)
+    return ParseResult(value=value, trailing_commas=commas)
+
+def _follows_opener(text: str, comma: int) -> bool:
+    """True if only whitespace/comments separate the comma from a preceding '{' or '['."""
+    i = comma - 1
+    while i >= 0 and text[i] in " \t\r\n":
+        i -= 1
+    # a comment just before the comma: let the dialect parser decide (逗号前是注释：交给方言解析器判断)
+    return i >= 0 and text[i] in "{[/"
+
+def _key_path(stack: List[Tuple[Any, bool, Any]], key: str) -> str:
+    """
+    JSON path of key in the innermost open object, built from the parser stack only when a
+    duplicate is found (仅在发现重复键时根据解析栈生成键的 JSON 路径).
+    """
+    parts: List[str] = []
+    for parent, parent_is_obj, parent_key in stack:
+        if parent is None:
+            continue
+        if parent_is_obj:
+            name = parent_key if isinstance(parent_key, str) else "?"
+            parts.append(f".{name}" if parts else name)
+        else:
+            # the open container was appended last (当前容器是最后追加的元素)
+            parts.append(f"[{len(parent) - 1}]")
+    parts.append(f".{key}" if parts else key)
+    return "".join(parts)
+
+def _parse_dialect(text: str, allow_comments: bool, max_errors: int) -> ParseResult:
+    """
+    Parse SMAPI's JSON dialect token by token (逐个记号解析 SMAPI 的 JSON 方言).
+
+    - // and /* */ comments are skipped when allow_comments=True, otherwise reported
+      （allow_comments=True 时跳过注释，否则记为错误）
+    - trailing commas before '}' / ']' are accepted and their offsets recorded
+      （接受 '}' / ']' 前的多余逗号，并记录其位置）
+    - duplicate keys are recorded as they are read, with their JSON path; the last value
+      wins like json.loads（读取时记录重复键及其 JSON 路径；与 json.loads 一样保留最后一个值）
+    - after a syntax error the parser recovers and keeps going, so every error is
+      reported (up to max_errors), not only the first
+      （遇到语法错误后会恢复并继续解析，因此会报告全部错误，最多 max_errors 个）
+
+    All offsets refer to the original text (所有位置都是原始文本中的偏移).
+    """
+    res = ParseResult()
+    errors = res.errors
+    duplicate_keys = res.duplicate_keys
+    trailing_commas = res.trailing_commas
+    match = _TOKEN_RES[allow_comments, True].match
+    match_plain = _TOKEN_RES[allow_comments, False].match
+    text_len = len(text)
+
+    stack: List[Tuple[Any, bool, Any]] = []  # enclosing (container, is_obj, key)
+    container: Any = None
+    is_obj = False
+    key: Any = None
+    state = _S_VALUE
+    pos = 0
+    comma_pos = 0
+
+    while len(errors) < max_errors:
+        m = match(text, pos)
+        kind = m.lastindex
+        if kind == _T_NEXT_KEY:
+            if state == _S_AFTER and is_obj:
+                key = m.group(_T_NEXT_KEY)
+                if key in container:
+                    duplicate_keys.append((key, m.start(_T_NEXT_KEY) - 1, _key_path(stack, key)))
+                state = _S_VALUE
+                pos = m.end()
+                continue
+            # unexpected here: read the pieces one by one (此处不应出现：逐个记号读取)
+            m = match_plain(text, pos)
+            kind = m.lastindex
+        elif kind == _T_KEY:
+            if state == _S_OBJ_FIRST or state == _S_OBJ_NEXT:
+                key = m.group(_T_KEY)
+                if key in container:
+                    duplicate_keys.append((key, m.start(_T_KEY) - 1, _key_path(stack, key)))
+                state = _S_VALUE
+                pos = m.end()
+                continue
+            m = match_plain(text, pos)
+            kind = m.lastindex
+        pos = m.end()
+
+        if kind == _T_STRING:
+            value = m.group(_T_STRING)
+            if state == _S_OBJ_NEXT or state == _S_OBJ_FIRST:
+                if value in container:
+                    duplicate_keys.append((value, m.start(_T_STRING) - 1, _key_path(stack, value)))
+                key = value
+                state = _S_COLON
+                continue
+        elif kind == _T_COLON:
+            if state == _S_COLON:
+                state = _S_VALUE
+            else:
+                errors.append((pos - 1, _EXPECTING[state]))
+                if state == _S_END:
+                    break
+            continue
+        elif kind == _T_COMMA:
+            if state == _S_AFTER:
+                state = _S_OBJ_NEXT if is_obj else _S_ARRAY_NEXT
+                comma_pos = pos - 1
+            else:
+                errors.append((pos - 1, _EXPECTING[state]))
+                if state == _S_END:
+                    break
+            continue
+        elif kind == _T_CLOSE:
+            start = pos - 1
+            closes_obj = text[start] == "}"
+            if container is None:
+                errors.append((start, _EXPECTING[state]))
+                if state == _S_END:
+                    break
+                continue
+            if closes_obj != is_obj:
+                if not any(frame_is_obj == closes_obj for _, frame_is_obj, _ in stack[1:]):
+                    # stray closer: skip it (多余的闭合符号：跳过)
+                    errors.append((start, f"Expecting '{'}' if is_obj else ']'}'"))
+                    continue
+                # a container was left open: close it and everything up to the match
+                # 有容器未闭合：一直关闭到匹配的容器
+                errors.append((start, f"Expecting '{'}' if is_obj else ']'}'"))
+                while is_obj != closes_obj:
+                    container, is_obj, key = stack.pop()
+            elif state == _S_OBJ_NEXT or state == _S_ARRAY_NEXT:
+                trailing_commas.append(comma_pos)
+            elif state == _S_COLON or state == _S_VALUE:
+                errors.append((start, _EXPECTING[state]))
+            container, is_obj, key = stack.pop()
+            state = _S_END if container is None else _S_AFTER
+            continue
+        elif kind == _T_INT:
+            value = int(m.group(_T_INT))
+        elif kind == _T_FLOAT:
+            value = float(m.group(_T_FLOAT))
+        elif kind == _T_LITERAL:
+            value = _LITERALS[m.group(_T_LITERAL)]
+        elif kind == _T_OPEN:
+            value = {} if text[pos - 1] == "{" else []
+        elif kind == _T_QUOTE:
+            start = pos - 1
+            try:
+                value, pos = scanstring(text, pos, True)
+            except json.JSONDecodeError as e:
+                errors.append((e.pos, e.msg))
+                loose = _LOOSE_STRING_RE.match(text, start)
+                if loose is None:
+                    break  # unterminated: the rest of the file is inside the string (未闭合的字符串)
+                pos = loose.end()
+                value = text[start + 1:pos - 1]
+            if state == _S_OBJ_NEXT or state == _S_OBJ_FIRST:
+                if value in container:
+                    duplicate_keys.append((value, start, _key_path(stack, value)))
+                key = value
+                state = _S_COLON
+                continue
+        elif kind == _T_END:
+            if state != _S_END:
+                errors.append((text_len, _EXPECTING[state]))
+            break
+        else:
+            start = m.start(_T_OTHER)
+            if text.startswith(("//", "/*"), start):
+                comment = _COMMENT_RE.match(text, start)
+                if comment is None:
+                    errors.append((start, "Unterminated comment"))
+                    break
+                if not allow_comments:
+                    errors.append((start, "Comments are not allowed"))
+                pos = comment.end()
+                continue
+            errors.append((start, _EXPECTING[state]))
+            if state == _S_END:
+                break
+            if is_obj and (state == _S_OBJ_FIRST or state == _S_OBJ_NEXT or state == _S_AFTER):
+                # read it as an unquoted key (当作缺少引号的键名)
+                key = _NO_KEY
+                state = _S_COLON
+            else:
+                # read it as a bad value (当作无效的值)
+                state = _S_AFTER if container is not None else _S_END
             continue
 
-        if ch == '"':
-            in_string = True
-            out_chars.append(ch)
-            i += 1
+        # a value (or an opening bracket) was read (读取到一个值或左括号)
+        if state != _S_VALUE and state != _S_ARRAY_FIRST and state != _S_ARRAY_NEXT:
+            errors.append((m.start(kind) - (kind == _T_STRING), _EXPECTING[state]))
+            if state == _S_END:
+                break
+            if is_obj and state != _S_COLON:
+                if kind != _T_OPEN:
+                    # read it as the next key, e.g. after a missing comma (当作下一个键名，例如缺少逗号时)
+                    if kind == _T_STRING or kind == _T_QUOTE:
+                        if value in container:
+                            duplicate_keys.append((
+                                value, m.start(kind) - (kind == _T_STRING), _key_path(stack, value)
+                            ))
+                        key = value
+                    else:
+                        key = _NO_KEY
+                    state = _S_COLON
+                    continue
+                key = _NO_KEY
+        if container is None:
+            res.value = value
+            state = _S_END
+        elif is_obj:
+            if key is not _NO_KEY:
+                container[key] = value
+            state = _S_AFTER
+        else:
+            container.append(value)
+            state = _S_AFTER
+        if kind == _T_OPEN:
+            stack.append((container, is_obj, key))
+            container = value
+            is_obj = type(value) is dict
+            state = _S_OBJ_FIRST if is_obj else _S_ARRAY_FIRST
+
+    return res
+
+_PATH_BREAK_RE = re.compile(r'[.\[]')
+
+def locate_json_paths(text: str, paths: Iterable[str], allow_comments: bool = True) -> Dict[str, int]:
+    """
+    Offsets in text of the values at paths like "Changes[3].Target" ("" is the root value).
+    查找 "Changes[3].Target" 这类路径所指的值在文本中的位置（"" 表示根值）。
+
+    One token walk for all paths; containers that no path goes through are skipped by depth
+    counting only. Keys match case-insensitively like SMAPI and the last duplicate wins, like
+    the parser. Paths that are not found are left out of the result. Only called for files that
+    have issues to place, so clean files pay nothing for exact locations.
+    所有路径共用一次记号遍历；不经过任何路径的容器只计算层级并跳过。键名与 SMAPI 一样不区分大小写，
+    重复键以最后一个为准（与解析器一致）。找不到的路径不会出现在结果中。
+    仅对需要定位问题的文件调用，因此正常文件无需为精确定位付出任何代价。
+    """
+    wanted = {p.lower(): p for p in paths}
+    # containers on the way to a wanted path (通往目标路径途中的容器)
+    through = {""}
+    for low in wanted:
+        through.update(low[:m.start()] for m in _PATH_BREAK_RE.finditer(low))
+
+    found: Dict[str, int] = {}
+    match = _TOKEN_RES[allow_comments, False].match
+    frames: List[list] = []  # open containers on a wanted path: [path, is_obj, index]
+    skip_depth = 0           # nesting inside a container that is skipped (位于被跳过容器内的层级)
+    value_path: Optional[str] = ""  # path of the next value, None between members
+    expect_key = False
+    pos = 0
+    while True:
+        m = match(text, pos)
+        kind = m.lastindex
+        pos = m.end()
+        if kind == _T_END or kind == _T_OTHER:
+            break
+        if kind == _T_QUOTE:
+            try:
+                string, pos = scanstring(text, pos, True)
+            except json.JSONDecodeError:
+                break
+        elif kind == _T_STRING:
+            string = m.group(_T_STRING)
+        if skip_depth:
+            if kind == _T_OPEN:
+                skip_depth += 1
+            elif kind == _T_CLOSE:
+                skip_depth -= 1
+            continue
+        if kind == _T_CLOSE:
+            if len(frames) <= 1:
+                break
+            frames.pop()
+            value_path = None
+            continue
+        if kind == _T_COMMA:
+            if frames:
+                frame = frames[-1]
+                if frame[1]:
+                    expect_key = True
+                else:
+                    frame[2] += 1
+                    value_path = f"{frame[0]}[{frame[2]}]"
+            continue
+        if kind == _T_COLON:
+            continue
+        if expect_key:
+            expect_key = False
+            if kind == _T_STRING or kind == _T_QUOTE:
+                parent = frames[-1][0]
+                value_path = f"{parent}.{string.lower()}" if parent else string.lower()
             continue
+        if value_path is None:
+            continue
+        start = m.start(kind) - (kind == _T_STRING)
+        if value_path in wanted:
+            found[wanted[value_path]] = start
+        if kind == _T_OPEN and value_path in through:
+            is_obj = text[start] == "{"
+            frames.append([value_path, is_obj, 0])
+            expect_key = is_obj
+            value_path = None if is_obj else f"{value_path}[0]"
+        else:
+            if kind == _T_OPEN:
+                skip_depth = 1
+            value_path = None
+    return found
+
+# ---------- Streaming validation for large files (大文件流式校验) ----------
+
+# files at least this large are checked by stream_check_json (达到此大小的文件使用流式校验)
+STREAM_THRESHOLD_BYTES = 16 * 1024 * 1024
+STREAM_CHUNK_BYTES = 1024 * 1024
+# Json.NET, which SMAPI uses, rejects deeper nesting by default (SMAPI 使用的 Json.NET 默认拒绝更深的嵌套)
+MAX_NESTING_DEPTH = 64
+# trailing commas / duplicate keys listed per file; the rest are only counted (每个文件列出的上限，其余只计数)
+MAX_STREAM_REPORTS = 100
+# a token must end this far before the end of the buffer, or more text is read first, so a token
+# is never judged by half of it (e.g. "1" of "1.5e3")
+# 记号必须在缓冲区末尾之前至少这么多字符处结束，否则先读入更多文本，避免只凭半个记号判断（如 "1.5e3" 中的 "1"）
+_STREAM_MARGIN = 64
 
-        if ch == ',':
-            # look ahead: only whitespace then } or ] → treat as trailing comma
-            # 向前查看：若之后只有空白再跟 '}' 或 ']' → 视为多余逗号
-            j = i + 1
-            while j < length and text[j] in ' \t\r\n':
-                j += 1
-            if j < length and text[j] in '}]':
-                # skip this comma (跳过这个逗号)
-                i += 1
+@dataclass
+class StreamCheck:
+    content_hash: str = ""
+    errors: List[Tuple[int, int, str]] = field(default_factory=list)            # (line, column, message)
+    trailing_commas: List[Tuple[int, int]] = field(default_factory=list)        # (line, column)
+    trailing_comma_count: int = 0
+    duplicate_keys: List[Tuple[str, str, int, int]] = field(default_factory=list)  # (key, path, line, column)
+    duplicate_key_count: int = 0
+    max_depth: int = 0
+    too_deep: Optional[Tuple[int, int]] = None  # first place nested deeper than allowed (首个超出嵌套上限的位置)
+
+class _LineTracker:
+    """
+    Line/column of offsets in a sliding buffer, without keeping the text already dropped.
+    在滑动缓冲区中计算行列号，无需保留已丢弃的文本。
+    """
+
+    def __init__(self):
+        self.base = 0        # absolute offset of buffer[0] (缓冲区起点的绝对偏移)
+        self.base_line = 1
+        self.base_line_start = 0
+        self.cursor = 0      # last position looked up, relative to the buffer (上次查询的位置)
+        self.line = 1
+        self.line_start = 0
+
+    def line_col(self, buf: str, rel: int) -> Tuple[int, int]:
+        if rel < self.cursor:
+            self.cursor, self.line, self.line_start = 0, self.base_line, self.base_line_start
+        newlines = buf.count("\n", self.cursor, rel)
+        if newlines:
+            self.line += newlines
+            self.line_start = self.base + buf.rindex("\n", self.cursor, rel) + 1
+        self.cursor = rel
+        return self.line, self.base + rel - self.line_start + 1
+
+    def drop(self, buf: str, keep: int):
+        """buf[:keep] is about to be discarded (buf[:keep] 即将被丢弃)."""
+        self.line_col(buf, keep)
+        self.base += keep
+        self.base_line, self.base_line_start = self.line, self.line_start
+        self.cursor = 0
+
+def _stream_path(frames: List[list], key: str) -> str:
+    parts: List[str] = []
+    for is_obj, _, where in frames[:-1]:
+        if is_obj:
+            name = where if isinstance(where, str) else "?"
+            parts.append(f".{name}" if parts else name)
+        else:
+            parts.append(f"[{where}]")
+    parts.append(f".{key}" if parts else key)
+    return "".join(parts)
+
+# keys up to this length are kept as they are, longer ones as a digest (不超过此长度的键原样保存，更长的保存摘要)
+_STREAM_KEY_INLINE = 64
+
+def _stream_key(key: str) -> Any:
+    """
+    What the stream check keeps of a key: the key itself if short, else a 128-bit digest, so memory
+    per key stays bounded and, unlike hash(), equal entries mean equal keys.
+    流式检查为键保存的内容：短键原样保存，长键保存 128 位摘要；
+    每个键的内存有上限，且与 hash() 不同，条目相等即键相等。
+    """
+    if len(key) <= _STREAM_KEY_INLINE:
+        return key
+    return hashlib.blake2b(key.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+def stream_check_json(
+    path: str,
+    allow_comments: bool = True,
+    max_depth: int = MAX_NESTING_DEPTH,
+    max_errors: int = MAX_SYNTAX_ERRORS,
+    chunk_bytes: int = STREAM_CHUNK_BYTES
+) -> StreamCheck:
+    """
+    Check a JSON file of any size without building its value (校验任意大小的 JSON 文件，不构建对象树).
+
+    Reads the file in chunks and runs the same tokens and states as the dialect parser, but only
+    keeps what the checks need: one frame per open container, and for objects each key whose
+    value was read, long keys as a digest (duplicate detection, counted like the dialect parser).
+    Memory grows with nesting depth and the widest object, not with the file size. Reports syntax errors, trailing commas, duplicate keys with their
+    JSON path, and nesting deeper than max_depth, all with exact line/column; the content hash
+    for the scan cache is computed in the same read.
+    分块读取文件，使用与方言解析器相同的记号和状态，但只保留检查所需的信息：每个未闭合的容器一帧，
+    对象只保存已读取到值的键名（长键保存摘要；用于检测重复键，与方言解析器的判定一致）。
+    内存随嵌套深度与最宽的对象增长，而不随文件大小增长。
+    报告语法错误、多余逗号、带 JSON 路径的重复键以及超过 max_depth 的嵌套，均附精确行列；
+    扫描缓存所需的内容哈希在同一次读取中计算。
+    """
+    res = StreamCheck()
+    errors = res.errors
+    hasher = _content_hasher()
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    match = _TOKEN_RES[allow_comments, True].match
+    match_plain = _TOKEN_RES[allow_comments, False].match
+    lines = _LineTracker()
+
+    frames: List[list] = []  # open containers: [is_obj, kept keys, current key / index]
+    is_obj = False
+    keys: Optional[set] = None
+    pending: Any = None  # kept form of the key waiting for its value (等待值的键)
+    state = _S_VALUE
+    buf = ""
+    eof = False
+    need_more = True
+    pos = token_from = 0
+    comma_pos = 0
+
+    def add_key(key: str, rel: int):
+        # the key only counts once its value is read, like the dialect parser; a member abandoned
+        # by error recovery leaves no key behind (键在读取到值之后才计入，与方言解析器一致；
+        # 错误恢复时放弃的成员不会留下键)
+        nonlocal pending
+        pending = _stream_key(key)
+        if pending in keys:
+            res.duplicate_key_count += 1
+            if len(res.duplicate_keys) < MAX_STREAM_REPORTS:
+                res.duplicate_keys.append((key, _stream_path(frames, key), *lines.line_col(buf, rel)))
+        frames[-1][2] = key
+
+    with open(path, "rb") as f:
+        while True:
+            if need_more:
+                # keep a comma that may still turn out to be trailing (保留可能是多余逗号的那个逗号)
+                keep = comma_pos if (state == _S_OBJ_NEXT or state == _S_ARRAY_NEXT) else token_from
+                lines.drop(buf, keep)
+                chunk = ""
+                while not chunk and not eof:
+                    raw = f.read(chunk_bytes)
+                    hasher.update(raw)
+                    eof = not raw
+                    chunk = decoder.decode(raw, final=eof)
+                buf = buf[keep:] + chunk
+                pos = token_from - keep
+                comma_pos -= keep
+                limit = len(buf) - _STREAM_MARGIN
+                need_more = False
+            if len(errors) >= max_errors:
+                break
+
+            token_from = pos
+            m = match(buf, pos)
+            if m.end() > limit and not eof:
+                need_more = True
                 continue
-            else:
-                out_chars.append(ch)
-                i += 1
+            kind = m.lastindex
+            if kind == _T_NEXT_KEY:
+                if state == _S_AFTER and is_obj:
+                    add_key(m.group(_T_NEXT_KEY), m.start(_T_NEXT_KEY) - 1)
+                    state = _S_VALUE
+                    pos = m.end()
+                    continue
+                m = match_plain(buf, pos)
+                kind = m.lastindex
+            elif kind == _T_KEY:
+                if state == _S_OBJ_FIRST or state == _S_OBJ_NEXT:
+                    add_key(m.group(_T_KEY), m.start(_T_KEY) - 1)
+                    state = _S_VALUE
+                    pos = m.end()
+                    continue
+                m = match_plain(buf, pos)
+                kind = m.lastindex
+            pos = m.end()
+
+            if kind == _T_STRING:
+                if state == _S_OBJ_NEXT or state == _S_OBJ_FIRST:
+                    add_key(m.group(_T_STRING), m.start(_T_STRING) - 1)
+                    state = _S_COLON
+                    continue
+            elif kind == _T_COLON:
+                if state == _S_COLON:
+                    state = _S_VALUE
+                else:
+                    errors.append((*lines.line_col(buf, pos - 1), _EXPECTING[state]))
+                    if state == _S_END:
+                        break
+                continue
+            elif kind == _T_COMMA:
+                if state == _S_AFTER:
+                    state = _S_OBJ_NEXT if is_obj else _S_ARRAY_NEXT
+                    comma_pos = pos - 1
+                else:
+                    errors.append((*lines.line_col(buf, pos - 1), _EXPECTING[state]))
+                    if state == _S_END:
+                        break
                 continue
+            elif kind == _T_CLOSE:
+                start = pos - 1
+                closes_obj = buf[start] == "}"
+                if not frames:
+                    errors.append((*lines.line_col(buf, start), _EXPECTING[state]))
+                    if state == _S_END:
+                        break
+                    continue
+                if closes_obj != is_obj:
+                    errors.append((*lines.line_col(buf, start), f"Expecting '{'}' if is_obj else ']'}'"))
+                    if not any(frame[0] == closes_obj for frame in frames[:-1]):
+                        continue  # stray closer: skip it (多余的闭合符号：跳过)
+                    # a container was left open: close up to the match (有容器未闭合：一直关闭到匹配的容器)
+                    while frames[-1][0] != closes_obj:
+                        frames.pop()
+                elif state == _S_OBJ_NEXT or state == _S_ARRAY_NEXT:
+                    res.trailing_comma_count += 1
+                    if len(res.trailing_commas) < MAX_STREAM_REPORTS:
+                        res.trailing_commas.append(lines.line_col(buf, comma_pos))
+                elif state == _S_COLON or state == _S_VALUE:
+                    errors.append((*lines.line_col(buf, start), _EXPECTING[state]))
+                frames.pop()
+                pending = None  # a key left without a value (没有值的键)
+                if frames:
+                    is_obj, keys = frames[-1][0], frames[-1][1]
+                    state = _S_AFTER
+                else:
+                    state = _S_END
+                continue
+            elif kind == _T_QUOTE:
+                start = pos - 1
+                try:
+                    value, pos = scanstring(buf, pos, True)
+                    if pos > limit and not eof:
+                        pos = token_from
+                        need_more = True
+                        continue
+                except json.JSONDecodeError as e:
+                    loose = _LOOSE_STRING_RE.match(buf, start)
+                    if not eof and (loose is None or loose.end() > limit):
+                        pos = token_from
+                        need_more = True
+                        continue
+                    errors.append((*lines.line_col(buf, e.pos), e.msg))
+                    if loose is None:
+                        break  # unterminated: the rest of the file is inside the string (未闭合的字符串)
+                    pos = loose.end()
+                    value = buf[start + 1:pos - 1]
+                if state == _S_OBJ_NEXT or state == _S_OBJ_FIRST:
+                    add_key(value, start)
+                    state = _S_COLON
+                    continue
+            elif kind == _T_END:
+                if state != _S_END:
+                    errors.append((*lines.line_col(buf, len(buf)), _EXPECTING[state]))
+                break
+            elif kind == _T_OTHER:
+                start = m.start(_T_OTHER)
+                if buf.startswith(("//", "/*"), start):
+                    comment = _COMMENT_RE.match(buf, start)
+                    if not eof and (comment is None or comment.end() > limit):
+                        pos = token_from
+                        need_more = True
+                        continue
+                    if comment is None:
+                        errors.append((*lines.line_col(buf, start), "Unterminated comment"))
+                        break
+                    if not allow_comments:
+                        errors.append((*lines.line_col(buf, start), "Comments are not allowed"))
+                    pos = comment.end()
+                    continue
+                errors.append((*lines.line_col(buf, start), _EXPECTING[state]))
+                if state == _S_END:
+                    break
+                if is_obj and (state == _S_OBJ_FIRST or state == _S_OBJ_NEXT or state == _S_AFTER):
+                    frames[-1][2] = pending = None  # read it as an unquoted key (当作缺少引号的键名)
+                    state = _S_COLON
+                else:
+                    state = _S_AFTER if frames else _S_END
+                continue
+
+            # a value (or an opening bracket) was read (读取到一个值或左括号)
+            if state != _S_VALUE and state != _S_ARRAY_FIRST and state != _S_ARRAY_NEXT:
+                start = m.start(kind) - (kind == _T_STRING)
+                errors.append((*lines.line_col(buf, start), _EXPECTING[state]))
+                if state == _S_END:
+                    break
+                if is_obj and state != _S_COLON:
+                    if kind != _T_OPEN:
+                        # read it as the next key, e.g. after a missing comma (当作下一个键名，例如缺少逗号时)
+                        if kind == _T_STRING:
+                            add_key(m.group(_T_STRING), start)
+                        elif kind == _T_QUOTE:
+                            add_key(value, start)
+                        else:
+                            frames[-1][2] = pending = None
+                        state = _S_COLON
+                        continue
+                    frames[-1][2] = pending = None
+            if frames and not is_obj:
+                frames[-1][2] += 1
+            elif pending is not None:
+                keys.add(pending)
+                pending = None
+            state = _S_AFTER if frames else _S_END
+            if kind == _T_OPEN:
+                is_obj = buf[pos - 1] == "{"
+                keys = set() if is_obj else None
+                frames.append([is_obj, keys, None if is_obj else -1])
+                state = _S_OBJ_FIRST if is_obj else _S_ARRAY_FIRST
+                if len(frames) > res.max_depth:
+                    res.max_depth = len(frames)
+                    if res.max_depth > max_depth and res.too_deep is None:
+                        res.too_deep = lines.line_col(buf, pos - 1)
+
+        # hash the part of the file not read yet (对尚未读取的部分计算哈希)
+        for raw in iter(lambda: f.read(chunk_bytes), b""):
+            hasher.update(raw)
+    res.content_hash = hasher.hexdigest()
+    return res
+
+# ---------- Formatter (格式化) ----------
+
+@dataclass(frozen=True)
+class FormatStyle:
+    """
+    Layout for format_json (format_json 的排版方式). indent / eol = None keep what the file
+    already uses; sort_keys orders object keys case-insensitively, and each member's comments
+    move with it.
+    indent / eol 为 None 时沿用文件现有的风格；sort_keys 按键名排序（不区分大小写），成员的注释随之移动。
+    """
+    indent: Optional[str] = None  # e.g. "  ", "    ", "\t"
+    eol: Optional[str] = None     # "\n" or "\r\n"
+    sort_keys: bool = False
+
+    def key(self) -> str:
+        """Short text for the scan cache options key (用于扫描缓存选项键)."""
+        return json.dumps([self.indent, self.eol, self.sort_keys])
+
+# tokens with comments kept (保留注释的记号)
+_FMT_TOKEN_RE = re.compile(
+    r'[ \t\r\n]*(?:'
+    r'(//[^\r\n]*|/\*(?:[^*]|\*(?!/))*\*/)'  # 1 comment
+    r'|([{\[])'                              # 2 open
+    r'|([}\]])'                              # 3 close
+    r'|(,)'                                  # 4 comma
+    r'|(:)'                                  # 5 colon
+    r'|("(?:[^"\\\r\n]|\\.)*")'             # 6 string, kept verbatim (原样保留)
+    r'|([^\s{}\[\]:,"/]+)'                    # 7 number / literal
+    r'|($))',                                # 8 end of text
+    re.S
+)
+_F_COMMENT, _F_OPEN, _F_CLOSE, _F_COMMA, _F_COLON, _F_STRING, _F_WORD, _F_END = range(1, 9)
+
+@dataclass
+class _Comment:
+    text: str
+    own_line: bool  # started a line in the original (原文中位于行首)
+    blank_before: bool = False  # a blank line came before it (之前有空行)
+
+@dataclass
+class _Member:
+    value: Any                                 # token text or _Container (记号文本或容器)
+    key: Optional[str] = None                  # key token, object members only (键名记号，仅对象成员)
+    before: Sequence[_Comment] = ()            # comments before the member (成员之前的注释)
+    inner: Sequence[_Comment] = ()             # comments between key and value (键与值之间)
+    after: Sequence[_Comment] = ()             # comments later on the value's line (值所在行之后)
+    blank_before: bool = False                 # a blank line came before its key / value (键或值之前有空行)
+
+@dataclass
+class _Container:
+    is_obj: bool
+    members: List[_Member]
+    multiline: bool              # spread over several lines in the original (原文中跨多行)
+    head: Sequence[_Comment]     # comments on the line of the opening bracket (左括号所在行的注释)
+    tail: Sequence[_Comment]     # comments after the last member (最后一个成员之后的注释)
+
+def _parse_cst(text: str) -> _Member:
+    """
+    Concrete syntax tree of a well-formed file: every token and comment verbatim, plus where
+    each comment sits and which items follow a blank line; other whitespace is dropped.
+    Raises ValueError otherwise.
+    为格式正确的文件构建具体语法树：所有记号与注释原样保留，并记录注释的位置以及哪些内容前有空行；
+    其余空白丢弃。否则抛出 ValueError。
+    """
+    tokens = []  # (kind, text, start, blank before); comments: (kind, text, own_line, blank before)
+    pos = 0
+    for m in _FMT_TOKEN_RE.finditer(text):
+        if m.start() != pos:
+            raise ValueError(f"unexpected character at offset {pos}")
+        kind = m.lastindex
+        blank = text.count("\n", pos, m.start(kind)) > 1
+        if kind == _F_COMMENT:
+            tok = m.group(kind)
+            tok = tok.rstrip() if tok.startswith("//") else tok.replace("\r\n", "\n")
+            tokens.append((kind, tok, text.find("\n", pos, m.start(kind)) != -1, blank))
+        else:
+            tokens.append((kind, m.group(kind), m.start(kind), blank))
+        if kind == _F_END:
+            break
+        pos = m.end()
+    else:
+        raise ValueError(f"unexpected character at offset {pos}")
+
+    i = 0
 
-        out_chars.append(ch)
+    def take_comments(same_line_only: bool) -> List[_Comment]:
+        nonlocal i
+        found = []
+        while tokens[i][0] == _F_COMMENT and not (same_line_only and tokens[i][2]):
+            found.append(_Comment(tokens[i][1], tokens[i][2], tokens[i][3]))
+            i += 1
+        return found
+
+    def parse_value() -> Any:
+        nonlocal i
+        kind, tok, start, _ = tokens[i]
         i += 1
+        if kind == _F_STRING or kind == _F_WORD:
+            return tok
+        if kind == _F_OPEN:
+            return parse_container(tok == "{", start)
+        raise ValueError(f"unexpected {tok!r}")
+
+    def parse_container(is_obj: bool, open_pos: int) -> _Container:
+        nonlocal i
+        head = take_comments(True) if tokens[i][0] == _F_COMMENT else ()
+        members: List[_Member] = []
+        more = True
+        while True:
+            before = take_comments(False) if tokens[i][0] == _F_COMMENT else ()
+            kind, tok, start, blank = tokens[i]
+            if kind == _F_CLOSE:
+                if (tok == "}") != is_obj:
+                    raise ValueError(f"unexpected {tok!r}")
+                i += 1
+                multiline = text.find("\n", open_pos, start) != -1
+                return _Container(is_obj, members, multiline, head, before)
+            if not more:
+                raise ValueError("missing ','")
+            key = None
+            inner = ()
+            if is_obj:
+                if kind != _F_STRING:
+                    raise ValueError(f"unexpected {tok!r}")
+                key = tok
+                i += 1
+                if tokens[i][0] == _F_COMMENT:
+                    inner = take_comments(False)
+                if tokens[i][0] != _F_COLON:
+                    raise ValueError("missing ':'")
+                i += 1
+                if tokens[i][0] == _F_COMMENT:
+                    inner = [*inner, *take_comments(False)]
+            value = parse_value()
+            after = take_comments(True) if tokens[i][0] == _F_COMMENT else ()
+            if tokens[i][0] == _F_COMMENT:
+                # comments on their own lines before the comma stay with this member (逗号前独占一行的注释仍属于本成员)
+                j = i
+                while tokens[j][0] == _F_COMMENT:
+                    j += 1
+                if tokens[j][0] == _F_COMMA:
+                    after = [*after, *take_comments(False)]
+            more = tokens[i][0] == _F_COMMA
+            if more:
+                i += 1
+                if tokens[i][0] == _F_COMMENT:
+                    after = [*after, *take_comments(True)]
+            members.append(_Member(value, key, before, inner, after, blank))
+
+    root = _Member(None, before=take_comments(False))
+    root.blank_before = tokens[i][3]
+    root.value = parse_value()
+    root.after = take_comments(False)
+    if tokens[i][0] != _F_END:
+        raise ValueError("extra data")
+    return root
+
+def _detect_indent(text: str, limit: int = 65536) -> str:
+    """
+    Indent unit of a file, read from lines that start a member (文件的缩进单位，取自成员起始行).
 
-    return ''.join(out_chars)
+    A member line at depth d indented by w spaces suggests a unit of w / d; the first depth-1
+    member decides, else the greatest common divisor over all depths. Default two spaces.
+    深度为 d、缩进 w 个空格的成员行表示单位为 w / d；以第一个深度为 1 的成员为准，否则取各深度的最大公约数。默认两个空格。
+    """
+    depth = 0
+    prev = _F_OPEN  # last token that is not a comment (上一个非注释记号)
+    unit = 0
+    for m in _FMT_TOKEN_RE.finditer(text, 0, limit):
+        kind = m.lastindex
+        if kind == _F_END:
+            break
+        start = m.start(kind)
+        if depth and kind != _F_CLOSE and kind != _F_COMMENT and (prev == _F_OPEN or prev == _F_COMMA):
+            line_start = text.rfind("\n", m.start(), start) + 1
+            if line_start:
+                lead = text[line_start:start]
+                if "\t" in lead:
+                    return "\t"
+                if lead:
+                    if depth == 1:
+                        return lead
+                    if len(lead) % depth == 0:
+                        unit = math.gcd(unit, len(lead) // depth)
+        if kind == _F_OPEN:
+            depth += 1
+        elif kind == _F_CLOSE:
+            depth -= 1
+        if kind != _F_COMMENT:
+            prev = kind
+    return " " * unit if unit else "  "
+
+def _detect_eol(text: str) -> str:
+    crlf = text.count("\r\n")
+    return "\r\n" if crlf and crlf * 2 >= text.count("\n") else "\n"
+
+def _emit_cst(root: _Member, indent: str, sort_keys: bool) -> str:
+    out: List[str] = []
+    write = out.append
+
+    def members_of(c: _Container) -> List[_Member]:
+        if sort_keys and c.is_obj:
+            return sorted(c.members, key=lambda m: json.loads(m.key).lower())
+        return c.members
+
+    def write_comment(cm: _Comment, pad: str, blank: bool = True):
+        # after a // comment the line is over: nothing more may follow on it (// 注释之后本行结束，不能再写入内容)
+        last = out[-1].lstrip() if out else ""
+        if cm.own_line or (last.startswith("//") and "\n" not in last):
+            # blank lines between groups are kept, as exactly one (分组之间的空行保留为一行)
+            write(("\n\n" if blank and cm.blank_before else "\n") + pad + cm.text)
+        else:
+            write(" " + cm.text)
+
+    def write_inner(m: _Member, pad: str):
+        for cm in m.inner:
+            # a // comment ends the line: the value goes on the next one (// 注释结束本行，值写在下一行)
+            write(cm.text + ("\n" + pad + indent if cm.text.startswith("//") else " "))
+
+    def emit(value: Any, level: int):
+        if isinstance(value, str):
+            write(value)
+            return
+        opener, closer = ("{", "}") if value.is_obj else ("[", "]")
+        members = members_of(value)
+        last = len(members) - 1
+        line_head = any(cm.text.startswith("//") for cm in value.head)
+        if not value.multiline or not (members or value.tail or line_head):
+            # one line in the original: stays on one line (原文为单行：保持单行)
+            write(opener)
+            if value.head:
+                write(" ".join(cm.text for cm in value.head) + (" " if members else ""))
+            for idx, m in enumerate(members):
+                for cm in m.before:
+                    write(cm.text + " ")
+                if m.key is not None:
+                    write(m.key + ": ")
+                write_inner(m, "")
+                emit(m.value, level)
+                if idx < last:
+                    write(",")
+                for cm in m.after:
+                    write(" " + cm.text)
+                if idx < last:
+                    write(" ")
+            for cm in value.tail:
+                write(" " + cm.text)
+            write(closer)
+            return
 
-def detect_duplicates_object_pairs_hook(issues: List[FileIssue], path: str):
+        pad = indent * (level + 1)
+        write(opener)
+        for cm in value.head:
+            write_comment(cm, pad)
+        for idx, m in enumerate(members):
+            # no blank line right after the opening bracket (左括号之后不留空行)
+            for n, cm in enumerate(m.before):
+                write_comment(cm, pad, bool(idx or n or value.head))
+            write("\n\n" + pad if m.blank_before and (idx or m.before or value.head) else "\n" + pad)
+            if m.key is not None:
+                write(m.key + ": ")
+            write_inner(m, pad)
+            emit(m.value, level + 1)
+            if idx < last:
+                write(",")
+            for cm in m.after:
+                write_comment(cm, pad)
+        for n, cm in enumerate(value.tail):
+            write_comment(cm, pad, bool(members or n or value.head))
+        write("\n" + indent * level + closer)
+
+    for n, cm in enumerate(root.before):
+        write(("\n" if n and cm.blank_before else "") + cm.text + "\n")
+    if root.before and root.blank_before:
+        write("\n")
+    emit(root.value, 0)
+    for cm in root.after:
+        write_comment(cm, "")
+    write("\n")
+    return "".join(out)
+
+def format_json(text: str, style: FormatStyle = FormatStyle()) -> str:
     """
-    object_pairs_hook that records duplicate keys while still returning a dict.
-    object_pairs_hook：记录重复键，同时返回字典。
+    Normalize the layout of a well-formed SMAPI JSON file without touching its content
+    （规范格式正确的 SMAPI JSON 文件的排版，不改动内容）.
+
+    Built on a concrete syntax tree, not json.dump: strings, numbers and comments are copied
+    verbatim and only the whitespace between tokens is rewritten (plus dropped trailing commas and,
+    with sort_keys, member order). One indent level per nesting level, one member per line,
+    '"key": value', one final newline. Blank lines that separate groups of members are kept (as one).
+    Containers written on a single line stay on one line, so an already tidy file gives the same text
+    back and small edits give small diffs.
+    基于具体语法树而非 json.dump：字符串、数字和注释原样复制，只重写记号之间的空白
+    （外加去掉多余逗号，以及 sort_keys 时的成员顺序）。每层嵌套一级缩进，每个成员一行，'"key": value'，
+    结尾一个换行符。成员分组之间的空行保留（合并为一行）。原本写在一行内的容器保持单行，因此已经整齐的文件原样返回，小改动只产生小差异。
+    Raises ValueError for text it cannot parse (无法解析时抛出 ValueError).
     """
-    def hook(pairs: List[Tuple[str, Any]]):
-        seen_counts: Dict[str, int] = {}
-        result: Dict[str, Any] = {}
-        dup_keys: List[str] = []
-        for key, value in pairs:
-            if key in seen_counts:
-                seen_counts[key] += 1
-                if key not in dup_keys:
-                    dup_keys.append(key)
-            else:
-                seen_counts[key] = 1
-            result[key] = value
-        if dup_keys:
-            issues.append(FileIssue(
-                path=path,
-                issue_type="duplicate_keys",
-                message=f"Duplicate keys found (发现重复键): {', '.join(dup_keys)}",
-                details={"keys": dup_keys}
+    root = _parse_cst(text)
+    indent = style.indent if style.indent is not None else _detect_indent(text)
+    eol = style.eol or _detect_eol(text)
+    formatted = _emit_cst(root, indent, style.sort_keys)
+    return formatted if eol == "\n" else formatted.replace("\n", eol)
+
+# ---------- Schema validation (结构校验) ----------
+
+# (path, message) pairs; path is like "Changes[3].Target" (路径形如 "Changes[3].Target")
+SchemaProblems = List[Tuple[str, str]]
+SchemaCheck = Callable[[Any, str, SchemaProblems], None]
+
+_TYPE_TESTS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "boolean": lambda v: isinstance(v, bool),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+def _json_type(value: Any) -> str:
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if _TYPE_TESTS[name](value):
+            return name
+    return type(value).__name__
+
+def _join_path(path: str, key: str) -> str:
+    return f"{path}.{key}" if path else key
+
+def compile_schema(schema: Dict[str, Any]) -> SchemaCheck:
+    """
+    Compile a small JSON-Schema subset into one validator function (将 JSON Schema 子集编译为校验函数).
+
+    Supported (支持): type, enum, pattern, minLength, required, properties, additionalProperties,
+    items, plus two SMAPI-specific keywords (以及两个 SMAPI 专用关键字):
+    - oneOfRequired: exactly one of these fields must be present（这些字段必须且只能出现一个）
+    - cases: {"key": field, "schemas": {value: schema}} extra rules picked by a field's value,
+      e.g. per Content Patcher Action（按某字段的值选择额外规则，例如 Content Patcher 的 Action）
+    Field names and enum values are case-insensitive, like SMAPI (字段名与枚举值不区分大小写，与 SMAPI 一致).
+    The schema is walked once here; validating only runs the prepared closures.
+    结构定义只在此处遍历一次；校验时仅执行预先生成的闭包。
+    """
+    checks: List[SchemaCheck] = []
+
+    type_names = schema.get("type")
+    type_test: Optional[Callable[[Any], bool]] = None
+    expected = ""
+    if type_names:
+        names = [type_names] if isinstance(type_names, str) else list(type_names)
+        tests = tuple(_TYPE_TESTS[n] for n in names)
+        type_test = tests[0] if len(tests) == 1 else (lambda v: any(t(v) for t in tests))
+        expected = " or ".join(names)
+
+    if "enum" in schema:
+        allowed = {str(v).lower() for v in schema["enum"]}
+        allowed_text = ", ".join(str(v) for v in schema["enum"])
+
+        def check_enum(value, path, out):
+            if str(value).lower() not in allowed:
+                out.append((path, f"'{value}' is not one of (不是可选值之一): {allowed_text}"))
+        checks.append(check_enum)
+
+    if "pattern" in schema or "minLength" in schema:
+        search = re.compile(schema["pattern"]).search if "pattern" in schema else None
+        min_length = schema.get("minLength", 0)
+
+        def check_string(value, path, out):
+            if not isinstance(value, str):
+                return
+            if len(value) < min_length:
+                out.append((path, "must not be empty (不能为空)"))
+            elif search is not None and not search(value):
+                out.append((path, f"'{value}' has an invalid format (格式无效)"))
+        checks.append(check_string)
+
+    object_keywords = ("properties", "required", "additionalProperties", "oneOfRequired", "cases")
+    if any(k in schema for k in object_keywords):
+        props = {name.lower(): compile_schema(sub) for name, sub in schema.get("properties", {}).items()}
+        required = [(name.lower(), name) for name in schema.get("required", ())]
+        extra = schema.get("additionalProperties")
+        extra_check = compile_schema(extra) if isinstance(extra, dict) else None
+        one_of = [(name.lower(), name) for name in schema.get("oneOfRequired", ())]
+        one_of_text = " / ".join(name for _, name in one_of)
+        cases = schema.get("cases")
+        case_key = cases["key"].lower() if cases else None
+        case_checks = {v.lower(): compile_schema(sub) for v, sub in cases["schemas"].items()} if cases else {}
+
+        def check_object(value, path, out):
+            if not isinstance(value, dict):
+                return
+            keys = {k.lower(): k for k in value}
+            for low, name in required:
+                if low not in keys:
+                    out.append((path, f"missing required field (缺少必填字段) '{name}'"))
+            if one_of and sum(low in keys for low, _ in one_of) != 1:
+                out.append((path, f"needs exactly one of (必须且只能有一个) {one_of_text}"))
+            for low, key in keys.items():
+                sub = props.get(low, extra_check)
+                if sub is not None:
+                    sub(value[key], _join_path(path, key), out)
+            if case_key in keys:
+                selected = value[keys[case_key]]
+                case_check = case_checks.get(selected.lower()) if isinstance(selected, str) else None
+                if case_check is not None:
+                    case_check(value, path, out)
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_check = compile_schema(schema["items"])
+
+        def check_items(value, path, out):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    item_check(item, f"{path}[{i}]", out)
+        checks.append(check_items)
+
+    def check(value, path, out):
+        if type_test is not None and not type_test(value):
+            out.append((path, f"expected (应为) {expected}, got (实际为) {_json_type(value)}"))
+            return
+        for c in checks:
+            c(value, path, out)
+    return check
+
+_VERSION = {"type": "string", "pattern": r'^\d+\.\d+(?:\.\d+)?(?:-[0-9A-Za-z.\-]+)?(?:\+[0-9A-Za-z.\-]+)?$'}
+_UNIQUE_ID = {"type": "string", "minLength": 1, "pattern": r'^[A-Za-z0-9_.\-]+$'}
+
+# SMAPI manifest.json (SMAPI 清单文件)
+MANIFEST_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["Name", "Author", "Version", "UniqueID"],
+    "oneOfRequired": ["EntryDll", "ContentPackFor"],
+    "properties": {
+        "Name": {"type": "string", "minLength": 1},
+        "Author": {"type": "string", "minLength": 1},
+        "Version": _VERSION,
+        "Description": {"type": "string"},
+        "UniqueID": _UNIQUE_ID,
+        "EntryDll": {"type": "string", "pattern": r'(?i)\.dll$'},
+        "MinimumApiVersion": _VERSION,
+        "MinimumGameVersion": _VERSION,
+        "ContentPackFor": {
+            "type": "object",
+            "required": ["UniqueID"],
+            "properties": {"UniqueID": _UNIQUE_ID, "MinimumVersion": _VERSION},
+        },
+        "Dependencies": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["UniqueID"],
+                "properties": {
+                    "UniqueID": _UNIQUE_ID,
+                    "MinimumVersion": _VERSION,
+                    "IsRequired": {"type": "boolean"},
+                },
+            },
+        },
+        # e.g. "Nexus:1234" (例如 "Nexus:1234")
+        "UpdateKeys": {"type": "array", "items": {"type": "string", "pattern": r'^[A-Za-z]+:\s*\S'}},
+    },
+}
+
+# Content Patcher content.json (Content Patcher 内容文件)
+CONTENT_PATCHER_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["Format", "Changes"],
+    "properties": {
+        "Format": _VERSION,
+        "Changes": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["Action"],
+                "properties": {
+                    "Action": {"type": "string", "enum": ["Load", "EditData", "EditImage", "EditMap", "Include"]},
+                    "Target": {"type": "string", "minLength": 1},
+                    "FromFile": {"type": "string", "minLength": 1},
+                    "LogName": {"type": "string"},
+                    "Update": {"type": "string"},
+                    "When": {"type": "object"},
+                    "Priority": {"type": ["string", "integer"]},
+                },
+                "cases": {
+                    "key": "Action",
+                    "schemas": {
+                        "Load": {"required": ["Target", "FromFile"]},
+                        "EditImage": {"required": ["Target", "FromFile"]},
+                        "EditData": {"required": ["Target"]},
+                        "EditMap": {"required": ["Target"]},
+                        "Include": {"required": ["FromFile"]},
+                    },
+                },
+            },
+        },
+        "ConfigSchema": {
+            "type": "object",
+            "additionalProperties": {
+                "type": "object",
+                "properties": {
+                    "AllowValues": {"type": "string"},
+                    "AllowBlank": {"type": "boolean"},
+                    "AllowMultiple": {"type": "boolean"},
+                    "Description": {"type": "string"},
+                },
+            },
+        },
+        "DynamicTokens": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["Name", "Value"],
+                "properties": {"Name": {"type": "string", "minLength": 1}, "When": {"type": "object"}},
+            },
+        },
+        "CustomLocations": {"type": "array"},
+    },
+}
+
+# compiled once per process (每个进程只编译一次)
+_MANIFEST_CHECK = compile_schema(MANIFEST_SCHEMA)
+_CONTENT_PATCHER_CHECK = compile_schema(CONTENT_PATCHER_SCHEMA)
+
+def schema_problems(path: str, value: Any) -> SchemaProblems:
+    """
+    Check a parsed file against the bundled schema for its kind, if any (按文件类型用内置结构校验).
+    manifest.json → SMAPI manifest; content.json with Format/Changes → Content Patcher.
+    """
+    name = os.path.basename(path).lower()
+    problems: SchemaProblems = []
+    if name == "manifest.json":
+        _MANIFEST_CHECK(value, "", problems)
+    elif name == "content.json" and isinstance(value, dict) and \
+            any(k.lower() in ("format", "changes") for k in value):
+        _CONTENT_PATCHER_CHECK(value, "", problems)
+    return problems
+
+# ---------- Cross-file mod checks (跨文件模组检查) ----------
+
+_MOD_VERSION_RE = re.compile(r'^\s*v?(\d+(?:\.\d+)*)(?:-([0-9A-Za-z.\-]+))?(?:\+[0-9A-Za-z.\-]+)?\s*$')
+
+def parse_version(version: str) -> Optional[tuple]:
+    """
+    Sort key for a SMAPI/semantic version like "1.10.2" or "2.0.0-beta.3", or None.
+    语义化版本的排序键，如 "1.10.2"、"2.0.0-beta.3"；无法解析时返回 None。
+    Trailing zeros are ignored ("1.2" == "1.2.0"); pre-releases sort before the release.
+    末尾的 0 会被忽略；预发布版本排在正式版本之前。
+    """
+    m = _MOD_VERSION_RE.match(version) if isinstance(version, str) else None
+    if not m:
+        return None
+    numbers = [int(x) for x in m.group(1).split(".")]
+    while len(numbers) > 1 and numbers[-1] == 0:
+        numbers.pop()
+    prerelease = m.group(2)
+    if not prerelease:
+        return (tuple(numbers), 1, ())
+    tag = tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part.lower())
+        for part in prerelease.split(".")
+    )
+    return (tuple(numbers), 0, tag)
+
+@dataclass
+class ModManifest:
+    path: str
+    unique_id: str
+    name: str = ""
+    version: str = ""
+    # (unique_id, minimum_version, is_required, json_path) (依赖：ID、最低版本、是否必需、JSON 路径)
+    dependencies: List[Tuple[str, Optional[str], bool, str]] = field(default_factory=list)
+    content_pack_for: Optional[Tuple[str, Optional[str]]] = None
+
+def read_mod_manifest(path: str) -> Optional[ModManifest]:
+    """Read the fields the cross-file checks need; None if unreadable (读取跨文件检查所需字段)."""
+    try:
+        with open(path, "r", encoding="utf-8-sig") as f:
+            parsed = parse_smapi_json(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+    data = parsed.value
+    if parsed.errors or not isinstance(data, dict):
+        return None  # syntax problems are reported by validate_file (语法问题由 validate_file 报告)
+    fields = {k.lower(): v for k, v in data.items()}
+    unique_id = fields.get("uniqueid")
+    if not isinstance(unique_id, str) or not unique_id.strip():
+        return None
+    manifest = ModManifest(
+        path=path,
+        unique_id=unique_id.strip(),
+        name=str(fields.get("name") or ""),
+        version=str(fields.get("version") or ""),
+    )
+    for index, dep in enumerate(fields.get("dependencies") or ()):
+        if not isinstance(dep, dict):
+            continue
+        dep_fields = {k.lower(): v for k, v in dep.items()}
+        dep_id = dep_fields.get("uniqueid")
+        if isinstance(dep_id, str) and dep_id.strip():
+            minimum = dep_fields.get("minimumversion")
+            manifest.dependencies.append((
+                dep_id.strip(),
+                minimum if isinstance(minimum, str) and minimum else None,
+                dep_fields.get("isrequired", True) is not False,
+                f"Dependencies[{index}].UniqueID",
             ))
-        return result
-    return hook
+    pack_for = fields.get("contentpackfor")
+    if isinstance(pack_for, dict):
+        pack_fields = {k.lower(): v for k, v in pack_for.items()}
+        target = pack_fields.get("uniqueid")
+        if isinstance(target, str) and target.strip():
+            minimum = pack_fields.get("minimumversion")
+            manifest.content_pack_for = (target.strip(), minimum if isinstance(minimum, str) and minimum else None)
+    return manifest
+
+def loadable_manifests(root: str, paths: Iterable[str]) -> List[str]:
+    """
+    The manifest.json files SMAPI would actually load from a Mods folder (SMAPI 实际会加载的清单文件):
+    folders starting with "." are skipped, and a mod folder's subfolders are not searched.
+    跳过以 "." 开头的文件夹，且不会在模组文件夹的子目录中继续查找。
+    """
+    root = os.path.abspath(root)
+    mod_dirs: Dict[str, str] = {}
+    for path in paths:
+        if os.path.basename(path).lower() != "manifest.json":
+            continue
+        rel_dir = os.path.relpath(os.path.dirname(os.path.abspath(path)), root)
+        parts = () if rel_dir == os.curdir else tuple(rel_dir.split(os.sep))
+        if any(part.startswith(".") for part in parts):
+            continue
+        mod_dirs[os.sep.join(parts)] = path
+    loadable = []
+    for rel_dir, path in mod_dirs.items():
+        parts = rel_dir.split(os.sep) if rel_dir else []
+        # nested inside another mod folder? (是否位于另一个模组文件夹内)
+        if not any(os.sep.join(parts[:i]) in mod_dirs for i in range(len(parts))):
+            loadable.append(path)
+    return sorted(loadable)
+
+def check_mod_consistency(root: str, paths: Iterable[str]) -> List[FileIssue]:
+    """
+    Whole-folder checks across every manifest.json (对所有 manifest.json 进行整体检查):
+    - duplicate_unique_id: the same UniqueID in several mods（多个模组使用相同的 UniqueID）
+    - missing_dependency: a required dependency is not installed（必需的依赖未安装）
+    - dependency_version: an installed dependency is older than MinimumVersion（已安装的依赖版本过低）
+    - missing_content_pack_target: ContentPackFor points to a mod that is not installed
+      （ContentPackFor 指向的框架模组未安装）
+    One pass builds a UniqueID index, a second pass checks against it: linear in the number of mods.
+    第一遍建立 UniqueID 索引，第二遍据此检查：耗时与模组数量成线性关系。
+    """
+    mods = [m for m in map(read_mod_manifest, loadable_manifests(root, paths)) if m is not None]
+    by_id: Dict[str, List[ModManifest]] = {}
+    for mod in mods:
+        by_id.setdefault(mod.unique_id.lower(), []).append(mod)
+
+    def rel(path: str) -> str:
+        return os.path.relpath(path, root)
+
+    issues: List[FileIssue] = []
+    json_paths: List[str] = []  # where each issue points inside its manifest (每个问题在清单中的位置)
+
+    def add(issue: FileIssue, json_path: str):
+        issues.append(issue)
+        json_paths.append(json_path)
+
+    for group in by_id.values():
+        if len(group) > 1:
+            for mod in group:
+                others = ", ".join(rel(o.path) for o in group if o is not mod)
+                add(FileIssue(
+                    path=mod.path,
+                    issue_type="duplicate_unique_id",
+                    message=f"UniqueID '{mod.unique_id}' is also used by (该 UniqueID 也被以下模组使用): {others}",
+                    details={"unique_id": mod.unique_id, "others": [o.path for o in group if o is not mod]}
+                ), "UniqueID")
+
+    def check_requirement(mod: ModManifest, dep_id: str, minimum: Optional[str], pack_target: bool,
+                          json_path: str):
+        installed = by_id.get(dep_id.lower())
+        if not installed:
+            if pack_target:
+                issue_type = "missing_content_pack_target"
+                message = f"Content pack for '{dep_id}', which is not installed (内容包对应的框架模组未安装)"
+            else:
+                issue_type = "missing_dependency"
+                message = f"Requires '{dep_id}', which is not installed (依赖的模组未安装)"
+            add(FileIssue(path=mod.path, issue_type=issue_type, message=message,
+                          details={"unique_id": dep_id}), json_path)
+            return
+        wanted = parse_version(minimum) if minimum else None
+        if wanted is None:
+            return
+        versions = [(parse_version(m.version), m.version) for m in installed]
+        if not any(key is not None and key >= wanted for key, _ in versions):
+            found = ", ".join(v or "?" for _, v in versions)
+            add(FileIssue(
+                path=mod.path,
+                issue_type="dependency_version",
+                message=f"Requires '{dep_id}' {minimum} or newer, installed (需要 {minimum} 或更高版本，已安装): {found}",
+                details={"unique_id": dep_id, "minimum": minimum, "installed": found}
+            ), json_path)
+
+    for mod in mods:
+        for dep_id, minimum, required, json_path in mod.dependencies:
+            if required or dep_id.lower() in by_id:
+                check_requirement(mod, dep_id, minimum, False, json_path)
+        if mod.content_pack_for is not None:
+            check_requirement(mod, *mod.content_pack_for, True, "ContentPackFor.UniqueID")
+
+    # exact line/column: each manifest with issues is read once more (精确行列：每个有问题的清单只再读取一次)
+    by_file: Dict[str, List[Tuple[FileIssue, str]]] = {}
+    for issue, json_path in zip(issues, json_paths):
+        by_file.setdefault(issue.path, []).append((issue, json_path))
+    for path, located in by_file.items():
+        try:
+            with open(path, "r", encoding="utf-8-sig") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError):
+            continue
+        offsets = locate_json_paths(text, (json_path for _, json_path in located))
+        pmap = PositionMap(text)
+        for issue, json_path in located:
+            if json_path in offsets:
+                issue.line, issue.column = pmap.line_col(offsets[json_path])
+    return issues
+
+# ---------- Safe writes and backups (安全写入与备份) ----------
+
+BACKUP_DIRNAME = "JsonDoctorBackups"
+
+def backup_dir() -> str:
+    """Backup archives live next to the script / exe (备份存档位于脚本或 exe 同目录)."""
+    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(base_dir, BACKUP_DIRNAME)
+
+def atomic_write(path: str, data: bytes):
+    """
+    Replace a file via temp file + fsync + rename, so a crash never leaves it half-written.
+    通过临时文件 + fsync + 重命名替换文件，崩溃时不会留下写了一半的文件。
+    """
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".jsondoctor-", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            shutil.copymode(path, tmp_path)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class BackupArchive:
+    """
+    One compressed zip of original files per scan, instead of a .bak next to every file.
+    每次扫描一个压缩的 zip 存档保存原文件，而不是在每个文件旁边生成 .bak。
+
+    - the zip is only created when the first file is added（添加第一个文件时才创建 zip）
+    - it stays open while files are streamed in; close() writes the central directory and
+      fsyncs once, so call it when the scan (or a watch round) ends. A later add() appends again
+      （写入期间 zip 保持打开；close() 写出中央目录并只 fsync 一次，扫描（或一轮监视）结束时调用；
+      之后再 add() 会继续追加）
+    - the scan root is kept in the zip comment for restore_backup（扫描根目录保存在 zip 注释中，供恢复使用）
+    """
+
+    def __init__(self, root: str, folder: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.folder = folder or backup_dir()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        self.path = os.path.join(self.folder, f"backup-{stamp}.zip")
+        n = 1
+        while os.path.exists(self.path):
+            self.path = os.path.join(self.folder, f"backup-{stamp}-{n}.zip")
+            n += 1
+        self.files: List[str] = []
+        self._lock = threading.Lock()
+        self._zip: Optional[zipfile.ZipFile] = None
+
+    def add(self, path: str):
+        """Copy the file as it is on disk now into the archive (将文件当前内容写入存档)."""
+        rel = os.path.relpath(os.path.abspath(path), self.root)
+        if rel.startswith(os.pardir):
+            raise ValueError(f"{path} is outside {self.root} (不在备份根目录内)")
+        arcname = rel.replace(os.sep, "/")
+        with self._lock:
+            if self._zip is None:
+                os.makedirs(self.folder, exist_ok=True)
+                mode = "a" if self.files else "w"  # reopened after close() (close() 之后重新打开)
+                self._zip = zipfile.ZipFile(self.path, mode, compression=zipfile.ZIP_DEFLATED)
+                self._zip.comment = json.dumps({"root": self.root}).encode("utf-8")
+            self._zip.write(path, arcname)
+            self.files.append(arcname)
+
+    def close(self):
+        """Finish the zip and fsync it once (完成 zip 并只 fsync 一次)."""
+        with self._lock:
+            if self._zip is None:
+                return
+            self._zip.close()
+            self._zip = None
+            with open(self.path, "rb+") as f:
+                os.fsync(f.fileno())
+
+def latest_backup(folder: Optional[str] = None) -> Optional[str]:
+    """Newest backup archive, or None (最新的备份存档，没有则返回 None)."""
+    folder = folder or backup_dir()
+    try:
+        archives = [e for e in os.scandir(folder) if e.is_file() and e.name.lower().endswith(".zip")]
+    except OSError:
+        return None
+    if not archives:
+        return None
+    return max(archives, key=lambda e: e.stat().st_mtime).path
+
+def restore_backup(archive_path: str) -> List[str]:
+    """
+    Put every file in a backup archive back in place (atomically); returns the restored paths.
+    将备份存档中的所有文件（原子地）还原到原位置，返回已还原的路径。
+    """
+    restored: List[str] = []
+    with zipfile.ZipFile(archive_path) as zf:
+        root = json.loads(zf.comment.decode("utf-8"))["root"]
+        root_prefix = os.path.join(os.path.abspath(root), "")
+        for member in zf.infolist():
+            if member.is_dir():
+                continue
+            target = os.path.abspath(os.path.join(root, member.filename))
+            if not target.startswith(root_prefix):
+                continue  # never write outside the scan root (不写入根目录之外)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            atomic_write(target, zf.read(member))
+            restored.append(target)
+    return restored
+
+def apply_fix(res: FileResult, archive: Optional[BackupArchive] = None) -> FileResult:
+    """
+    Write a deferred fix: back up the original (if an archive is given), then replace atomically.
+    写入延迟的修复：先备份原文件（若提供存档），再原子替换。
+    Profiled results (timings set) also get the write time (分析中的结果同时记录写入耗时).
+    """
+    text, res.fixed_text = res.fixed_text, None
+    if text is None:
+        return res
+    if res.timings is not None:
+        started = time.perf_counter()
+    try:
+        if archive is not None:
+            archive.add(res.path)
+        atomic_write(res.path, text.encode("utf-8"))
+    except Exception as ex:
+        res.issues.append(FileIssue(
+            path=res.path,
+            issue_type="io_error_write",
+            message=f"Failed to write fixed file (写入修复后的文件失败): {ex}"
+        ))
+        res.ok = False
+        res.fixed = False
+    if res.timings is not None:
+        res.timings["write"] = time.perf_counter() - started
+    return res
 
 def validate_file(
     path: str,
     auto_fix: bool = False,
     backup: bool = True,
     ignore_comments: bool = False,
-    allow_trailing_commas: bool = False
+    allow_trailing_commas: bool = False,
+    archive: Optional[BackupArchive] = None,
+    defer_write: bool = False,
+    check_schema: bool = False,
+    stream_threshold: int = STREAM_THRESHOLD_BYTES,
+    format_style: Optional[FormatStyle] = None,
+    profile: bool = False
 ) -> FileResult:
     """
     Validate one JSON file (校验单个 JSON 文件).
 
+    Files of stream_threshold bytes or more are checked by stream_check_json instead, with
+    bounded memory: syntax, trailing commas, duplicate keys and nesting depth, but no schema
+    checks and no automatic fixes (0 turns this off).
+    不小于 stream_threshold 字节的文件改用 stream_check_json 校验，内存占用有上限：
+    检查语法、多余逗号、重复键和嵌套深度，但不做结构校验，也不自动修复（0 表示关闭）。
+
     Pipeline (处理流程):
-    1. (optional) strip // comments → work_text（可选：移除 // 注释）
-    2. (optional) if allow_trailing_commas=True, strip trailing commas for parsing only
-       （可选：若允许末尾逗号，则仅在解析时移除多余逗号，不记录为错误）
-    3. parse → if OK, record duplicate keys（若解析成功，记录重复键）
-    4. if NOT OK, record invalid_json_original（记录原始解析错误）
-    5. if auto_fix=True AND allow_trailing_commas=False, try remove_trailing_commas and parse again:
-       - if OK → record trailing_commas_fixed + any duplicate_keys，并可写回文件
-       - if still NOT OK → record invalid_json_after_fix
+    1. parse once with parse_smapi_json (使用 parse_smapi_json 解析一次):
+       - (optional) // and /* */ comments are skipped（可选：跳过注释）
+       - trailing commas, duplicate keys and every syntax error are recorded with their
+         line/column in the original file（记录多余逗号、重复键与全部语法错误及其在原文件中的行列）
+    2. syntax errors → one invalid_json_original issue each（每个语法错误记录一条 invalid_json_original）
+    3. trailing commas (多余逗号):
+       - allow_trailing_commas=True → valid, not reported（视为合法，不记录）
+       - auto_fix=True and no other errors → remove just those commas, record
+         trailing_commas_fixed, and write back (comments are kept)
+         （仅移除这些逗号，记录 trailing_commas_fixed 并写回；注释会保留）
+       - otherwise → one invalid_json_original issue per comma（否则每个逗号记录一条错误）
+       format_style given and the file valid so far → format_json; a changed layout is recorded
+       as formatted and written like a fix (comments are kept)
+       （提供 format_style 且文件至此有效 → 执行 format_json；排版有变化时记录 formatted，并像修复一样写回，注释保留）
+    4. every repeated key → one duplicate_keys issue with its JSON path（每个重复键记录一条 duplicate_keys，含 JSON 路径）
+       check_schema=True: manifest.json / Content Patcher content.json are checked against the
+       bundled schemas on the already parsed value → schema_error
+       （check_schema=True：对已解析的值按内置结构校验 manifest.json 与 content.json → schema_error）
+    5. write a fix atomically; with backup=True the original goes into archive (a new
+       BackupArchive next to the tool if none is given). defer_write=True leaves the fix in
+       FileResult.fixed_text for the caller (the scan engine writes fixes in one process)
+       原子写入修复；backup=True 时原文件存入 archive（未提供则在工具目录新建存档）。
+       defer_write=True 时修复内容留在 FileResult.fixed_text 中由调用方写入（扫描引擎在单一进程中写入）
+
+    profile=True fills FileResult.timings with the seconds spent in each PROFILE_PHASES step:
+    read (read, hash, decode), parse, check (steps 2-4) and write
+    （profile=True 时在 FileResult.timings 中记录 PROFILE_PHASES 各阶段的耗时：
+    read（读取、哈希、解码）、parse、check（第二至四步）与 write）
     """
+    if profile:
+        started = time.perf_counter()
+    if stream_threshold:
+        try:
+            large = os.path.getsize(path) >= stream_threshold
+        except OSError:
+            large = False  # reported by the normal read below (由下面的正常读取报告)
+        if large:
+            res = _validate_streaming(path, auto_fix, ignore_comments, allow_trailing_commas)
+            if profile:
+                # reading and parsing are interleaved in a stream (流式读取与解析交织进行)
+                res.timings = {"parse": time.perf_counter() - started}
+            return res
+
     issues: List[FileIssue] = []
     fixed = False
 
-    # Read file (读取文件)
+    # Read file (读取文件); bytes are hashed for the scan cache (字节内容的哈希用于扫描缓存)
     try:
-        with open(path, "r", encoding="utf-8-sig") as f:
-            original_text = f.read()
+        with open(path, "rb") as f:
+            raw = f.read()
+        content_hash = file_digest(raw)
+        original_text = raw.decode("utf-8-sig")
     except Exception as ex:
         issues.append(FileIssue(
             path=path,
@@ -200,91 +2039,803 @@ def validate_file(
             message=f"Failed to read file (读取文件失败): {ex}",
         ))
         return FileResult(path=path, ok=False, issues=issues)
-
-    # Step 1: prepare working text (准备要解析的文本)
-    work_text = original_text
-    if ignore_comments:
-        work_text = strip_line_comments(work_text)
-
-    # Step 2: prepare parse_text (根据设置准备解析用文本)
-    parse_text = work_text
-    if allow_trailing_commas:
-        # For SMAPI mode: ignore trailing commas for validation only
-        # SMAPI 模式：仅在解析时忽略末尾逗号，不视为错误、不写回文件
-        parse_text = remove_trailing_commas(parse_text)
-
-    # Step 3: first parse attempt (第一次解析尝试)
-    ok = False
-    try:
-        json.loads(parse_text, object_pairs_hook=detect_duplicates_object_pairs_hook(issues, path))
-        ok = True
-    except json.JSONDecodeError as e:
+    if profile:
+        read_done = time.perf_counter()
+
+    # Step 1: parse once (第一步：只解析一次)
+    parsed = parse_smapi_json(original_text, allow_comments=ignore_comments)
+    if profile:
+        parse_done = time.perf_counter()
+    # no removals: maps offsets to line/column of the original text (无移除片段：仅用于行列换算)
+    pmap = PositionMap(original_text)
+
+    # Step 2: syntax errors (第二步：语法错误)
+    for offset, msg in parsed.errors:
+        line, column = pmap.line_col(offset)
         issues.append(FileIssue(
             path=path,
             issue_type="invalid_json_original",
-            message=f"Invalid JSON (JSON 无效，原始解析失败): {e}",
-            line=e.lineno,
-            column=e.colno
+            message=f"Invalid JSON (JSON 无效，原始解析失败): {msg}: line {line} column {column}",
+            line=line,
+            column=column
         ))
-        ok = False
+    ok = not parsed.errors
 
-    # Step 4: only if auto_fix is ON and trailing commas are NOT allowed, try trailing comma fix
-    # 第四步：仅在 auto_fix=True 且 未开启“允许末尾逗号”时，才尝试修复末尾逗号
-    if not ok and auto_fix and not allow_trailing_commas:
-        fixed_text = remove_trailing_commas(work_text)
-        if fixed_text != work_text:
-            try:
-                # fresh issues list for this parse ONLY for duplicates
-                temp_issues: List[FileIssue] = []
-                json.loads(fixed_text, object_pairs_hook=detect_duplicates_object_pairs_hook(temp_issues, path))
-                # parse succeeded after removing trailing commas
-                work_text = fixed_text
-                ok = True
-                fixed = True
-                issues.append(FileIssue(
-                    path=path,
-                    issue_type="trailing_commas_fixed",
-                    message="Removed trailing commas (已移除末尾多余逗号) before '}' or ']'."
-                ))
-                issues.extend(temp_issues)
-                if ignore_comments:
-                    issues.append(FileIssue(
-                        path=path,
-                        issue_type="comments_removed_on_fix",
-                        message="File fixed with comments ignored (在忽略注释的前提下修复文件); "
-                                "// comments may be removed in the saved file (保存后的文件可能不再包含 // 注释)."
-                    ))
-            except json.JSONDecodeError as e:
+    # Step 3: trailing commas (第三步：多余逗号)
+    work_text = original_text
+    if parsed.trailing_commas and not allow_trailing_commas:
+        if auto_fix and ok:
+            parts: List[str] = []
+            prev = 0
+            for comma in parsed.trailing_commas:
+                parts.append(original_text[prev:comma])
+                prev = comma + 1
+            parts.append(original_text[prev:])
+            work_text = "".join(parts)
+            fixed = True
+            line, column = pmap.line_col(parsed.trailing_commas[0])
+            issues.append(FileIssue(
+                path=path,
+                issue_type="trailing_commas_fixed",
+                message=f"Removed {len(parsed.trailing_commas)} trailing comma(s) "
+                        f"(已移除 {len(parsed.trailing_commas)} 处末尾多余逗号) before '}}' or ']'.",
+                line=line,
+                column=column,
+                details={"offsets": parsed.trailing_commas}
+            ))
+        else:
+            ok = False
+            for comma in parsed.trailing_commas:
+                line, column = pmap.line_col(comma)
                 issues.append(FileIssue(
                     path=path,
-                    issue_type="invalid_json_after_fix",
-                    message=f"Still invalid after trailing-comma fix (移除多余逗号后仍无效): {e}",
-                    line=e.lineno,
-                    column=e.colno
+                    issue_type="invalid_json_original",
+                    message=f"Invalid JSON (JSON 无效，原始解析失败): Illegal trailing comma "
+                            f"(多余的末尾逗号): line {line} column {column}",
+                    line=line,
+                    column=column
                 ))
-                ok = False
-        # if fixed_text == work_text, we already have invalid_json_original; nothing else to do
 
-    # Step 5: write back if we actually fixed something and auto_fix is ON
-    # 第五步：仅在 auto_fix=True 且确实修复了文件时才写回
-    if fixed and auto_fix:
+    # layout (排版)
+    if format_style is not None and ok:
         try:
-            if backup:
-                backup_path = path + ".bak"
-                if not os.path.exists(backup_path):
-                    with open(backup_path, "w", encoding="utf-8") as bf:
-                        bf.write(original_text)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(work_text)
-        except Exception as ex:
+            formatted = format_json(work_text, format_style)
+            if formatted != work_text:
+                # round trip: same value, and formatting again changes nothing (往返校验：值不变，再次格式化无变化)
+                check = parse_smapi_json(formatted, allow_comments=True)
+                if check.errors or check.value != parsed.value or format_json(formatted, format_style) != formatted:
+                    formatted = work_text
+        except (ValueError, RecursionError):
+            formatted = work_text  # leave layouts it cannot read alone (无法读取的排版保持不变)
+        if formatted != work_text:
+            work_text = formatted
+            fixed = True
+            issues.append(FileIssue(
+                path=path,
+                issue_type="formatted",
+                message="Layout normalized: indentation, spacing, line endings "
+                        "(已规范排版：缩进、空格、换行符)",
+            ))
+
+    # Step 4: duplicate keys (第四步：重复键)
+    for key, offset, key_path in parsed.duplicate_keys:
+        line, column = pmap.line_col(offset)
+        issues.append(FileIssue(
+            path=path,
+            issue_type="duplicate_keys",
+            message=f"Duplicate key (重复键) '{key}' at (位于) {key_path}; "
+                    f"the last value is used (以最后一个值为准)",
+            line=line,
+            column=column,
+            details={"key": key, "path": key_path}
+        ))
+
+    # schema checks reuse the parsed value: no second parse (结构校验复用已解析的值，无需再次解析)
+    if check_schema and not parsed.errors:
+        problems = schema_problems(path, parsed.value)
+        offsets = locate_json_paths(original_text, (where for where, _ in problems), ignore_comments) \
+            if problems else {}
+        for where, msg in problems:
+            line = column = None
+            if where in offsets:
+                line, column = pmap.line_col(offsets[where])
             issues.append(FileIssue(
                 path=path,
-                issue_type="io_error_write",
-                message=f"Failed to write fixed file (写入修复后的文件失败): {ex}"
+                issue_type="schema_error",
+                message=f"Schema (结构) {where or '(root 根)'}: {msg}",
+                line=line,
+                column=column,
+                details={"path": where}
             ))
-            return FileResult(path=path, ok=False, issues=issues, fixed=False)
+            ok = False
+
+    res = FileResult(path=path, ok=ok, issues=issues, fixed=fixed, content_hash=content_hash)
+    if profile:
+        res.timings = {
+            "read": read_done - started,
+            "parse": parse_done - read_done,
+            "check": time.perf_counter() - parse_done,
+        }
+    if fixed:
+        res.fixed_text = work_text
+        # Step 5: write back (第五步：写回)
+        if not defer_write:
+            own_archive = backup and archive is None
+            if own_archive:
+                archive = BackupArchive(os.path.dirname(os.path.abspath(path)))
+            apply_fix(res, archive if backup else None)
+            if own_archive:
+                archive.close()
+    return res
+
+def _validate_streaming(
+    path: str,
+    auto_fix: bool,
+    ignore_comments: bool,
+    allow_trailing_commas: bool
+) -> FileResult:
+    """validate_file for large files: stream_check_json results as issues (大文件版 validate_file)."""
+    try:
+        check = stream_check_json(path, allow_comments=ignore_comments)
+    except (OSError, UnicodeDecodeError) as ex:
+        return FileResult(path=path, ok=False, issues=[FileIssue(
+            path=path,
+            issue_type="io_error",
+            message=f"Failed to read file (读取文件失败): {ex}",
+        )])
+
+    issues: List[FileIssue] = []
+    for line, column, msg in check.errors:
+        issues.append(FileIssue(
+            path=path,
+            issue_type="invalid_json_original",
+            message=f"Invalid JSON (JSON 无效，原始解析失败): {msg}: line {line} column {column}",
+            line=line,
+            column=column
+        ))
+    if check.trailing_comma_count and not allow_trailing_commas:
+        # rewriting a file this size is left to the author (如此大的文件交由作者自行修改)
+        note = " (large file, not fixed automatically 大文件不自动修复)" if auto_fix else ""
+        for line, column in check.trailing_commas:
+            issues.append(FileIssue(
+                path=path,
+                issue_type="invalid_json_original",
+                message=f"Invalid JSON (JSON 无效，原始解析失败): Illegal trailing comma "
+                        f"(多余的末尾逗号): line {line} column {column}{note}",
+                line=line,
+                column=column
+            ))
+        hidden = check.trailing_comma_count - len(check.trailing_commas)
+        if hidden:
+            issues.append(FileIssue(
+                path=path,
+                issue_type="invalid_json_original",
+                message=f"Invalid JSON (JSON 无效，原始解析失败): {hidden} more trailing comma(s) "
+                        f"(另有 {hidden} 处多余的末尾逗号)",
+                details={"count": hidden}
+            ))
+    for key, key_path, line, column in check.duplicate_keys:
+        issues.append(FileIssue(
+            path=path,
+            issue_type="duplicate_keys",
+            message=f"Duplicate key (重复键) '{key}' at (位于) {key_path}; "
+                    f"the last value is used (以最后一个值为准)",
+            line=line,
+            column=column,
+            details={"key": key, "path": key_path}
+        ))
+    hidden = check.duplicate_key_count - len(check.duplicate_keys)
+    if hidden:
+        issues.append(FileIssue(
+            path=path,
+            issue_type="duplicate_keys",
+            message=f"{hidden} more duplicate key(s) (另有 {hidden} 个重复键)",
+            details={"count": hidden}
+        ))
+    if check.too_deep is not None:
+        line, column = check.too_deep
+        issues.append(FileIssue(
+            path=path,
+            issue_type="nesting_depth",
+            message=f"Nested {check.max_depth} levels deep; SMAPI reads at most {MAX_NESTING_DEPTH} "
+                    f"(嵌套 {check.max_depth} 层；SMAPI 最多读取 {MAX_NESTING_DEPTH} 层)",
+            line=line,
+            column=column,
+            details={"depth": check.max_depth}
+        ))
+
+    ok = not check.errors and check.too_deep is None and \
+        (allow_trailing_commas or not check.trailing_comma_count)
+    return FileResult(path=path, ok=ok, issues=issues, content_hash=check.content_hash)
+
+# ---------- Scan cache (扫描缓存) ----------
+
+SCAN_CACHE_FILENAME = "json_doctor_cache.json"
+SCAN_CACHE_VERSION = 7
+
+def scan_cache_path() -> str:
+    """Cache file next to the script / exe (缓存文件位于脚本或 exe 同目录)."""
+    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(base_dir, SCAN_CACHE_FILENAME)
+
+def _content_hasher():
+    return hashlib.blake2b(digest_size=16)
+
+def file_digest(data: bytes) -> str:
+    """Content hash used by the scan cache (扫描缓存使用的内容哈希)."""
+    hasher = _content_hasher()
+    hasher.update(data)
+    return hasher.hexdigest()
+
+def file_digest_path(path: str, chunk_bytes: int = STREAM_CHUNK_BYTES) -> str:
+    """file_digest of a file, read in chunks (分块读取文件并计算 file_digest)."""
+    hasher = _content_hasher()
+    with open(path, "rb") as f:
+        for raw in iter(lambda: f.read(chunk_bytes), b""):
+            hasher.update(raw)
+    return hasher.hexdigest()
+
+class ScanCache:
+    """
+    Persistent per-file scan results, so a re-scan only parses files that changed.
+    持久化的逐文件扫描结果，重新扫描时只解析有改动的文件。
+
+    - an entry is reused when size + mtime match; if only the mtime changed (copied or
+      touched files), the content hash decides
+      （大小与修改时间一致即复用；若仅修改时间变化，如复制或 touch，则由内容哈希决定）
+    - entries remember the options that change results (ignore comments / allow trailing commas /
+      schema checks / format style)（条目记录会影响结果的选项：忽略注释 / 允许末尾逗号 / 结构校验 / 排版）
+    - files fixed by a scan are not cached; they are checked again next time
+      （被修复的文件不缓存，下次扫描会重新检查）
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # path -> [size, mtime_ns, content_hash, options_key, [ok, issues]]
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        self.load()
+
+    @staticmethod
+    def options_key(options: Dict[str, Any]) -> str:
+        key = "c{:d}t{:d}s{:d}".format(
+            bool(options.get("ignore_comments")),
+            bool(options.get("allow_trailing_commas")),
+            bool(options.get("check_schema")),
+        )
+        style = options.get("format_style")
+        # a file stored under a style was already in that layout (在某排版下缓存的文件已符合该排版)
+        return key if style is None else f"{key}f{style.key()}"
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == SCAN_CACHE_VERSION:
+                self.entries = data["files"]
+        except Exception:
+            # missing or broken cache: start from scratch (缓存缺失或损坏：重新开始)
+            self.entries = {}
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": SCAN_CACHE_VERSION, "files": self.entries},
+                          f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except Exception:
+            pass
+
+    def lookup(self, path: str, st: os.stat_result, options: Dict[str, Any]) -> Optional[FileResult]:
+        """Cached result if the file is unchanged, else None (文件未改动时返回缓存结果，否则返回 None)."""
+        entry = self.entries.get(path)
+        if entry is None or entry[3] != self.options_key(options) or entry[0] != st.st_size:
+            return None
+        ok, issues = entry[4]
+        if options.get("auto_fix") and not ok:
+            return None  # may be fixable in this scan (本次扫描可能需要修复)
+        if entry[1] != st.st_mtime_ns:
+            try:
+                digest = file_digest_path(path)
+            except OSError:
+                return None
+            if digest != entry[2]:
+                return None
+            entry[1] = st.st_mtime_ns
+            self.dirty = True
+        return FileResult(
+            path=path,
+            ok=ok,
+            issues=[FileIssue(path, t, msg, line, col, details) for t, msg, line, col, details in issues],
+            content_hash=entry[2],
+            from_cache=True
+        )
+
+    def store(self, res: FileResult, st: os.stat_result, options: Dict[str, Any]):
+        if res.fixed or res.content_hash is None:
+            if self.entries.pop(res.path, None) is not None:
+                self.dirty = True
+            return
+        issues = [[i.issue_type, i.message, i.line, i.column, i.details] for i in res.issues]
+        self.entries[res.path] = [
+            st.st_size, st.st_mtime_ns, res.content_hash, self.options_key(options), [res.ok, issues]
+        ]
+        self.dirty = True
+
+    def prune(self, root: str, present: Iterable[str]):
+        """Drop entries under root whose files are gone (移除 root 下已不存在的文件条目)."""
+        keep = set(present)
+        prefix = os.path.join(os.path.abspath(root), "")
+        for path in list(self.entries):
+            if path not in keep and os.path.abspath(path).startswith(prefix):
+                del self.entries[path]
+                self.dirty = True
+
+# ---------- Parallel scan engine (并行扫描引擎) ----------
+
+def _validate_batch(paths: List[str], options: Dict[str, Any]) -> List[FileResult]:
+    """Worker entry point: validate a batch of files (子进程入口：批量校验文件)."""
+    return [validate_file(p, **options) for p in paths]
+
+def scan_files(
+    paths: Iterable[str],
+    workers: Optional[int] = None,
+    batch_size: int = 32,
+    cache: Optional[ScanCache] = None,
+    archive: Optional[BackupArchive] = None,
+    dedupe: bool = True,
+    **options: Any
+) -> Iterator[FileResult]:
+    """
+    Validate files across a process pool, yielding results in input order.
+    在进程池中并行校验文件，并按输入顺序逐个返回结果。
+
+    - options are passed to validate_file (auto_fix, backup, ignore_comments, allow_trailing_commas,
+      check_schema, format_style, profile)
+      （options 会原样传给 validate_file）
+    - files are sent in batches to keep inter-process overhead low（按批发送以降低进程间开销）
+    - at most workers * 2 batches are in flight, so memory stays flat on huge trees
+      （同时最多 workers * 2 个批次在处理中，超大目录也不会占用过多内存）
+    - workers never write: fixes come back as FileResult.fixed_text and are written here,
+      one at a time, after the original is added to archive (when backup=True)
+      （子进程不写文件：修复内容通过 FileResult.fixed_text 返回，在此逐个写入；
+      backup=True 时先将原文件存入 archive）
+    - with a cache, unchanged files are answered from it and never reach a worker; the pool
+      is only started once some file needs parsing
+      （提供缓存时，未改动的文件直接使用缓存结果，不会交给子进程；只有需要解析时才启动进程池）
+    - with dedupe, files are hashed first (on threads, ahead of dispatch) and each distinct
+      content is validated once; its identical copies get the same result (and the same fix)
+      with duplicate_of set
+      （dedupe 时先（在线程中、提交之前）计算文件哈希，每种内容只校验一次；相同的副本沿用其结果（及修复），
+      并设置 duplicate_of）
+    """
+    workers = workers or os.cpu_count() or 1
+    worker_options = dict(options, defer_write=True)
+    fix_archive = archive if options.get("backup", True) else None
+    stats: Dict[str, os.stat_result] = {}
+
+    # dedup key -> result of the copy that was validated (or found in the cache)
+    # （去重键 → 实际校验（或缓存中）的那份副本的结果）
+    validated: Dict[str, FileResult] = {}
+    path_keys: Dict[str, str] = {}  # path sent for validation -> its dedup key (待校验路径 → 去重键)
+
+    def cached(path: str) -> Optional[FileResult]:
+        if cache is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None  # validate_file reports the error (由 validate_file 报告错误)
+        hit = cache.lookup(path, st, options)
+        if hit is None:
+            stats[path] = st
+        return hit
+
+    def dedupe_key(path: str, digest: str) -> str:
+        name = os.path.basename(path).lower()
+        # schema checks depend on the file name (结构校验取决于文件名)
+        if options.get("check_schema") and name in ("manifest.json", "content.json"):
+            return f"{digest}/{name}"
+        return digest
+
+    def content_key(path: str) -> Optional[str]:
+        if not dedupe:
+            return None
+        try:
+            return dedupe_key(path, file_digest_path(path))
+        except OSError:
+            return None  # validate_file reports the error (由 validate_file 报告错误)
+
+    def keyed(paths: Iterable[str]) -> Iterator[Tuple[str, Optional[FileResult], Optional[str]]]:
+        """
+        (path, cache hit, dedup key) in input order. The files the cache can't answer are hashed
+        ahead on threads, a chunk at a time (reads and blake2b release the GIL), so hashing does
+        not run one file after another in front of the pool.
+        按输入顺序返回 (路径, 缓存结果, 去重键)。缓存无法回答的文件按块在线程中提前计算哈希
+        （读取与 blake2b 会释放 GIL），哈希不会在进程池之前逐个串行执行。
+        """
+        if not dedupe:
+            for path in paths:
+                yield path, cached(path), None
+            return
+        # one process: nothing runs beside the parent, threads would only add overhead
+        # （单进程时没有并行的工作，线程只会增加开销）
+        hasher = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        try:
+            it = iter(paths)
+            while True:
+                chunk = list(itertools.islice(it, batch_size * 8))
+                if not chunk:
+                    break
+                hits = [cached(path) for path in chunk]
+                misses = [path for path, hit in zip(chunk, hits) if hit is None]
+                if hasher is None:
+                    keys = map(content_key, misses)
+                else:
+                    # contiguous slices, one task per thread (连续分片，每个线程一个任务)
+                    step = -(-len(misses) // workers) or 1
+                    slices = [hasher.submit(list, map(content_key, misses[i:i + step]))
+                              for i in range(0, len(misses), step)]
+                    keys = itertools.chain.from_iterable(f.result() for f in slices)
+                for path, hit in zip(chunk, hits):
+                    if hit is None:
+                        yield path, None, next(keys)
+                        continue
+                    # changed copies of this content can reuse it (此内容的其他已改动副本可复用该结果)
+                    validated.setdefault(dedupe_key(path, hit.content_hash), hit)
+                    yield path, hit, None
+        finally:
+            if hasher is not None:
+                hasher.shutdown(wait=True, cancel_futures=True)
+
+    def remember(res: FileResult) -> FileResult:
+        key = path_keys.pop(res.path, None)
+        if key is not None:
+            # finish() may still change res; keep it as returned (finish() 可能修改 res，保存原样)
+            validated[key] = replace(res, issues=list(res.issues))
+        return res
+
+    def copy_of(path: str, key: str) -> FileResult:
+        source = validated[key]
+        return replace(
+            source,
+            path=path,
+            issues=[replace(issue, path=path) for issue in source.issues],
+            from_cache=False,
+            duplicate_of=source.path,
+            # nothing was read or parsed for a copy; a write is still timed (副本未读取解析；写入仍计时)
+            timings={} if options.get("profile") else None
+        )
+
+    def finish(res: FileResult) -> FileResult:
+        if res.fixed_text is not None:
+            apply_fix(res, fix_archive)
+        st = stats.pop(res.path, None)
+        if st is not None:
+            cache.store(res, st, options)
+        return res
+
+    entries = keyed(paths)
+    if workers <= 1:
+        try:
+            for path, hit, key in entries:
+                if hit is not None:
+                    yield hit
+                    continue
+                if key in validated:
+                    yield finish(copy_of(path, key))
+                    continue
+                if key is not None:
+                    path_keys[path] = key
+                yield finish(remember(validate_file(path, **worker_options)))
+        finally:
+            entries.close()
+        return
+
+    def collect(items: list, future) -> Iterator[FileResult]:
+        fresh = iter(future.result() if future is not None else ())
+        for item in items:
+            if isinstance(item, FileResult):
+                yield item
+            elif isinstance(item, str):
+                yield finish(remember(next(fresh)))
+            else:
+                # an identical copy: its source comes earlier in the input (相同副本：其来源在输入中更靠前)
+                yield finish(copy_of(*item))
+
+    pool: Optional[ProcessPoolExecutor] = None
+
+    def submit(batch: List[str]):
+        nonlocal pool
+        if not batch:
+            return None
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        return pool.submit(_validate_batch, batch, worker_options)
+
+    # (items, future): items are cached results, paths sent with the future, or (path, key) of
+    # identical copies, in input order
+    # （items 为缓存结果、随 future 提交的路径或相同副本的 (路径, 去重键)，保持输入顺序）
+    pending = deque()
+    seen_keys = set()
+    try:
+        items: list = []
+        batch: List[str] = []
+        for path, hit, key in entries:
+            if hit is not None:
+                items.append(hit)
+            else:
+                if key in seen_keys or key in validated:
+                    items.append((path, key))
+                else:
+                    if key is not None:
+                        seen_keys.add(key)
+                        path_keys[path] = key
+                    items.append(path)
+                    batch.append(path)
+            if len(batch) >= batch_size or len(items) >= batch_size * 8:
+                pending.append((items, submit(batch)))
+                items, batch = [], []
+                while pending and (pending[0][1] is None or len(pending) >= workers * 2):
+                    yield from collect(*pending.popleft())
+        if items:
+            pending.append((items, submit(batch)))
+        while pending:
+            yield from collect(*pending.popleft())
+    finally:
+        entries.close()
+        # stop queued batches if the caller stops early (调用方提前停止时取消排队中的批次)
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+def duplicate_groups(hashes: Dict[str, Optional[str]]) -> List[List[str]]:
+    """
+    Groups of files with identical content from {path: content_hash}, largest first.
+    根据 {路径: 内容哈希} 找出内容相同的文件组，文件多的组排在前面。
+    """
+    by_hash: Dict[str, List[str]] = {}
+    for path, digest in hashes.items():
+        if digest is not None:
+            by_hash.setdefault(digest, []).append(path)
+    groups = [sorted(group) for group in by_hash.values() if len(group) > 1]
+    groups.sort(key=lambda group: (-len(group), group[0]))
+    return groups
+
+def format_duplicate_groups(root: str, groups: List[List[str]], max_paths: int = 10) -> str:
+    """Log text for duplicate_groups (相同文件组的日志文本)."""
+    if not groups:
+        return ""
+    lines = ["\n===== Identical files (内容相同的文件) =====\n"]
+    for group in groups:
+        lines.append(f"  {len(group)} copies (份相同副本):\n")
+        for path in group[:max_paths]:
+            lines.append(f"    {os.path.relpath(path, root)}\n")
+        if len(group) > max_paths:
+            lines.append(f"    ... and {len(group) - max_paths} more (另有 {len(group) - max_paths} 个)\n")
+    return "".join(lines)
+
+PROFILE_PHASES = ("read", "parse", "check", "write")
+PROFILE_TOP_DEFAULT = 10
+
+class ScanProfile:
+    """
+    Totals per phase and the slowest files of a profiled scan (profile=True).
+    分析模式扫描（profile=True）的各阶段总耗时与最慢的文件。
 
-    return FileResult(path=path, ok=ok, issues=issues, fixed=fixed)
+    - phase times are summed over worker processes, so they can exceed the wall-clock time
+      （各阶段耗时为所有子进程之和，可能超过实际耗时）
+    - only the top files are kept, in a heap (只用堆保留最慢的若干文件)
+    """
+
+    def __init__(self, top: int = PROFILE_TOP_DEFAULT):
+        self.top = top
+        self.totals: Dict[str, float] = dict.fromkeys(PROFILE_PHASES, 0.0)
+        self.files = 0
+        self._heap: List[Tuple[float, str, Dict[str, float]]] = []
+
+    def add(self, res: FileResult):
+        if not res.timings:
+            return  # cached or an identical copy with nothing written (缓存结果或无需写入的副本)
+        self.files += 1
+        for phase, seconds in res.timings.items():
+            self.totals[phase] += seconds
+        entry = (sum(res.timings.values()), res.path, res.timings)
+        if len(self._heap) < self.top:
+            heapq.heappush(self._heap, entry)
+        elif entry[0] > self._heap[0][0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def slowest(self) -> List[Tuple[float, str, Dict[str, float]]]:
+        """(seconds, path, timings) of the slowest files, slowest first (最慢的文件，由慢到快)."""
+        return sorted(self._heap, reverse=True)
+
+    def as_dict(self, rel: Callable[[str], str]) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "totals": {phase: round(seconds, 6) for phase, seconds in self.totals.items()},
+            "slowest": [
+                {"path": rel(path), "seconds": round(seconds, 6),
+                 "timings": {phase: round(t, 6) for phase, t in timings.items()}}
+                for seconds, path, timings in self.slowest()
+            ],
+        }
+
+def format_profile(root: str, profile: ScanProfile) -> str:
+    """Log text for a ScanProfile (分析结果的日志文本)."""
+    lines = [f"\n===== Profile (耗时分析): {profile.files} file(s) parsed (个文件) =====\n"]
+    lines.append("  Total per phase, summed over workers (各阶段总耗时，所有子进程之和): " + " | ".join(
+        f"{phase} {seconds:.3f}s" for phase, seconds in profile.totals.items()) + "\n")
+    slowest = profile.slowest()
+    if slowest:
+        lines.append(f"  Slowest {len(slowest)} file(s) (最慢的文件):\n")
+        for seconds, path, timings in slowest:
+            phases = ", ".join(f"{phase} {t * 1000:.1f}" for phase, t in timings.items())
+            lines.append(f"    {seconds * 1000:8.1f} ms  {os.path.relpath(path, root)}  ({phases})\n")
+    return "".join(lines)
+
+# ---------- Scan reports (扫描报告) ----------
+
+REPORT_DIRNAME = "JsonDoctorReports"
+TOOL_NAME = "Stardew JSON Doctor"
+
+# issue type -> (SARIF level, short description) (问题类型 → SARIF 级别与简述)
+ISSUE_RULES: Dict[str, Tuple[str, str]] = {
+    "io_error": ("error", "File could not be read"),
+    "io_error_write": ("error", "Fixed file could not be written"),
+    "invalid_json_original": ("error", "Invalid JSON"),
+    "trailing_commas_fixed": ("note", "Trailing commas were removed"),
+    "formatted": ("note", "Layout was normalized"),
+    "duplicate_keys": ("warning", "Duplicate keys in an object"),
+    "nesting_depth": ("error", "Nested deeper than Json.NET allows by default"),
+    "schema_error": ("error", "Field does not match the manifest / Content Patcher schema"),
+    "duplicate_unique_id": ("error", "UniqueID used by more than one mod"),
+    "missing_dependency": ("error", "Required dependency is not installed"),
+    "dependency_version": ("error", "Installed dependency is older than required"),
+    "missing_content_pack_target": ("error", "ContentPackFor target is not installed"),
+}
+
+def report_dir() -> str:
+    """Reports are written next to the script / exe (报告位于脚本或 exe 同目录)."""
+    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(base_dir, REPORT_DIRNAME)
+
+class ScanReport:
+    """
+    Machine-readable scan output, written while the scan runs (扫描过程中同步写出的机器可读报告).
+
+    - NDJSON: one JSON object per line: "file" per result, "mod_issue" per cross-file problem,
+      "duplicate_group" per set of identical files, "profile" for a profiled scan, and a closing
+      "summary"
+      （每行一个对象：每个文件一行 "file"，跨文件问题为 "mod_issue"，每组相同文件为 "duplicate_group"，
+      分析模式扫描为 "profile"，最后是 "summary"）
+    - SARIF 2.1.0: the rule table is written up front and results are appended as they arrive,
+      so nothing is kept in memory; close() finishes the document, with the profile (if any) in
+      the run properties
+      （规则表预先写出，结果到达时即追加，不在内存中累积；close() 负责结束文档，分析结果（如有）写入 run 的 properties）
+    Paths are relative to the scan root (路径相对于扫描根目录).
+    """
+
+    def __init__(self, root: str, ndjson_path: Optional[str] = None, sarif_path: Optional[str] = None):
+        self.root = os.path.abspath(root)
+        self.ndjson_path = ndjson_path
+        self.sarif_path = sarif_path
+        self._ndjson = None
+        self._sarif = None
+        self._sarif_first = True
+        self._profile: Optional[Dict[str, Any]] = None
+        if ndjson_path:
+            os.makedirs(os.path.dirname(os.path.abspath(ndjson_path)), exist_ok=True)
+            self._ndjson = open(ndjson_path, "w", encoding="utf-8", newline="\n")
+        if sarif_path:
+            os.makedirs(os.path.dirname(os.path.abspath(sarif_path)), exist_ok=True)
+            self._sarif = open(sarif_path, "w", encoding="utf-8", newline="\n")
+            self._write_sarif_header()
+
+    def _rel(self, path: str) -> str:
+        return os.path.relpath(path, self.root).replace(os.sep, "/")
+
+    @staticmethod
+    def _issue_dict(issue: FileIssue) -> Dict[str, Any]:
+        return {
+            "issue_type": issue.issue_type,
+            "message": issue.message,
+            "line": issue.line,
+            "column": issue.column,
+            "details": issue.details,
+        }
+
+    def _write_sarif_header(self):
+        rules = [
+            {"id": rule_id, "shortDescription": {"text": text}, "defaultConfiguration": {"level": level}}
+            for rule_id, (level, text) in ISSUE_RULES.items()
+        ]
+        header = json.dumps({
+            "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+            "version": "2.1.0",
+            "runs": [{
+                "tool": {"driver": {"name": TOOL_NAME, "rules": rules}},
+                "originalUriBaseIds": {"SRCROOT": {"uri": pathlib.Path(self.root).as_uri() + "/"}},
+                "results": [],
+            }],
+        }, ensure_ascii=False)
+        # keep the document open at the results array (文档停在 results 数组处，后续追加)
+        self._sarif.write(header[:header.rindex("[]")] + "[\n")
+
+    def _write_sarif_result(self, issue: FileIssue, fixed: bool):
+        location: Dict[str, Any] = {
+            # URI reference: spaces / brackets in mod folder names must be escaped (需对 URI 进行转义)
+            "artifactLocation": {"uri": urllib.parse.quote(self._rel(issue.path)), "uriBaseId": "SRCROOT"}
+        }
+        if issue.line is not None:
+            region = {"startLine": issue.line}
+            if issue.column is not None:
+                region["startColumn"] = issue.column
+            location["region"] = region
+        result = {
+            "ruleId": issue.issue_type,
+            "level": ISSUE_RULES.get(issue.issue_type, ("warning", ""))[0],
+            "message": {"text": issue.message},
+            "locations": [{"physicalLocation": location}],
+            "properties": {"fixed": fixed, "details": issue.details},
+        }
+        if not self._sarif_first:
+            self._sarif.write(",\n")
+        self._sarif_first = False
+        self._sarif.write(json.dumps(result, ensure_ascii=False))
+
+    def add(self, res: FileResult):
+        if self._ndjson is not None:
+            self._ndjson.write(json.dumps({
+                "type": "file",
+                "path": self._rel(res.path),
+                "ok": res.ok,
+                "fixed": res.fixed,
+                "cached": res.from_cache,
+                "duplicate_of": self._rel(res.duplicate_of) if res.duplicate_of else None,
+                "issues": [self._issue_dict(i) for i in res.issues],
+                "timings": res.timings,
+            }, ensure_ascii=False) + "\n")
+        if self._sarif is not None:
+            for issue in res.issues:
+                self._write_sarif_result(issue, res.fixed)
+
+    def add_duplicate_groups(self, groups: List[List[str]]):
+        if self._ndjson is not None:
+            for group in groups:
+                self._ndjson.write(json.dumps(
+                    {"type": "duplicate_group", "paths": [self._rel(p) for p in group]}, ensure_ascii=False
+                ) + "\n")
+
+    def add_profile(self, profile: ScanProfile):
+        self._profile = profile.as_dict(self._rel)
+        if self._ndjson is not None:
+            self._ndjson.write(json.dumps(dict(type="profile", **self._profile), ensure_ascii=False) + "\n")
+
+    def add_mod_issues(self, issues: List[FileIssue]):
+        for issue in issues:
+            if self._ndjson is not None:
+                record = dict(type="mod_issue", path=self._rel(issue.path), **self._issue_dict(issue))
+                self._ndjson.write(json.dumps(record, ensure_ascii=False) + "\n")
+            if self._sarif is not None:
+                self._write_sarif_result(issue, False)
+
+    def close(self, summary: Optional[Dict[str, Any]] = None):
+        if self._ndjson is not None:
+            self._ndjson.write(json.dumps(dict(type="summary", **(summary or {})), ensure_ascii=False) + "\n")
+            self._ndjson.close()
+            self._ndjson = None
+        if self._sarif is not None:
+            if self._profile is not None:
+                properties = json.dumps({"profile": self._profile}, ensure_ascii=False)
+                self._sarif.write(f"\n], \"properties\": {properties}}}]}}\n")
+            else:
+                self._sarif.write("\n]}]}\n")
+            self._sarif.close()
+            self._sarif = None
 
 # ---------- GUI App (图形界面应用) ----------
 
@@ -303,6 +2854,18 @@ class JsonDoctorApp:
         self.backup_var = tk.BooleanVar(value=True)
         self.ignore_comments_var = tk.BooleanVar(value=True)
         self.allow_trailing_var = tk.BooleanVar(value=False)  # new: SMAPI mode toggle
+        self.use_cache_var = tk.BooleanVar(value=True)
+        self.check_schema_var = tk.BooleanVar(value=True)
+        self.format_var = tk.BooleanVar(value=False)
+        self.profile_var = tk.BooleanVar(value=False)
+        self.write_report_var = tk.BooleanVar(value=False)
+        self.scan_cache: Optional[ScanCache] = None  # loaded on first scan (首次扫描时加载)
+
+        # Background scan state (后台扫描状态)
+        self.scan_thread: Optional[threading.Thread] = None
+        self.scan_events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.progress_var = tk.StringVar(value="")
 
         # --- Mods path row (模组路径行) ---
         path_frame = tk.Frame(root)
@@ -313,6 +2876,15 @@ class JsonDoctorApp:
         self.path_entry.pack(side="left", padx=5, expand=True, fill="x")
         tk.Button(path_frame, text="Browse... (浏览…)", command=self.browse_folder).pack(side="left")
 
+        # --- Ignore row (忽略规则行) ---
+        ignore_frame = tk.Frame(root)
+        ignore_frame.pack(fill="x", padx=10, pady=(0, 5))
+
+        tk.Label(ignore_frame, text="Ignore, comma-separated globs (忽略，逗号分隔的通配符):").pack(side="left")
+        self.ignore_var = tk.StringVar(value=", ".join(DEFAULT_IGNORE_GLOBS))
+        self.ignore_entry = tk.Entry(ignore_frame, textvariable=self.ignore_var)
+        self.ignore_entry.pack(side="left", padx=5, expand=True, fill="x")
+
         # --- Options row (选项行) ---
         options_frame = tk.Frame(root)
         options_frame.pack(fill="x", padx=10, pady=5)
@@ -326,14 +2898,14 @@ class JsonDoctorApp:
 
         self.backup_check = tk.Checkbutton(
             options_frame,
-            text="Create .bak backups (推荐，创建 .bak 备份)",
+            text="Back up originals to a zip archive (推荐，将原文件备份到 zip 存档)",
             variable=self.backup_var
         )
         self.backup_check.pack(anchor="w")
 
         self.ignore_comments_check = tk.Checkbutton(
             options_frame,
-            text="Ignore // comments when validating (校验时忽略 // 注释)",
+            text="Ignore // and /* */ comments when validating (校验时忽略 // 与 /* */ 注释)",
             variable=self.ignore_comments_var
         )
         self.ignore_comments_check.pack(anchor="w")
@@ -345,6 +2917,41 @@ class JsonDoctorApp:
         )
         self.allow_trailing_check.pack(anchor="w")
 
+        self.check_schema_check = tk.Checkbutton(
+            options_frame,
+            text="Check manifest.json / content.json fields (校验 manifest.json 与 content.json 字段)",
+            variable=self.check_schema_var
+        )
+        self.check_schema_check.pack(anchor="w")
+
+        self.format_check = tk.Checkbutton(
+            options_frame,
+            text="Normalize layout, comments are kept (规范排版，保留注释)",
+            variable=self.format_var
+        )
+        self.format_check.pack(anchor="w")
+
+        self.profile_check = tk.Checkbutton(
+            options_frame,
+            text="Profile: time each file and list the slowest (耗时分析：记录每个文件的耗时并列出最慢的文件)",
+            variable=self.profile_var
+        )
+        self.profile_check.pack(anchor="w")
+
+        self.use_cache_check = tk.Checkbutton(
+            options_frame,
+            text="Skip unchanged files (scan cache) (跳过未改动的文件 / 扫描缓存)",
+            variable=self.use_cache_var
+        )
+        self.use_cache_check.pack(anchor="w")
+
+        self.write_report_check = tk.Checkbutton(
+            options_frame,
+            text="Write NDJSON + SARIF report (生成 NDJSON 与 SARIF 报告)",
+            variable=self.write_report_var
+        )
+        self.write_report_check.pack(anchor="w")
+
         # --- Buttons row (按钮行) ---
         buttons_frame = tk.Frame(root)
         buttons_frame.pack(fill="x", padx=10, pady=5)
@@ -352,8 +2959,20 @@ class JsonDoctorApp:
         self.run_button = tk.Button(buttons_frame, text="Scan JSON Files (扫描 JSON 文件)", command=self.run_scan)
         self.run_button.pack(side="left")
 
+        self.cancel_button = tk.Button(
+            buttons_frame, text="Cancel (取消)", command=self.cancel_scan, state="disabled"
+        )
+        self.cancel_button.pack(side="left", padx=5)
+
+        tk.Label(buttons_frame, textvariable=self.progress_var, anchor="w").pack(side="left", padx=5)
+
         tk.Button(buttons_frame, text="Clear Log (清空日志)", command=self.clear_log).pack(side="right")
 
+        self.restore_button = tk.Button(
+            buttons_frame, text="Restore Last Backup (恢复上次备份)", command=self.restore_last_backup
+        )
+        self.restore_button.pack(side="right", padx=5)
+
         # --- Log area (日志区域) ---
         log_frame = tk.Frame(root)
         log_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
@@ -386,11 +3005,58 @@ class JsonDoctorApp:
 
     def set_controls_state(self, state: str):
         self.path_entry.config(state=state)
+        self.ignore_entry.config(state=state)
         self.auto_fix_check.config(state=state)
         self.backup_check.config(state=state)
         self.ignore_comments_check.config(state=state)
         self.allow_trailing_check.config(state=state)
+        self.check_schema_check.config(state=state)
+        self.format_check.config(state=state)
+        self.profile_check.config(state=state)
+        self.use_cache_check.config(state=state)
+        self.write_report_check.config(state=state)
         self.run_button.config(state=state)
+        self.restore_button.config(state=state)
+        # Cancel is only usable while the controls are locked (仅在扫描时可取消)
+        self.cancel_button.config(state="normal" if state == "disabled" else "disabled")
+
+    def cancel_scan(self):
+        if self.scan_thread and self.scan_thread.is_alive():
+            self.cancel_event.set()
+            self.cancel_button.config(state="disabled")
+            self.progress_var.set("Cancelling... (正在取消…)")
+
+    def restore_last_backup(self):
+        archive_path = latest_backup()
+        if archive_path is None:
+            messagebox.showinfo(
+                "Restore (恢复)",
+                f"No backup archives found in (未找到备份存档):\n{backup_dir()}"
+            )
+            return
+        try:
+            with zipfile.ZipFile(archive_path) as zf:
+                file_count = sum(1 for m in zf.infolist() if not m.is_dir())
+        except Exception as ex:
+            messagebox.showerror("Error (错误)", f"Cannot read backup (无法读取备份): {ex}")
+            return
+        proceed = messagebox.askyesno(
+            "Confirm Restore (确认恢复)",
+            f"Restore {file_count} file(s) from (从以下存档恢复 {file_count} 个文件):\n"
+            f"{archive_path}\n\n"
+            "Current versions of these files will be overwritten (这些文件的当前版本将被覆盖).\n\n"
+            "Continue? (是否继续？)"
+        )
+        if not proceed:
+            return
+        try:
+            restored = restore_backup(archive_path)
+        except Exception as ex:
+            messagebox.showerror("Error (错误)", f"Restore failed (恢复失败): {ex}")
+            return
+        self.append_log(f"\nRestored from (已从存档恢复) {archive_path}:\n")
+        self.append_log("".join(f"    {p}\n" for p in restored))
+        messagebox.showinfo("Restore (恢复)", f"Restored files (已恢复文件): {len(restored)}")
 
     # ---- Main scan action (主扫描逻辑) ----
 
@@ -407,6 +3073,12 @@ class JsonDoctorApp:
         backup = self.backup_var.get()
         ignore_comments = self.ignore_comments_var.get()
         allow_trailing = self.allow_trailing_var.get()
+        use_cache = self.use_cache_var.get()
+        check_schema = self.check_schema_var.get()
+        format_layout = self.format_var.get()
+        profile = self.profile_var.get()
+        write_report = self.write_report_var.get()
+        ignore = [g.strip() for g in self.ignore_var.get().split(",") if g.strip()]
 
         if auto_fix and allow_trailing:
             # small warning: in SMAPI mode, auto-fix won't touch trailing commas
@@ -420,11 +3092,11 @@ class JsonDoctorApp:
             proceed = messagebox.askyesno("Confirm (确认)", message)
             if not proceed:
                 return
-        elif auto_fix:
+        elif auto_fix or format_layout:
             proceed = messagebox.askyesno(
                 "Confirm Auto-Fix (确认自动修复)",
                 "Auto-fix will modify JSON files (自动修复会修改 JSON 文件)\n"
-                "(after making .bak backups if enabled，如开启则会先创建 .bak 备份).\n\n"
+                "(originals are saved to a backup zip first if enabled，如开启则会先将原文件存入备份 zip).\n\n"
                 "Continue? (是否继续？)"
             )
             if not proceed:
@@ -438,66 +3110,460 @@ class JsonDoctorApp:
             f"Auto-fix (自动修复): {'ON (开启)' if auto_fix else 'OFF (关闭)'} | "
             f"Backups (备份): {'ON (开启)' if backup else 'OFF (关闭)'} | "
             f"Ignore // comments (忽略 // 注释): {'ON (开启)' if ignore_comments else 'OFF (关闭)'} | "
-            f"Allow trailing commas (允许末尾逗号): {'ON (开启)' if allow_trailing else 'OFF (关闭)'}\n\n"
+            f"Allow trailing commas (允许末尾逗号): {'ON (开启)' if allow_trailing else 'OFF (关闭)'} | "
+            f"Field checks (字段校验): {'ON (开启)' if check_schema else 'OFF (关闭)'} | "
+            f"Normalize layout (规范排版): {'ON (开启)' if format_layout else 'OFF (关闭)'} | "
+            f"Profile (耗时分析): {'ON (开启)' if profile else 'OFF (关闭)'} | "
+            f"Scan cache (扫描缓存): {'ON (开启)' if use_cache else 'OFF (关闭)'}\n"
+            f"Ignored (忽略): {', '.join(ignore) if ignore else '-'}\n\n"
         )
 
-        results: List[FileResult] = []
-        total_files = 0
-
-        for path in iter_json_files(mods_path):
-            total_files += 1
-            rel = os.path.relpath(path, mods_path)
-            self.append_log(f"Checking (正在检查) {rel} ... ")
-            res = validate_file(
-                path,
-                auto_fix=auto_fix,
-                backup=backup,
-                ignore_comments=ignore_comments,
-                allow_trailing_commas=allow_trailing
-            )
-            results.append(res)
-
-            if res.ok and not res.fixed:
-                self.append_log("OK (正常)\n")
-            elif res.fixed:
-                self.append_log("FIXED (已修复)\n")
-            else:
-                self.append_log("ERROR (有错误)\n")
-
-            for issue in res.issues:
-                loc = ""
-                if issue.line is not None and issue.column is not None:
-                    loc = f" (line 行 {issue.line}, col 列 {issue.column})"
-                self.append_log(f"    [{issue.issue_type}]{loc} {issue.message}\n")
+        options = {
+            "auto_fix": auto_fix,
+            "backup": backup,
+            "ignore_comments": ignore_comments,
+            "allow_trailing_commas": allow_trailing,
+            "check_schema": check_schema,
+            "format_style": FormatStyle() if format_layout else None,
+            "profile": profile,
+        }
+        self.cancel_event.clear()
+        self.scan_events = queue.Queue()
+        self.scan_thread = threading.Thread(
+            target=self._scan_worker, args=(mods_path, options, use_cache, ignore, write_report), daemon=True
+        )
+        self.scan_thread.start()
+        self.root.after(100, self._drain_scan_events)
+
+    # ---- Background scan (后台扫描) ----
+
+    @staticmethod
+    def format_result(res: FileResult, rel: str) -> str:
+        """Log text for one file (单个文件的日志文本)."""
+        if res.ok and not res.fixed:
+            status = "OK (正常)"
+        elif res.fixed:
+            status = "FIXED (已修复)"
+        else:
+            status = "ERROR (有错误)"
+        if res.from_cache:
+            status += " [unchanged 未改动]"
+        elif res.duplicate_of:
+            status += " [identical copy 相同副本]"
+        lines = [f"Checking (正在检查) {rel} ... {status}\n"]
+        for issue in res.issues:
+            lines.append(f"    [{issue.issue_type}]{format_location(issue)} {issue.message}\n")
+        return "".join(lines)
+
+    def _scan_worker(
+        self,
+        mods_path: str,
+        options: Dict[str, Any],
+        use_cache: bool,
+        ignore: List[str],
+        write_report: bool
+    ):
+        """
+        Runs on a worker thread; never touches Tk widgets, only posts events.
+        在工作线程中运行；不直接操作 Tk 控件，只投递事件。
+        """
+        events = self.scan_events
+        counts = {"total": 0, "ok": 0, "fixed": 0, "bad": 0, "cached": 0, "mod_issues": 0,
+                  "duplicates": 0, "duplicate_groups": 0}
+        hashes: Dict[str, Optional[str]] = {}
+        cache = None
+        archive = None
+        report = None
+        profile = ScanProfile() if options["profile"] else None
+        try:
+            if write_report:
+                stamp = time.strftime("%Y%m%d-%H%M%S")
+                report = ScanReport(
+                    mods_path,
+                    ndjson_path=os.path.join(report_dir(), f"scan-{stamp}.ndjson"),
+                    sarif_path=os.path.join(report_dir(), f"scan-{stamp}.sarif"),
+                )
+            if (options["auto_fix"] or options["format_style"]) and options["backup"]:
+                archive = BackupArchive(mods_path)
+            if use_cache:
+                if self.scan_cache is None:
+                    self.scan_cache = ScanCache(scan_cache_path())
+                cache = self.scan_cache
+
+            paths = []
+            for path in iter_json_files(mods_path, ignore=ignore):
+                if self.cancel_event.is_set():
+                    break
+                paths.append(path)
+            total = len(paths)
+
+            started = time.perf_counter()
+            last_post = started
+            chunk: List[str] = []
+            results = scan_files(paths, cache=cache, archive=archive, **options)
+            try:
+                for res in results:
+                    counts["total"] += 1
+                    if res.from_cache:
+                        counts["cached"] += 1
+                    if res.duplicate_of:
+                        counts["duplicates"] += 1
+                    hashes[res.path] = res.content_hash
+                    if res.fixed:
+                        counts["fixed"] += 1
+                    elif res.ok:
+                        counts["ok"] += 1
+                    else:
+                        counts["bad"] += 1
+                    chunk.append(self.format_result(res, os.path.relpath(res.path, mods_path)))
+                    if report is not None:
+                        report.add(res)
+                    if profile is not None:
+                        profile.add(res)
+
+                    now = time.perf_counter()
+                    if now - last_post >= 0.1 or counts["total"] == total:
+                        done = counts["total"]
+                        rate = done / max(now - started, 1e-6)
+                        eta = (total - done) / rate if rate else 0.0
+                        events.put(("progress", ("".join(chunk), done, total, rate, eta)))
+                        chunk = []
+                        last_post = now
+                    if self.cancel_event.is_set():
+                        break
+            finally:
+                results.close()
+            if cache is not None:
+                if not self.cancel_event.is_set():
+                    cache.prune(mods_path, paths)
+                cache.save()
+            if chunk:
+                events.put(("progress", ("".join(chunk), counts["total"], total, 0.0, 0.0)))
+            if profile is not None:
+                events.put(("log", format_profile(mods_path, profile)))
+                if report is not None:
+                    report.add_profile(profile)
+            if not self.cancel_event.is_set():
+                groups = duplicate_groups(hashes)
+                counts["duplicate_groups"] = len(groups)
+                if report is not None:
+                    report.add_duplicate_groups(groups)
+                if groups:
+                    events.put(("log", format_duplicate_groups(mods_path, groups)))
+                mod_issues = check_mod_consistency(mods_path, paths)
+                counts["mod_issues"] = len(mod_issues)
+                if report is not None:
+                    report.add_mod_issues(mod_issues)
+                if mod_issues:
+                    lines = ["\n===== Mod consistency (模组一致性) =====\n"]
+                    for issue in mod_issues:
+                        lines.append(f"    [{issue.issue_type}] {os.path.relpath(issue.path, mods_path)}"
+                                     f"{format_location(issue)}: {issue.message}\n")
+                    events.put(("log", "".join(lines)))
+        except Exception as ex:
+            events.put(("log", f"\n[scan_error] Scan failed (扫描失败): {ex}\n"))
+        if archive is not None:
+            try:
+                archive.close()
+            except OSError as ex:
+                events.put(("log", f"\n[io_error_write] Backup archive (备份存档): {ex}\n"))
+            if archive.files:
+                events.put(("log", f"\nBackup archive (备份存档): {archive.path} "
+                                   f"({len(archive.files)} file(s) 个文件)\n"))
+        if report is not None:
+            report.close(dict(counts, cancelled=self.cancel_event.is_set()))
+            events.put(("log", f"Report (报告): {report.ndjson_path}\n"
+                               f"              {report.sarif_path}\n"))
+        events.put(("done", (counts, self.cancel_event.is_set())))
+
+    def _drain_scan_events(self):
+        """Apply queued scan events in bulk on the Tk thread (在 Tk 主线程中批量处理扫描事件)."""
+        texts: List[str] = []
+        finished = None
+        while True:
+            try:
+                kind, payload = self.scan_events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                text, done, total, rate, eta = payload
+                texts.append(text)
+                if rate:
+                    self.progress_var.set(
+                        f"{done}/{total} files (文件) | {rate:.0f} files/s (文件/秒) | "
+                        f"ETA (剩余) {int(eta) // 60}:{int(eta) % 60:02d}"
+                    )
+            elif kind == "log":
+                texts.append(payload)
+            elif kind == "done":
+                finished = payload
+
+        if texts:
+            self.log_text.insert(tk.END, "".join(texts))
+            self.log_text.see(tk.END)
+
+        if finished is None:
+            self.root.after(100, self._drain_scan_events)
+        else:
+            self._finish_scan(*finished)
+
+    def _finish_scan(self, counts: Dict[str, int], cancelled: bool):
+        total_files = counts["total"]
+        ok_count = counts["ok"]
+        fixed_count = counts["fixed"]
+        bad_count = counts["bad"]
 
         # Summary (总结)
-        ok_count = sum(1 for r in results if r.ok and not r.fixed)
-        fixed_count = sum(1 for r in results if r.fixed)
-        bad_count = sum(1 for r in results if not r.ok)
-
+        if cancelled:
+            self.append_log("\nScan cancelled (扫描已取消).\n")
         self.append_log("\n===== Summary (总结) =====\n")
         self.append_log(f"Total JSON files scanned (总共扫描的 JSON 文件数): {total_files}\n")
         self.append_log(f"Valid (no changes) (正常，无需修改): {ok_count}\n")
         self.append_log(f"Fixed automatically (已自动修复): {fixed_count}\n")
         self.append_log(f"Still invalid / errors (仍有错误/无法修复): {bad_count}\n")
+        self.append_log(f"Unchanged, reused from scan cache (未改动，沿用缓存结果): {counts['cached']}\n")
+        self.append_log(f"Identical copies checked once (内容相同、只校验一次的副本): {counts['duplicates']} "
+                        f"in {counts['duplicate_groups']} group(s) (组)\n")
+        self.append_log(f"Mod consistency problems (模组一致性问题): {counts['mod_issues']}\n")
 
         # Re-enable UI (重新启用控件)
         self.set_controls_state("normal")
+        self.progress_var.set("")
 
         messagebox.showinfo(
-            "Scan complete (扫描完成)",
+            "Scan cancelled (扫描已取消)" if cancelled else "Scan complete (扫描完成)",
             f"Total JSON files (JSON 文件总数): {total_files}\n"
             f"Valid (正常): {ok_count}\n"
             f"Fixed (已修复): {fixed_count}\n"
-            f"Errors (有错误): {bad_count}"
+            f"Errors (有错误): {bad_count}\n"
+            f"Mod consistency problems (模组一致性问题): {counts['mod_issues']}"
         )
 
+# ---------- Command line (命令行) ----------
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="StardewJsonDoctor",
+        description="Validate (and optionally fix) the JSON files of Stardew Valley mods. "
+                    "Exit code 0 = no errors, 1 = errors found. "
+                    "(校验并可选修复星露谷模组的 JSON 文件；退出码 0 = 无错误，1 = 发现错误)"
+    )
+    parser.add_argument("mods_path", help="Mods folder or a single mod folder (模组文件夹或单个模组文件夹)")
+    parser.add_argument("--fix", action="store_true",
+                        help="auto-fix trailing commas (自动修复末尾多余逗号)")
+    parser.add_argument("--no-backup", action="store_true",
+                        help="do not back up originals before fixing (修复前不备份原文件)")
+    parser.add_argument("--strict-comments", action="store_true",
+                        help="treat // and /* */ comments as errors (将注释视为错误)")
+    parser.add_argument("--allow-trailing-commas", action="store_true",
+                        help="SMAPI mode: trailing commas are valid (SMAPI 模式：末尾逗号视为合法)")
+    parser.add_argument("--no-schema", action="store_true",
+                        help="skip manifest.json / content.json field checks (跳过字段校验)")
+    parser.add_argument("--format", action="store_true",
+                        help="normalize layout, keeping comments; implies writing files "
+                             "(规范排版并保留注释；会写回文件)")
+    parser.add_argument("--indent", metavar="N|tab", default=None,
+                        help="indent for --format, default: detected per file (排版缩进，默认按文件自动检测)")
+    parser.add_argument("--eol", choices=("lf", "crlf"), default=None,
+                        help="line endings for --format, default: detected per file (换行符，默认按文件自动检测)")
+    parser.add_argument("--sort-keys", action="store_true",
+                        help="with --format, sort object keys (配合 --format 按键名排序)")
+    parser.add_argument("--profile", nargs="?", type=int, const=PROFILE_TOP_DEFAULT, default=None, metavar="N",
+                        help="time read / parse / check / write per file and list the N slowest, "
+                             f"default {PROFILE_TOP_DEFAULT} (记录每个文件各阶段耗时并列出最慢的 N 个)")
+    parser.add_argument("--ignore", action="append", metavar="GLOB",
+                        help="glob to skip, repeatable; replaces the defaults "
+                             f"{', '.join(DEFAULT_IGNORE_GLOBS)} (要跳过的通配符，可重复；会替换默认值)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes, default: CPU count (子进程数，默认为 CPU 核数)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="re-check every file instead of skipping unchanged ones (不跳过未改动的文件)")
+    parser.add_argument("--ndjson", metavar="PATH", help="write an NDJSON report (生成 NDJSON 报告)")
+    parser.add_argument("--sarif", metavar="PATH", help="write a SARIF report (生成 SARIF 报告)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="also list files without issues (同时列出没有问题的文件)")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and re-check files when they change (持续运行，文件改动时重新检查)")
+    parser.add_argument("--interval", type=float, default=2.0,
+                        help="watch polling interval in seconds (监视轮询间隔，单位秒)")
+    return parser
+
+def snapshot_files(paths: Iterable[str]) -> Dict[str, Tuple[int, int]]:
+    """path -> (mtime_ns, size) for change polling (用于轮询改动的快照)."""
+    snap: Dict[str, Tuple[int, int]] = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        snap[path] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+def _print_mod_issues(root: str, issues: List[FileIssue]):
+    if issues:
+        print("\n===== Mod consistency (模组一致性) =====")
+        for issue in issues:
+            print(f"    [{issue.issue_type}] {os.path.relpath(issue.path, root)}{format_location(issue)}: "
+                  f"{issue.message}")
+
+def cli_main(argv: List[str]) -> int:
+    """Command line entry point; returns the exit code (命令行入口，返回退出码)."""
+    # consoles that cannot show Chinese should not crash the run (控制台无法显示中文时不要中断)
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.reconfigure(errors="replace")
+        except (AttributeError, ValueError):
+            pass
+    args = build_arg_parser().parse_args(argv)
+    root = os.path.abspath(args.mods_path)
+    if not os.path.isdir(root):
+        print(f"'{root}' is not a valid folder (不是有效的文件夹).", file=sys.stderr)
+        return 2
+
+    options = {
+        "auto_fix": args.fix,
+        "backup": not args.no_backup,
+        "ignore_comments": not args.strict_comments,
+        "allow_trailing_commas": args.allow_trailing_commas,
+        "check_schema": not args.no_schema,
+        "format_style": None,
+        "profile": args.profile is not None,
+    }
+    if args.format:
+        indent = args.indent
+        if indent is not None:
+            if indent.lower() == "tab":
+                indent = "\t"
+            elif indent.isdigit() and int(indent) <= 16:
+                indent = " " * int(indent)
+            else:
+                print(f"--indent must be a number or 'tab' (必须是数字或 tab): {indent}", file=sys.stderr)
+                return 2
+        options["format_style"] = FormatStyle(
+            indent=indent,
+            eol={"lf": "\n", "crlf": "\r\n"}.get(args.eol),
+            sort_keys=args.sort_keys,
+        )
+    ignore = args.ignore if args.ignore is not None else list(DEFAULT_IGNORE_GLOBS)
+    cache = None if args.no_cache else ScanCache(scan_cache_path())
+    archive = BackupArchive(root) if (args.fix or args.format) and not args.no_backup else None
+    report = ScanReport(root, args.ndjson, args.sarif) if args.ndjson or args.sarif else None
+    counts = {"total": 0, "ok": 0, "fixed": 0, "bad": 0, "cached": 0, "mod_issues": 0,
+              "duplicates": 0, "duplicate_groups": 0}
+    file_ok: Dict[str, bool] = {}  # latest state per file, for the exit code (每个文件的最新状态)
+    hashes: Dict[str, Optional[str]] = {}
+
+    def check(paths: List[str]) -> List[str]:
+        """Validate paths, print problems, return the files that were fixed (校验并输出问题)."""
+        fixed_paths = []
+        profile = ScanProfile(args.profile) if args.profile is not None else None
+        for res in scan_files(paths, workers=args.workers, cache=cache, archive=archive, **options):
+            counts["total"] += 1
+            counts["cached"] += res.from_cache
+            counts["duplicates"] += res.duplicate_of is not None
+            hashes[res.path] = res.content_hash
+            if res.fixed:
+                counts["fixed"] += 1
+                fixed_paths.append(res.path)
+            elif res.ok:
+                counts["ok"] += 1
+            else:
+                counts["bad"] += 1
+            file_ok[res.path] = res.ok
+            if args.verbose or res.issues or not res.ok:
+                print(JsonDoctorApp.format_result(res, os.path.relpath(res.path, root)), end="")
+            if report is not None:
+                report.add(res)
+            if profile is not None:
+                profile.add(res)
+        if profile is not None:
+            print(format_profile(root, profile), end="")
+            if report is not None:
+                report.add_profile(profile)
+        if archive is not None:
+            archive.close()  # one fsync per scan / watch round (每次扫描或每轮监视只 fsync 一次)
+        if cache is not None:
+            cache.save()
+        return fixed_paths
+
+    def check_mods(paths: List[str]) -> int:
+        issues = check_mod_consistency(root, paths)
+        _print_mod_issues(root, issues)
+        if report is not None:
+            report.add_mod_issues(issues)
+        counts["mod_issues"] += len(issues)
+        return len(issues)
+
+    mod_problems = 0
+    try:
+        paths = list(iter_json_files(root, ignore=ignore))
+        started = time.perf_counter()
+        check(paths)
+        groups = duplicate_groups(hashes)
+        counts["duplicate_groups"] = len(groups)
+        print(format_duplicate_groups(root, groups), end="")
+        if report is not None:
+            report.add_duplicate_groups(groups)
+        mod_problems = check_mods(paths)
+        if cache is not None:
+            cache.prune(root, paths)
+            cache.save()
+        print("\n===== Summary (总结) =====")
+        print(f"Total JSON files scanned (总共扫描的 JSON 文件数): {counts['total']}")
+        print(f"Valid (no changes) (正常，无需修改): {counts['ok']}")
+        print(f"Fixed automatically (已自动修复): {counts['fixed']}")
+        print(f"Still invalid / errors (仍有错误/无法修复): {counts['bad']}")
+        print(f"Unchanged, reused from scan cache (未改动，沿用缓存结果): {counts['cached']}")
+        print(f"Identical copies checked once (内容相同、只校验一次的副本): {counts['duplicates']} "
+              f"in {len(groups)} group(s) (组)")
+        print(f"Mod consistency problems (模组一致性问题): {mod_problems}")
+        print(f"Time (耗时): {time.perf_counter() - started:.2f}s")
+
+        if args.watch:
+            print(f"\nWatching (正在监视) {root} every {args.interval:g}s, Ctrl+C to stop (按 Ctrl+C 停止)...")
+            snap = snapshot_files(paths)
+            while True:
+                time.sleep(args.interval)
+                paths = list(iter_json_files(root, ignore=ignore))
+                new_snap = snapshot_files(paths)
+                changed = [p for p, sig in new_snap.items() if snap.get(p) != sig]
+                removed = [p for p in snap if p not in new_snap]
+                for path in removed:
+                    file_ok.pop(path, None)
+                if changed:
+                    print(f"\n[{time.strftime('%H:%M:%S')}] Changed files (改动的文件): {len(changed)}")
+                    # our own fixes change mtimes: take them into the snapshot (自身修复导致的改动计入快照)
+                    new_snap.update(snapshot_files(check(changed)))
+                if any(os.path.basename(p).lower() == "manifest.json" for p in changed + removed):
+                    mod_problems = check_mods(paths)
+                snap = new_snap
+    except KeyboardInterrupt:
+        print("\nStopped (已停止).")
+    finally:
+        if cache is not None:
+            cache.save()
+        if archive is not None:
+            archive.close()
+        if archive is not None and archive.files:
+            print(f"Backup archive (备份存档): {archive.path}")
+        if report is not None:
+            report.close(counts)
+
+    return 1 if mod_problems or not all(file_ok.values()) else 0
+
 # ---------- Entrypoint (程序入口) ----------
 
 def main():
+    if len(sys.argv) > 1:
+        sys.exit(cli_main(sys.argv[1:]))
+    if tk is None:
+        sys.exit("tkinter is not available; use the command line, see --help "
+                 "(tkinter 不可用，请使用命令行模式，见 --help)")
     root = tk.Tk()
     app = JsonDoctorApp(root)
     root.mainloop()
 
 if __name__ == "__main__":
+    # needed for the process pool in frozen (exe) builds (打包为 exe 时进程池需要)
+    multiprocessing.freeze_support()
     main()
@@ -1,7 +1,14 @@
+import gzip
 import json
+import multiprocessing
 import os
+import queue
 import re
+import sys
+import threading
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from tkinter import filedialog, messagebox, ttk
 
 
@@ -23,87 +30,50 @@ def select_json_file(initial_dir=".", title="Select JSON File (选择 JSON 文
     return path or None
 
 
-def strip_json_comments(text):
-    """
-    删除字符串外的 // 行尾注释 (Strip // end-of-line comments outside of strings).
-
-    只处理 // 风格注释，不动 /* */，避免误伤内容。
-    This only strips // comments, not /* */, to avoid breaking content.
-    """
-    result_lines = []
-    for line in text.splitlines():
-        new_line_chars = []
-        in_string = False
-        escape = False
-        i = 0
-        while i < len(line):
-            ch = line[i]
-
-            if ch == '"' and not escape:
-                # 进入或离开字符串 (enter or leave string)
-                in_string = not in_string
-                new_line_chars.append(ch)
-            elif not in_string and ch == "/" and i + 1 < len(line) and line[i + 1] == "/":
-                # 字符串外且遇到 //，后面整行丢弃 (outside string and see // → drop rest of line)
-                break
-            else:
-                new_line_chars.append(ch)
+# 注释主体不能越过 */ 或行尾，回溯时也不会吞到后面的注释
+# (comment bodies cannot run past */ or the line end, even when backtracking into a later comment)
+_LINE_COMMENT = r'//[^\n]*(?![^\n])'
+_BLOCK_COMMENT = r'/\*(?:[^*]|\*(?!/))*\*/'
 
-            # 处理转义符 (handle escape character)
-            if ch == "\\" and not escape:
-                escape = True
-            else:
-                escape = False
+# 一次匹配一个“有意义”的片段：字符串原样保留，注释与多余逗号被删除
+# (matches one meaningful piece at a time: strings are kept, comments and trailing commas dropped)
+_JSON_CLEAN_PATTERN = re.compile(
+    r'("[^"\\]*(?:\\.[^"\\]*)*")'                                          # 1: 字符串 (string)
+    r'|' + _LINE_COMMENT +                                                 # // 行尾注释 (line comment)
+    r'|(' + _BLOCK_COMMENT + r')'                                          # 2: /* */ 块注释 (block comment)
+    r'|,(?=(?:\s|' + _LINE_COMMENT + r'|' + _BLOCK_COMMENT + r')*[}\]])'   # 紧挨 } 或 ] 的逗号 (trailing comma)
+)
+# 没有这些标记时无需处理 (nothing to strip without one of these)
+_JSON_CLEAN_HINT = re.compile(r'/[/*]|,\s*[}\]]')
 
-            i += 1
 
-        result_lines.append("".join(new_line_chars))
-    return "\n".join(result_lines)
+def _clean_piece(match):
+    string = match.group(1)
+    if string is not None:
+        return string
+    block = match.group(2)
+    if block is not None:
+        # 保留换行，错误提示中的行号不变 (keep line breaks so error line numbers stay right)
+        return "\n" * block.count("\n")
+    return ""
 
 
-def strip_trailing_commas(text):
+def strip_json_comments_and_commas(text):
     """
-    删除字符串外、紧挨 } 或 ] 之前的多余逗号 (Strip trailing commas before } or ] outside strings).
+    一次扫描删除字符串外的 // 与 /* */ 注释以及 } 或 ] 之前的多余逗号
+    (Strip // and /* */ comments and trailing commas before } or ] outside strings, in one pass).
+
+    正则直接在引号与注释标记之间跳转，字符串状态跨行也正确。
+    The regex jumps straight between quotes and comment markers, so string state is right across lines.
 
     示例:
-      {"a":1,}   -> {"a":1}
-      [1,2,]     -> [1,2]
+      {"a":1, /* x */}              -> {"a":1 }
+      [1,2, // x\n]                 -> [1,2 \n]
+      [1, /* a */ 2 /* b */]        -> [1,  2 ]      (逗号后还有值，保留 / comma before a value is kept)
     """
-    result_chars = []
-    in_string = False
-    escape = False
-    i = 0
-    length = len(text)
-
-    while i < length:
-        ch = text[i]
-
-        if ch == '"' and not escape:
-            in_string = not in_string
-            result_chars.append(ch)
-        elif not in_string and ch == ",":
-            # Look ahead for whitespace + } or ]
-            j = i + 1
-            while j < length and text[j] in " \t\r\n":
-                j += 1
-            if j < length and text[j] in "}]":
-                # skip this extra comma (忽略多余逗号)
-                i += 1
-                continue
-            else:
-                result_chars.append(ch)
-        else:
-            result_chars.append(ch)
-
-        # 转义处理 (escape handling)
-        if ch == "\\" and not escape:
-            escape = True
-        else:
-            escape = False
-
-        i += 1
-
-    return "".join(result_chars)
+    if _JSON_CLEAN_HINT.search(text) is None:
+        return text
+    return _JSON_CLEAN_PATTERN.sub(_clean_piece, text)
 
 
 def load_json_file(path):
@@ -111,9 +81,8 @@ def load_json_file(path):
     with open(path, "r", encoding="utf-8-sig") as f:
         raw = f.read()
 
-    # 去掉 // 注释 + 末尾逗号 (strip comments + trailing commas)
-    cleaned = strip_json_comments(raw)
-    cleaned = strip_trailing_commas(cleaned)
+    # 去掉注释 + 末尾逗号 (strip comments + trailing commas)
+    cleaned = strip_json_comments_and_commas(raw)
 
     return json.loads(cleaned)
 
@@ -140,6 +109,375 @@ def extract_tokens(text):
     return set(TOKEN_PATTERN.findall(text))
 
 
+def compare_translations(english_data, translated_data):
+    """
+    比对两份拍平后的翻译 (Compare two flattened translations).
+
+    返回 (missing, extra, token_mismatches)，键均已排序。
+    Returns (missing, extra, token_mismatches), each with sorted keys.
+    """
+    eng_keys = set(english_data.keys())
+    tr_keys = set(translated_data.keys())
+
+    missing = {k: english_data[k] for k in sorted(eng_keys - tr_keys)}
+    extra = {k: translated_data[k] for k in sorted(tr_keys - eng_keys)}
+
+    # 检查占位符 (Check tokens)
+    mismatches = {}
+    for key in sorted(eng_keys & tr_keys):
+        eng_tokens = extract_tokens(english_data[key])
+        tr_tokens = extract_tokens(translated_data[key])
+        if eng_tokens != tr_tokens:
+            mismatches[key] = {
+                "english": english_data[key],
+                "translated": translated_data[key],
+                "eng_tokens": sorted(eng_tokens),
+                "tr_tokens": sorted(tr_tokens),
+            }
+    return missing, extra, mismatches
+
+
+def build_report_data(missing_keys, extra_keys, token_mismatches):
+    """比对结果转为导出用的列表 (Comparison results as exportable lists)."""
+    return {
+        "missing_keys": [
+            {"key": k, "english": missing_keys[k]}
+            for k in sorted(missing_keys.keys())
+        ],
+        "token_mismatches": [
+            {
+                "key": k,
+                "english": v["english"],
+                "translated": v["translated"],
+                "eng_tokens": v["eng_tokens"],
+                "tr_tokens": v["tr_tokens"],
+            }
+            for k, v in sorted(token_mismatches.items())
+        ],
+        "extra_keys": [
+            {"key": k, "translated": extra_keys[k]}
+            for k in sorted(extra_keys.keys())
+        ],
+    }
+
+
+def write_report_text(f, report_data, heading="#"):
+    """以文本形式写出 build_report_data 的结果 (Write build_report_data output as text)."""
+    f.write(f"{heading}# Missing keys (缺少键)\n")
+    for item in report_data["missing_keys"]:
+        f.write(f"{item['key']}: {item['english']}\n")
+
+    f.write(f"\n{heading}# Token mismatches (占位符不匹配)\n")
+    for item in report_data["token_mismatches"]:
+        f.write(f"{item['key']}:\n")
+        f.write(f"  EN: {item['english']}\n")
+        f.write(f"  TR: {item['translated']}\n")
+        f.write(f"  EN tokens: {', '.join(item['eng_tokens'])}\n")
+        f.write(f"  TR tokens: {', '.join(item['tr_tokens'])}\n")
+
+    f.write(f"\n{heading}# Extra / unused keys (多余 / 未使用键)\n")
+    for item in report_data["extra_keys"]:
+        f.write(f"{item['key']}: {item['translated']}\n")
+
+
+# ---- Batch i18n folders (批量 i18n 文件夹) ---------------------------------------
+
+I18N_FOLDER_NAME = "i18n"
+I18N_DEFAULT_FILE = "default.json"
+# 不含模组内容的目录；SMAPI 也会跳过以 . 开头的文件夹
+# (folders without mod content; SMAPI also skips folders starting with .)
+BATCH_SKIP_DIRS = {"bin", "obj"}
+
+
+def find_i18n_folders(root):
+    """
+    查找根目录下所有含 default.json 的 i18n 文件夹 (Find every i18n folder with a default.json under root).
+
+    返回 [(模组相对路径, default.json 路径, {语言: 文件路径})]，按模组排序。
+    Returns [(mod relative path, default.json path, {locale: file path})], sorted by mod.
+    """
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d.lower() not in BATCH_SKIP_DIRS
+        )
+        if os.path.basename(dirpath).lower() != I18N_FOLDER_NAME:
+            continue
+        default_name = next((n for n in filenames if n.lower() == I18N_DEFAULT_FILE), None)
+        if default_name is None:
+            continue
+        locales = {}
+        for name in sorted(filenames):
+            locale, ext = os.path.splitext(name)
+            if ext.lower() == ".json" and name != default_name:
+                locales[locale] = os.path.join(dirpath, name)
+        mod = os.path.relpath(os.path.dirname(dirpath), root)
+        found.append((mod, os.path.join(dirpath, default_name), locales))
+    found.sort(key=lambda item: item[0].lower())
+    return found
+
+
+def load_flat_translation(path, cache=None):
+    """
+    加载并拍平翻译文件，顶层必须是对象 (Load and flatten a translation file; top level must be an object).
+
+    提供 cache（TranslationCache）时，未改动的文件直接取缓存，返回的字典请勿修改。
+    With a cache (TranslationCache), unchanged files come from it; do not modify the returned dict.
+    """
+    if cache is not None:
+        return cache.load(path)
+    data = load_json_file(path)
+    if not isinstance(data, dict):
+        raise ValueError("must be a JSON object at the top level (顶层必须是一个 JSON 对象 { })")
+    return flatten_dict(data)
+
+
+TRANSLATION_CACHE_FILENAME = "translation_cache.json.gz"
+TRANSLATION_CACHE_VERSION = 1
+TRANSLATION_CACHE_MAX_ENTRIES = 2048
+
+
+def translation_stamp(path):
+    """缓存用的文件标记 (mtime_ns, size) (File stamp used by the cache)."""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def translation_cache_path():
+    """磁盘缓存位于脚本 / exe 同目录 (The disk cache sits next to the script / exe)."""
+    base_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    return os.path.join(base_dir, TRANSLATION_CACHE_FILENAME)
+
+
+class TranslationCache:
+    """
+    拍平后翻译的缓存，按 路径 + 修改时间 + 大小 判断是否有效
+    (Cache of flattened translations, valid while path + mtime + size match).
+
+    - 内存中最多保留 max_entries 个文件，最久未使用的先淘汰 (LRU)
+      (at most max_entries files in memory, least recently used evicted first)
+    - 提供 disk_path 时，启动时读取、save() 时写出内存内容（gzip 压缩的紧凑 JSON）
+      (with disk_path, the memory contents are read at start and written by save() as compact gzip JSON)
+    - 可在线程间共用，批量比对在后台线程中使用它 (safe to share between threads; the batch uses it
+      from a background thread)
+    """
+
+    def __init__(self, max_entries=TRANSLATION_CACHE_MAX_ENTRIES, disk_path=None):
+        self.max_entries = max_entries
+        self.disk_path = disk_path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # 绝对路径 -> ((mtime_ns, size), 拍平数据) (abs path -> (stamp, flat))
+        self._lock = threading.Lock()
+        self._dirty = False
+        if disk_path:
+            self._load_disk()
+
+    @staticmethod
+    def _key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def load(self, path):
+        """返回拍平后的翻译，必要时重新解析 (Return the flattened translation, parsing only when needed)."""
+        stamp, flat = self.lookup(path)
+        if flat is None:
+            flat = load_flat_translation(path)
+            self.store(path, stamp, flat)
+        return flat
+
+    def lookup(self, path):
+        """
+        返回 (stamp, 拍平数据)；文件改动过或不在缓存中时拍平数据为 None
+        (Returns (stamp, flat data); flat data is None if the file changed or is not cached).
+        """
+        key = self._key(path)
+        stamp = translation_stamp(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return stamp, entry[1]
+            self.misses += 1
+        return stamp, None
+
+    def store(self, path, stamp, flat):
+        """记录读取时标记为 stamp 的文件的解析结果 (Record the parsed file, stamped when it was read)."""
+        with self._lock:
+            key = self._key(path)
+            self._entries[key] = (stamp, flat)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def _load_disk(self):
+        try:
+            with gzip.open(self.disk_path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError, EOFError):
+            return  # 没有或损坏的缓存等同于空缓存 (missing / broken cache = empty cache)
+        if not isinstance(data, dict) or data.get("version") != TRANSLATION_CACHE_VERSION:
+            return
+        entries = data.get("entries")
+        if not isinstance(entries, list):
+            return
+        loaded = OrderedDict()
+        for entry in entries[-self.max_entries:]:
+            # 任何格式不对的条目都让整个缓存作废 (any malformed entry invalidates the whole cache)
+            if not (isinstance(entry, list) and len(entry) == 4):
+                return
+            key, mtime_ns, size, flat = entry
+            if not (isinstance(key, str) and isinstance(flat, dict)
+                    and type(mtime_ns) is int and type(size) is int):
+                return
+            loaded[key] = ((mtime_ns, size), flat)
+        self._entries = loaded
+
+    def save(self):
+        """把内存内容写入磁盘（无变化时不写）(Write the memory contents to disk, if anything changed)."""
+        if not self.disk_path or not self._dirty:
+            return
+        with self._lock:
+            # 按使用顺序写出，读取时保留最近使用的 (written in use order; loading keeps the most recent)
+            entries = [[key, stamp[0], stamp[1], flat] for key, (stamp, flat) in self._entries.items()]
+            self._dirty = False
+        tmp_path = self.disk_path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump({"version": TRANSLATION_CACHE_VERSION, "entries": entries}, f,
+                      ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.disk_path)
+
+    def delete_disk(self):
+        """删除磁盘缓存文件 (Delete the disk cache file)."""
+        if self.disk_path and os.path.exists(self.disk_path):
+            os.remove(self.disk_path)
+
+
+def _compare_mod(default_path, locales, known=None):
+    """
+    进程池任务：比对一个模组的所有语言文件 (Pool task: compare every locale file of one mod).
+
+    known 为 {路径: 拍平数据}，即父进程缓存中未改动的文件，这些文件不再解析。
+    返回 (结果行, 新解析的文件 {路径: (stamp, 拍平数据)})；known 为 None 时不收集新解析的文件。
+    known is {path: flat data} for files unchanged in the parent's cache; those are not parsed again.
+    Returns (result row, newly parsed files {path: (stamp, flat data)}); with known None nothing is collected.
+    """
+    parsed = {}
+
+    def load(path):
+        if known is None:
+            return load_flat_translation(path)
+        flat = known.get(path)
+        if flat is None:
+            stamp = translation_stamp(path)
+            flat = load_flat_translation(path)
+            parsed[path] = (stamp, flat)
+        return flat
+
+    try:
+        english = load(default_path)
+    except Exception as e:
+        return {"default": {"path": default_path, "error": str(e)}}, parsed
+    row = {}
+    for locale, path in locales.items():
+        try:
+            translated = load(path)
+        except Exception as e:
+            row[locale] = {"path": path, "error": str(e)}
+            continue
+        missing, extra, mismatches = compare_translations(english, translated)
+        row[locale] = {"path": path, "missing": missing, "extra": extra, "token_mismatches": mismatches}
+    return row, parsed
+
+
+def batch_compare_i18n(root, max_workers=None, cache=None):
+    """
+    批量比对根目录下所有模组的 i18n 文件夹 (Compare every mod's i18n folder under root).
+
+    - 每个模组是一个进程池任务：default.json 只加载一次，再与其所有语言文件比对
+      (each mod is one process-pool task: default.json is loaded once, then compared against all its locales)
+    - 返回 {模组: {语言: 结果}}；结果含 missing / extra / token_mismatches，读取失败时为 error；
+      default.json 本身无法读取时，该模组只有一项 "default" 错误
+      (returns {mod: {locale: result}}; a result has missing / extra / token_mismatches, or error
+      if the file could not be read; a mod whose default.json fails has a single "default" error)
+    - 提供 cache 时，未改动的文件不再解析，全部未改动的模组直接在本进程比对；新解析的结果写回 cache
+      (with a cache, unchanged files are not parsed again and fully unchanged mods are compared in this
+      process; newly parsed files are stored back in the cache)
+    """
+    folders = find_i18n_folders(root)
+    matrix = {}
+    pending = []
+    pool = None
+    try:
+        for mod, default_path, locales in folders:
+            matrix[mod] = None
+            known = None
+            if cache is not None:
+                known = {}
+                for path in (default_path, *locales.values()):
+                    try:
+                        flat = cache.lookup(path)[1]
+                    except OSError:
+                        continue  # 由任务报告读取错误 (the task reports the read error)
+                    if flat is not None:
+                        known[path] = flat
+                if len(known) == len(locales) + 1:
+                    matrix[mod] = _compare_mod(default_path, locales, known)[0]
+                    continue
+            if max_workers == 1:
+                pending.append((mod, None, _compare_mod(default_path, locales, known)))
+                continue
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=max_workers)
+            pending.append((mod, pool.submit(_compare_mod, default_path, locales, known), None))
+        for mod, future, result in pending:
+            row, parsed = future.result() if future is not None else result
+            matrix[mod] = row
+            for path, (stamp, flat) in parsed.items():
+                cache.store(path, stamp, flat)
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+    return matrix
+
+
+def matrix_locales(matrix):
+    """矩阵中出现的全部语言，已排序 (All locales in the matrix, sorted)."""
+    return sorted({locale for row in matrix.values() for locale in row}, key=str.lower)
+
+
+def format_matrix_cell(result):
+    """单元格文本：缺少/多余/占位符，或 ERR (Cell text: missing/extra/tokens, or ERR)."""
+    if result is None:
+        return "-"
+    if "error" in result:
+        return "ERR"
+    return f"{len(result['missing'])}/{len(result['extra'])}/{len(result['token_mismatches'])}"
+
+
+def format_matrix(matrix):
+    """
+    以文本表格输出矩阵 (Matrix as a text table).
+
+    每格为 缺少/多余/占位符不匹配 的数量，- 表示该模组没有此语言。
+    Each cell is missing/extra/token-mismatch counts; - means the mod has no such locale.
+    """
+    locales = matrix_locales(matrix)
+    rows = [["Mod (模组)"] + locales]
+    for mod, row in matrix.items():
+        rows.append([mod] + [format_matrix_cell(row.get(locale)) for locale in locales])
+    widths = [max(len(r[i]) for r in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(w) for cell, w in zip(r, widths)).rstrip() for r in rows]
+    lines.append("Cells: missing/extra/token mismatches (格式：缺少/多余/占位符不匹配), - = none (无此语言)")
+    return "\n".join(lines)
+
+
 class LocalizationHelperFrame(ttk.Frame):
     """翻译版对比最新英文默认版工具界面 (Translated vs latest default English tool UI)."""
 
@@ -153,6 +491,12 @@ class LocalizationHelperFrame(ttk.Frame):
         self.missing_keys = {}
         self.extra_keys = {}
         self.token_mismatches = {}
+        self.batch_root = None
+        self.batch_matrix = {}
+        self.batch_results = queue.Queue()
+        # 未改动的文件不再解析 (unchanged files are not parsed again)
+        self.cache = TranslationCache(disk_path=translation_cache_path())
+        self.disk_cache_var = tk.BooleanVar(value=True)
 
         self._build_ui()
 
@@ -210,6 +554,13 @@ class LocalizationHelperFrame(ttk.Frame):
         )
         export_btn.pack(side="left", padx=4)
 
+        disk_cache_check = ttk.Checkbutton(
+            action_frame,
+            text="Keep parsed files on disk (在磁盘上保留解析结果)",
+            variable=self.disk_cache_var
+        )
+        disk_cache_check.pack(side="left", padx=8)
+
         # 结果概览 (Result summary)
         summary_frame = ttk.LabelFrame(self, text="Summary (结果概览)")
         summary_frame.pack(fill="x", padx=8, pady=8)
@@ -232,23 +583,66 @@ class LocalizationHelperFrame(ttk.Frame):
         )
         self.summary_tokens.grid(row=2, column=0, padx=4, pady=2, sticky="w")
 
+        # 批量：整个文件夹 (Batch: whole folder)
+        batch_frame = ttk.LabelFrame(
+            self,
+            text="Batch: every i18n folder under a Mods folder (批量：Mods 文件夹下的所有 i18n 文件夹)"
+        )
+        batch_frame.pack(fill="both", expand=True, padx=8, pady=8)
+
+        batch_actions = ttk.Frame(batch_frame)
+        batch_actions.pack(fill="x", padx=4, pady=4)
+
+        self.batch_btn = ttk.Button(
+            batch_actions,
+            text="Compare All Locales (比对所有语言)",
+            command=self.batch_compare
+        )
+        self.batch_btn.pack(side="left", padx=4)
+
+        batch_export_btn = ttk.Button(
+            batch_actions,
+            text="Export Matrix Report (导出矩阵报告)",
+            command=self.export_batch_report
+        )
+        batch_export_btn.pack(side="left", padx=4)
+
+        ttk.Label(
+            batch_actions,
+            text="Cells: missing / extra / token mismatches (格式：缺少 / 多余 / 占位符不匹配)"
+        ).pack(side="left", padx=8)
+
+        # 矩阵：每行一个模组，每列一种语言 (Matrix: one row per mod, one column per locale)
+        tree_frame = ttk.Frame(batch_frame)
+        tree_frame.pack(fill="both", expand=True, padx=4, pady=4)
+        self.matrix_tree = ttk.Treeview(tree_frame, show="headings", height=6)
+        tree_yscroll = ttk.Scrollbar(tree_frame, orient="vertical", command=self.matrix_tree.yview)
+        tree_xscroll = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.matrix_tree.xview)
+        self.matrix_tree.configure(yscrollcommand=tree_yscroll.set, xscrollcommand=tree_xscroll.set)
+        self.matrix_tree.grid(row=0, column=0, sticky="nsew")
+        tree_yscroll.grid(row=0, column=1, sticky="ns")
+        tree_xscroll.grid(row=1, column=0, sticky="ew")
+        tree_frame.rowconfigure(0, weight=1)
+        tree_frame.columnconfigure(0, weight=1)
+
     # ---- JSON loading helpers -------------------------------------------------
 
-    def _validate_top_level_dict(self, data, role_text):
-        """确保顶层是对象 { } (Ensure top-level JSON is an object {})."""
-        if not isinstance(data, dict):
-            raise ValueError(
-                f"{role_text} must be a JSON object at the top level (顶层 {role_text} 必须是一个 JSON 对象 {{ }}。)"
-            )
+    def save_cache(self):
+        """按选项保存或删除磁盘缓存 (Save or delete the disk cache, per the option)."""
+        try:
+            if self.disk_cache_var.get():
+                self.cache.save()
+            else:
+                self.cache.delete_disk()
+        except OSError as e:
+            log_message(self.log_widget, f"[Warning 警告] Failed to update the disk cache (更新磁盘缓存失败): {e}")
 
     def load_english_file(self):
         path = select_json_file(title="Select latest English default JSON (选择最新英文默认版 JSON 文件)")
         if not path:
             return
         try:
-            data = load_json_file(path)
-            self._validate_top_level_dict(data, "English JSON (英文 JSON)")
-            flat = flatten_dict(data)
+            flat = load_flat_translation(path, self.cache)
         except Exception as e:
             log_message(self.log_widget, f"[Error 错误] Failed to load English JSON (加载英文 JSON 失败): {e}")
             messagebox.showerror("Error (错误)", f"Failed to load English JSON (加载英文 JSON 失败):\n{e}")
@@ -267,9 +661,7 @@ class LocalizationHelperFrame(ttk.Frame):
         if not path:
             return
         try:
-            data = load_json_file(path)
-            self._validate_top_level_dict(data, "Translated JSON (翻译 JSON)")
-            flat = flatten_dict(data)
+            flat = load_flat_translation(path, self.cache)
         except Exception as e:
             log_message(self.log_widget, f"[Error 错误] Failed to load translated JSON (加载翻译 JSON 失败): {e}")
             messagebox.showerror("Error (错误)", f"Failed to load translated JSON (加载翻译 JSON 失败):\n{e}")
@@ -300,28 +692,18 @@ class LocalizationHelperFrame(ttk.Frame):
             )
             return
 
-        eng_keys = set(self.english_data.keys())
-        tr_keys = set(self.translated_data.keys())
-
-        missing = eng_keys - tr_keys
-        extra = tr_keys - eng_keys
-
-        self.missing_keys = {k: self.english_data[k] for k in sorted(missing)}
-        self.extra_keys = {k: self.translated_data[k] for k in sorted(extra)}
-
-        # 检查占位符 (Check tokens)
-        mismatches = {}
-        for key in eng_keys & tr_keys:
-            eng_tokens = extract_tokens(self.english_data.get(key, ""))
-            tr_tokens = extract_tokens(self.translated_data.get(key, ""))
-            if eng_tokens != tr_tokens:
-                mismatches[key] = {
-                    "english": self.english_data.get(key, ""),
-                    "translated": self.translated_data.get(key, ""),
-                    "eng_tokens": sorted(eng_tokens),
-                    "tr_tokens": sorted(tr_tokens),
-                }
-        self.token_mismatches = mismatches
+        # 重新读取改动过的文件；未改动的直接取缓存 (re-read files changed since loading; unchanged ones come from the cache)
+        try:
+            self.english_data = load_flat_translation(self.english_path, self.cache)
+            self.translated_data = load_flat_translation(self.translated_path, self.cache)
+        except Exception as e:
+            log_message(self.log_widget, f"[Error 错误] Failed to reload JSON (重新加载 JSON 失败): {e}")
+            messagebox.showerror("Error (错误)", f"Failed to reload JSON (重新加载 JSON 失败):\n{e}")
+            return
+
+        self.missing_keys, self.extra_keys, self.token_mismatches = compare_translations(
+            self.english_data, self.translated_data
+        )
 
         self.summary_missing.config(
             text=f"Missing keys: {len(self.missing_keys)} (缺少键：{len(self.missing_keys)})"
@@ -360,46 +742,12 @@ class LocalizationHelperFrame(ttk.Frame):
             return
 
         try:
-            export_data = {
-                "missing_keys": [
-                    {"key": k, "english": self.missing_keys[k]}
-                    for k in sorted(self.missing_keys.keys())
-                ],
-                "token_mismatches": [
-                    {
-                        "key": k,
-                        "english": v["english"],
-                        "translated": v["translated"],
-                        "eng_tokens": v["eng_tokens"],
-                        "tr_tokens": v["tr_tokens"],
-                    }
-                    for k, v in sorted(self.token_mismatches.items())
-                ],
-                "extra_keys": [
-                    {"key": k, "translated": self.extra_keys[k]}
-                    for k in sorted(self.extra_keys.keys())
-                ],
-            }
+            export_data = build_report_data(self.missing_keys, self.extra_keys, self.token_mismatches)
 
             if export_path.lower().endswith(".txt"):
                 with open(export_path, "w", encoding="utf-8") as f:
                     f.write("# To Translate / Report (待翻译与问题报告)\n\n")
-
-                    f.write("## Missing keys (缺少键)\n")
-                    for item in export_data["missing_keys"]:
-                        f.write(f"{item['key']}: {item['english']}\n")
-
-                    f.write("\n## Token mismatches (占位符不匹配)\n")
-                    for item in export_data["token_mismatches"]:
-                        f.write(f"{item['key']}:\n")
-                        f.write(f"  EN: {item['english']}\n")
-                        f.write(f"  TR: {item['translated']}\n")
-                        f.write(f"  EN tokens: {', '.join(item['eng_tokens'])}\n")
-                        f.write(f"  TR tokens: {', '.join(item['tr_tokens'])}\n")
-
-                    f.write("\n## Extra / unused keys (多余 / 未使用键)\n")
-                    for item in export_data["extra_keys"]:
-                        f.write(f"{item['key']}: {item['translated']}\n")
+                    write_report_text(f, export_data)
             else:
                 with open(export_path, "w", encoding="utf-8") as f:
                     json.dump(export_data, f, ensure_ascii=False, indent=2)
@@ -410,6 +758,152 @@ class LocalizationHelperFrame(ttk.Frame):
             log_message(self.log_widget, f"[Error 错误] Failed to export to-translate list (导出待翻译列表失败): {e}")
             messagebox.showerror("Error (错误)", f"Failed to export to-translate list (导出待翻译列表失败):\n{e}")
 
+    # ---- Batch comparison -----------------------------------------------------
+
+    def batch_compare(self):
+        """批量比对所选文件夹下的所有 i18n 文件夹 (Compare every i18n folder under a chosen folder)."""
+        root = filedialog.askdirectory(
+            initialdir=self.batch_root or ".",
+            title="Select your Mods folder (选择 Mods 文件夹)"
+        )
+        if not root:
+            return
+        # 在后台线程比对，界面保持响应 (compare on a background thread so the window stays responsive)
+        self.batch_btn.config(state="disabled")
+        log_message(self.log_widget, f"[Info 信息] Comparing all locales under (正在比对所有语言): {root}")
+        counters = (self.cache.hits, self.cache.misses)
+        threading.Thread(target=self._batch_worker, args=(root,), daemon=True).start()
+        self.after(100, self._poll_batch, root, counters)
+
+    def _batch_worker(self, root):
+        """后台线程：运行批量比对，把结果交给 Tk 主线程 (Background thread: run the batch, hand the result to the Tk thread)."""
+        try:
+            self.batch_results.put((batch_compare_i18n(root, cache=self.cache), None))
+        except Exception as e:
+            self.batch_results.put((None, e))
+
+    def _poll_batch(self, root, counters):
+        """在 Tk 主线程中等待批量结果 (Wait for the batch result on the Tk thread)."""
+        try:
+            matrix, error = self.batch_results.get_nowait()
+        except queue.Empty:
+            self.after(100, self._poll_batch, root, counters)
+            return
+        self.batch_btn.config(state="normal")
+        if error is not None:
+            log_message(self.log_widget, f"[Error 错误] Batch comparison failed (批量比对失败): {error}")
+            messagebox.showerror("Error (错误)", f"Batch comparison failed (批量比对失败):\n{error}")
+            return
+        hits, misses = counters
+        self.batch_root = root
+        self.batch_matrix = matrix
+        self._show_matrix()
+        self.save_cache()
+
+        if not matrix:
+            log_message(
+                self.log_widget,
+                f"[Warning 警告] No i18n/default.json found under (未找到 i18n/default.json): {root}"
+            )
+            return
+        locale_count = sum(len(row) for row in matrix.values())
+        log_message(
+            self.log_widget,
+            f"[Info 信息] Batch comparison finished (批量比对完成): {len(matrix)} mod(s) (个模组), "
+            f"{locale_count} locale file(s) (个语言文件); parsed (已解析) {self.cache.misses - misses}, "
+            f"unchanged from cache (未改动，取自缓存) {self.cache.hits - hits}"
+        )
+        for mod, row in matrix.items():
+            for locale, result in row.items():
+                if "error" in result:
+                    log_message(
+                        self.log_widget,
+                        f"[Error 错误] {mod} / {locale}: Failed to load (加载失败): {result['error']}"
+                    )
+        log_message(self.log_widget, format_matrix(matrix))
+
+    def _show_matrix(self):
+        """在表格中显示批量结果 (Show the batch result in the table)."""
+        tree = self.matrix_tree
+        tree.delete(*tree.get_children())
+        locales = matrix_locales(self.batch_matrix)
+        columns = ["mod"] + locales
+        tree["columns"] = columns
+        tree.heading("mod", text="Mod (模组)")
+        tree.column("mod", width=220, stretch=True, anchor="w")
+        for locale in locales:
+            tree.heading(locale, text=locale)
+            tree.column(locale, width=80, stretch=False, anchor="center")
+        for mod, row in self.batch_matrix.items():
+            tree.insert("", "end", values=[mod] + [format_matrix_cell(row.get(locale)) for locale in locales])
+
+    def export_batch_report(self):
+        """导出矩阵报告与每个语言的问题明细 (Export the matrix report with details per locale)."""
+        if not self.batch_matrix:
+            messagebox.showinfo(
+                "Info (提示)",
+                "Run a batch comparison first. (请先进行批量比对。)"
+            )
+            return
+
+        export_path = filedialog.asksaveasfilename(
+            title="Save Matrix Report (保存矩阵报告)",
+            defaultextension=".json",
+            filetypes=[
+                ("JSON files (JSON 文件)", "*.json"),
+                ("Text files (文本文件)", "*.txt"),
+                ("All files (所有文件)", "*.*"),
+            ]
+        )
+        if not export_path:
+            return
+
+        try:
+            if export_path.lower().endswith(".txt"):
+                with open(export_path, "w", encoding="utf-8") as f:
+                    f.write("# i18n Matrix Report (i18n 矩阵报告)\n\n")
+                    f.write(f"Root (根目录): {self.batch_root}\n\n")
+                    f.write(format_matrix(self.batch_matrix) + "\n")
+                    for mod, row in self.batch_matrix.items():
+                        for locale, result in row.items():
+                            f.write(f"\n## {mod} / {locale}\n")
+                            if "error" in result:
+                                f.write(f"Failed to load (加载失败): {result['error']}\n")
+                                continue
+                            write_report_text(f, build_report_data(
+                                result["missing"], result["extra"], result["token_mismatches"]
+                            ), heading="##")
+            else:
+                mods = {}
+                for mod, row in self.batch_matrix.items():
+                    mods[mod] = {}
+                    for locale, result in row.items():
+                        if "error" in result:
+                            mods[mod][locale] = {"path": result["path"], "error": result["error"]}
+                            continue
+                        mods[mod][locale] = dict(
+                            path=result["path"],
+                            counts={
+                                "missing_keys": len(result["missing"]),
+                                "extra_keys": len(result["extra"]),
+                                "token_mismatches": len(result["token_mismatches"]),
+                            },
+                            **build_report_data(result["missing"], result["extra"], result["token_mismatches"])
+                        )
+                export_data = {
+                    "root": self.batch_root,
+                    "locales": matrix_locales(self.batch_matrix),
+                    "mods": mods,
+                }
+                with open(export_path, "w", encoding="utf-8") as f:
+                    json.dump(export_data, f, ensure_ascii=False, indent=2)
+
+            log_message(self.log_widget, f"[Info 信息] Exported matrix report. (矩阵报告已导出): {export_path}")
+            messagebox.showinfo("Success (成功)", "Matrix report exported. (矩阵报告已导出。)")
+        except Exception as e:
+            log_message(self.log_widget, f"[Error 错误] Failed to export matrix report (导出矩阵报告失败): {e}")
+            messagebox.showerror("Error (错误)", f"Failed to export matrix report (导出矩阵报告失败):\n{e}")
+
 
 class MainApplication(tk.Tk):
     """星露谷翻译版对比工具主窗口 (Main window for translated vs English default tool)."""
@@ -417,7 +911,7 @@ class MainApplication(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Translated vs Latest Default English Tool (翻译版对比最新英文默认版工具)")
-        self.geometry("900x600")
+        self.geometry("900x760")
 
         # 主布局 (Main layout)
         main_pane = ttk.PanedWindow(self, orient=tk.VERTICAL)
@@ -441,13 +935,22 @@ class MainApplication(tk.Tk):
         # 工具页 (Tool frame)
         helper = LocalizationHelperFrame(top_frame, log_text)
         helper.pack(fill="both", expand=True, padx=4, pady=4)
+        self.helper = helper
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
 
         log_message(
             log_text,
             "Translated vs latest default English tool started. (翻译版对比最新英文默认版工具已启动。)"
         )
 
+    def on_close(self):
+        """关闭前保存磁盘缓存 (Save the disk cache before closing)."""
+        self.helper.save_cache()
+        self.destroy()
+
 
 if __name__ == "__main__":
+    # 打包为 exe 时进程池需要 (needed for the process pool in frozen exe builds)
+    multiprocessing.freeze_support()
     app = MainApplication()
     app.mainloop()